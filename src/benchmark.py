@@ -0,0 +1,322 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/benchmark.py'
+#   Benchmark harness for the chicken swarm. Runs the problem packages
+#       over a grid of swarm sizes, dimensions, boundary types, and
+#       modes for a fixed set of seeds, and records wall time, steps
+#       per second, objective calls per second, peak memory, and
+#       iterations to E_TOL. Results are written as JSON and CSV.
+#       Runs are capped in steps and wall time. A run that hits a cap
+#       is recorded with the stop reason 'stalled'.
+#       A stored baseline can be compared against to flag regressions.
+#
+#       Usage (from ./src):
+#       python benchmark.py --problems himmelblau lundquist_3_var --seeds 0 1 2 --out bench
+#       python benchmark.py --baseline bench.json --out bench_new
+#       python benchmark.py --problems scalable_n_dim:rastrigin scalable_n_dim:ackley --dimensions 50 200 1000
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import sys
+import csv
+import json
+import time
+import argparse
+import platform
+import importlib
+import tracemalloc
+import numpy as np
+from chicken_swarm import swarm
+from swarm_config import swarm_config
+from multi_start import quiet_parent
+
+
+# RN, HN, MN, CN
+SWARM_SIZES = {'small': (4, 10, 6, 10),
+               'default': (10, 20, 15, 20),
+               'large': (20, 60, 40, 80)}
+
+# metric: True if higher is better
+METRICS = {'wall_time': False,
+           'steps_per_sec': True,
+           'evals_per_sec': True,
+           'peak_memory_kb': False}
+
+CONFIG_KEYS = ('problem', 'swarm_size', 'dimensions', 'boundary', 'mode', 'batch')
+
+
+class counting_objective:
+    # wraps an objective function and counts the positions it is called with
+    def __init__(self, obj_func):
+        self.obj_func = obj_func
+        self.batch_capable = bool(getattr(obj_func, 'batch_capable', False))
+        self.calls = 0
+
+    def __call__(self, X, NO_OF_OUTS=1):
+        if self.batch_capable:
+            self.calls = self.calls + int(np.shape(np.atleast_2d(X))[0])
+        else:
+            self.calls = self.calls + 1
+        return self.obj_func(X, NO_OF_OUTS)
+
+
+def load_problem(name, dimensions=None):
+    # returns a dict of problem settings from <name>.configs_F.
+    # Problems with a fixed number of inputs return None if dimensions doesn't match.
+    # Scalable problems provide scaled_configs(dimensions, function), which returns the
+    # same dict. For these, name can be '<package>:<function>' (e.g. 'scalable_n_dim:ackley')
+    package, _, function = name.partition(':')
+    configs = importlib.import_module(package + '.configs_F')
+    if hasattr(configs, 'scaled_configs'):
+        dimensions = configs.IN_VARS if dimensions is None else int(dimensions)
+        if function == '':
+            return configs.scaled_configs(dimensions)
+        return configs.scaled_configs(dimensions, function)
+    if (dimensions is not None) and (int(dimensions) != configs.IN_VARS):
+        return None
+    return {'LB': configs.LB,
+            'UB': configs.UB,
+            'IN_VARS': configs.IN_VARS,
+            'OUT_VARS': configs.OUT_VARS,
+            'TARGETS': configs.TARGETS,
+            'OBJECTIVE_FUNC': configs.OBJECTIVE_FUNC,
+            'OBJECTIVE_FUNC_BATCH': configs.OBJECTIVE_FUNC_BATCH,
+            'CONSTR_FUNC': configs.CONSTR_FUNC,
+            'CONSTR_FUNC_BATCH': configs.CONSTR_FUNC_BATCH}
+
+
+def run_swarm(problem, sizes, boundary, mode, batch, seed, E_TOL, maxit, G,
+              max_steps=None, max_time=None):
+    # runs one swarm to completion, or until max_steps steps or max_time seconds.
+    # Returns the measurements of the run. max_steps defaults to 10*maxit
+    if max_steps is None:
+        max_steps = 10*maxit
+    RN, HN, MN, CN = sizes
+    opt_config = swarm_config(BOUNDARY=boundary, RN=RN, HN=HN, MN=MN, CN=CN, G=G)
+    if batch:
+        obj_func = counting_objective(problem['OBJECTIVE_FUNC_BATCH'])
+        constr_func = problem['CONSTR_FUNC_BATCH']
+    else:
+        obj_func = counting_objective(problem['OBJECTIVE_FUNC'])
+        constr_func = problem['CONSTR_FUNC']
+
+    mySwarm = swarm(problem['LB'], problem['UB'], problem['TARGETS'], E_TOL, maxit,
+                    obj_func, constr_func, opt_config, parent=quiet_parent(), seed=seed)
+    steps = 0
+    iterations_to_tol = None
+    start = time.perf_counter()
+    stalled = False
+    while not mySwarm.complete():
+        if (steps >= max_steps) or \
+           ((max_time is not None) and (time.perf_counter() - start >= max_time)):
+            # e.g. every chicken went inactive with the invisible boundary
+            stalled = True
+            break
+        if mode == 'generation':
+            mySwarm.step_generation(True)
+            mySwarm.evaluate_generation(True)
+        else:
+            mySwarm.step(True)
+            mySwarm.call_objective(True)
+        steps = steps + 1
+    wall_time = time.perf_counter() - start
+
+    iteration, best_eval = mySwarm.get_convergence_data()
+    if mySwarm.converged():
+        iterations_to_tol = iteration
+    stop_reason = 'stalled' if stalled else mySwarm.get_stop_reason()
+    mySwarm.close()
+    return {'wall_time': wall_time,
+            'steps': steps,
+            'steps_per_sec': steps/wall_time if wall_time > 0 else 0.0,
+            'objective_calls': obj_func.calls,
+            'evals_per_sec': obj_func.calls/wall_time if wall_time > 0 else 0.0,
+            'iterations': iteration,
+            'iterations_to_tol': iterations_to_tol,
+            'best_eval': float(best_eval),
+            'stop_reason': stop_reason}
+
+
+def peak_memory(problem, sizes, boundary, mode, batch, seed, E_TOL, maxit, G,
+                max_steps=None, max_time=None):
+    # repeats a run under tracemalloc. Kept apart from the timed run,
+    # since tracing slows down every allocation
+    tracemalloc.start()
+    try:
+        run_swarm(problem, sizes, boundary, mode, batch, seed, E_TOL, maxit, G,
+                  max_steps, max_time)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak/1024
+
+
+def run_benchmarks(problems, swarm_sizes, dimensions, boundaries, modes, batch_options,
+                   seeds, E_TOL, maxit, G, measure_memory=True, repeats=1, verbose=True,
+                   max_steps=None, max_time=60.0):
+    # runs every combination of the grid. Returns a list of records.
+    # max_steps and max_time cap each run (see run_swarm())
+    # Each timed run is repeated, and the fastest repeat is kept to cut down on noise
+    records = []
+    for name in problems:
+        for dims in dimensions:
+            problem = load_problem(name, dims)
+            if problem is None:
+                continue
+            for size_name in swarm_sizes:
+                sizes = SWARM_SIZES[size_name] if size_name in SWARM_SIZES \
+                    else tuple(int(v) for v in size_name.split(','))
+                for boundary in boundaries:
+                    for mode in modes:
+                        for batch in batch_options:
+                            for seed in seeds:
+                                record = {'problem': name,
+                                          'swarm_size': size_name,
+                                          'dimensions': int(problem['IN_VARS']),
+                                          'boundary': int(boundary),
+                                          'mode': mode,
+                                          'batch': bool(batch),
+                                          'seed': int(seed)}
+                                runs = [run_swarm(problem, sizes, boundary, mode, batch,
+                                                  seed, E_TOL, maxit, G, max_steps, max_time)
+                                        for r in range(0, max(1, repeats))]
+                                record.update(min(runs, key=lambda run: run['wall_time']))
+                                record['peak_memory_kb'] = None
+                                if measure_memory:
+                                    record['peak_memory_kb'] = peak_memory(problem, sizes, boundary, mode,
+                                                                           batch, seed, E_TOL, maxit, G,
+                                                                           max_steps, max_time)
+                                records.append(record)
+                                if verbose:
+                                    print(name, size_name, record['dimensions'], boundary, mode,
+                                          'batch' if batch else 'single', seed,
+                                          '%.3fs' % record['wall_time'],
+                                          '%.0f evals/s' % record['evals_per_sec'],
+                                          record['stop_reason'])
+    return records
+
+
+def config_key(record):
+    return tuple(record[k] for k in CONFIG_KEYS)
+
+
+def summarize(records):
+    # median of each metric over the seeds of each configuration
+    grouped = {}
+    for record in records:
+        grouped.setdefault(config_key(record), []).append(record)
+    summary = {}
+    for key, group in grouped.items():
+        summary[key] = {}
+        for metric in METRICS:
+            values = [r[metric] for r in group if r.get(metric) is not None]
+            summary[key][metric] = float(np.median(values)) if len(values) > 0 else None
+    return summary
+
+
+def compare(records, baseline_records, tolerance=0.10):
+    # flags every configuration and metric that is more than tolerance
+    # (fractional) worse than the baseline. Returns a list of regressions
+    current = summarize(records)
+    baseline = summarize(baseline_records)
+    regressions = []
+    for key, metrics in current.items():
+        if key not in baseline:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            new = metrics[metric]
+            old = baseline[key][metric]
+            if (new is None) or (old is None) or (old == 0):
+                continue
+            change = (new - old)/abs(old)
+            if (higher_is_better and change < -tolerance) or \
+               ((not higher_is_better) and change > tolerance):
+                regression = dict(zip(CONFIG_KEYS, key))
+                regression.update({'metric': metric, 'baseline': old, 'current': new, 'change': change})
+                regressions.append(regression)
+    return regressions
+
+
+def write_json(path, records, settings):
+    data = {'settings': settings,
+            'environment': {'python': platform.python_version(),
+                            'numpy': np.__version__,
+                            'platform': platform.platform(),
+                            'processor': platform.processor()},
+            'records': records}
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def write_csv(path, records):
+    if len(records) < 1:
+        return
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(records[0].keys()))
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def read_records(path):
+    with open(path, 'r') as f:
+        return json.load(f)['records']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Chicken swarm benchmark suite')
+    parser.add_argument('--problems', nargs='+', default=['himmelblau', 'lundquist_3_var', 'one_dim_x_test'])
+    parser.add_argument('--swarm-sizes', nargs='+', default=['small', 'default'],
+                        help="names from SWARM_SIZES, or 'RN,HN,MN,CN'")
+    parser.add_argument('--dimensions', nargs='+', type=int, default=None,
+                        help='input dimensions for scalable problems. Fixed problems use their own')
+    # 4 (invisible) is left out by default. The scalar loop never completes once
+    # every chicken is inactive, so those runs only end at the caps
+    parser.add_argument('--boundaries', nargs='+', type=int, default=[1, 2, 3])
+    parser.add_argument('--modes', nargs='+', default=['step', 'generation'], choices=['step', 'generation'])
+    parser.add_argument('--batch', nargs='+', default=['single', 'batch'], choices=['single', 'batch'])
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0, 1, 2])
+    parser.add_argument('--tol', type=float, default=10**-6)
+    parser.add_argument('--maxit', type=int, default=5000)
+    parser.add_argument('--G', type=int, default=70)
+    parser.add_argument('--max-steps', type=int, default=None,
+                        help="step cap per run (default 10*maxit). Capped runs are recorded as 'stalled'")
+    parser.add_argument('--max-time', type=float, default=60.0,
+                        help="wall time cap per run in seconds. Capped runs are recorded as 'stalled'")
+    parser.add_argument('--repeats', type=int, default=1, help='timed runs per seed. The fastest is kept')
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc peak memory runs')
+    parser.add_argument('--out', default='benchmark_results', help='output path, without extension')
+    parser.add_argument('--baseline', default=None, help='JSON results to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='fractional change that counts as a regression')
+    args = parser.parse_args(argv)
+
+    settings = vars(args)
+    dimensions = [None] if args.dimensions is None else args.dimensions
+    records = run_benchmarks(args.problems, args.swarm_sizes, dimensions, args.boundaries,
+                             args.modes, [b == 'batch' for b in args.batch], args.seeds,
+                             args.tol, args.maxit, args.G, measure_memory=not args.no_memory,
+                             repeats=args.repeats, max_steps=args.max_steps, max_time=args.max_time)
+    write_json(args.out + '.json', records, settings)
+    write_csv(args.out + '.csv', records)
+    print("Results written to " + args.out + ".json and " + args.out + ".csv")
+
+    if args.baseline is not None:
+        regressions = compare(records, read_records(args.baseline), args.tolerance)
+        if len(regressions) == 0:
+            print("No regressions against " + args.baseline)
+            return 0
+        print("REGRESSIONS against " + args.baseline + ":")
+        for r in regressions:
+            print("  " + ", ".join(str(r[k]) for k in CONFIG_KEYS) + ": " + r['metric'] + \
+                  " %.4g -> %.4g (%+.1f%%)" % (r['baseline'], r['current'], 100*r['change']))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/boundary_handler.py'
+#   Boundary handling for a set of positions in one array pass.
+#       The chicken swarm has no velocity, so the reflecting and
+#       absorbing rules act on the position only:
+#       1 = random:     out of bounds positions are resampled uniformly
+#       2 = reflecting: out of bounds coordinates are mirrored back
+#                       across the bound they crossed
+#       3 = absorbing:  out of bounds coordinates stop at the bound
+#       4 = invisible:  out of bounds positions are marked inactive
+#       Positions that are in bounds but fail the constraints are
+#       resampled with the random rule (or marked inactive for
+#       invisible bounds).
+#       Resampling can be capped with a budget of passes. Rows that
+#       are still infeasible when it runs out use a fallback rule.
+#       With row_draws, each particle's resampling draws come from its
+#       own keyed source, so they don't depend on which other rows were
+#       handled in the same pass.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+
+
+class boundary_handler:
+    # arguments should take the form:
+    # boundary_handler(int, [float, ...], [float, ...], func, numpy Generator, int,
+    #                  int, str, func)
+    #
+    # boundary: int. 1 = random, 2 = reflecting, 3 = absorbing, 4 = invisible
+    # lbound, ubound: 1-D arrays of the lower and upper bounds
+    # constr_func: constraint function. Returns True if a position is valid.
+    #   A batch-capable constraint function (batch_capable attribute set) takes
+    #   an (N x D) array and returns a length-N boolean mask.
+    # rng: numpy Generator used for resampling
+    # decimal_limit: number of decimals positions are rounded to
+    # resample_budget: max number of random resampling passes. None = no limit
+    # resample_fallback: what to do with rows still infeasible when the budget runs out
+    #   'last_feasible' = return to the last position passed in (falls back to 'clip' if none)
+    #   'clip' = clip to the bounds. The constraints may still be violated
+    # row_draws (optional): function of (particle index, number of values) that returns
+    #   the uniform draws for one resampling pass of that particle. Used when the
+    #   particle indices of the rows are passed in. Otherwise rng is used
+
+    def __init__(self, boundary, lbound, ubound, constr_func, rng, decimal_limit=4,
+                 resample_budget=None, resample_fallback='last_feasible', row_draws=None):
+        self.boundary = int(boundary)
+        self.lbound = np.array(lbound, dtype=float).reshape(-1)
+        self.ubound = np.array(ubound, dtype=float).reshape(-1)
+        self.variation = self.ubound - self.lbound
+        self.constr_func = constr_func
+        self.batch_constraint = bool(getattr(constr_func, 'batch_capable', False))
+        self.rng = rng
+        self.row_draws = row_draws
+        self.number_decimals = int(decimal_limit)
+
+        self.resample_budget = None if resample_budget is None else max(0, int(resample_budget))
+        if resample_fallback not in ('last_feasible', 'clip'):
+            raise ValueError("resample_fallback must be 'last_feasible' or 'clip'")
+        self.resample_fallback = resample_fallback
+
+        self.reset_stats()
+
+
+    def reset_stats(self):
+        '''
+        self.constraint_calls       : calls to constr_func (one per batch for batch constraints)
+        self.constraint_checks      : positions checked against the constraints
+        self.constraint_rejections  : positions that failed the constraints
+        self.resample_passes        : passes of the random resampling loop
+        self.resampled              : positions redrawn by the random resampling loop
+        self.budget_exhausted       : positions handled by the fallback rule
+        '''
+        self.constraint_calls = 0
+        self.constraint_checks = 0
+        self.constraint_rejections = 0
+        self.resample_passes = 0
+        self.resampled = 0
+        self.budget_exhausted = 0
+
+
+    def get_stats(self):
+        rejection_rate = 0.0
+        if self.constraint_checks > 0:
+            rejection_rate = self.constraint_rejections/self.constraint_checks
+        return {'constraint_calls': self.constraint_calls,
+                'constraint_checks': self.constraint_checks,
+                'constraint_rejections': self.constraint_rejections,
+                'rejection_rate': rejection_rate,
+                'resample_passes': self.resample_passes,
+                'resampled': self.resampled,
+                'budget_exhausted': self.budget_exhausted}
+
+
+    def check_bounds(self, X):
+        # length-N mask of rows with any coordinate out of bounds
+        return np.any((X < self.lbound) | (X > self.ubound), axis=1)
+
+
+    def row_in_bounds(self, x):
+        # single position version of check_bounds(). True if x is in bounds
+        return bool((x >= self.lbound).all() and (x <= self.ubound).all())
+
+
+    def row_constraint(self, x):
+        # single position version of check_constraints(). Every call is counted
+        if self.batch_constraint:
+            passed = bool(np.ravel(self.constr_func(x.reshape(1, -1)))[0])
+        else:
+            passed = bool(self.constr_func(x))
+        self.constraint_calls = self.constraint_calls + 1
+        self.constraint_checks = self.constraint_checks + 1
+        if not passed:
+            self.constraint_rejections = self.constraint_rejections + 1
+        return passed
+
+
+    def uniform_rows(self, number_of_rows, dims, particles=None):
+        # (number_of_rows x dims) uniform draws for resampling. particles (optional)
+        # are the particle indices of the rows. With row_draws set, each row gets
+        # its particle's draws
+        if (particles is None) or (self.row_draws is None):
+            return self.rng.random((number_of_rows, dims))
+        U = np.zeros((number_of_rows, dims))
+        for i in range(0, number_of_rows):
+            U[i] = self.row_draws(particles[i], dims)
+        return U
+
+
+    def apply_row(self, x, x_last=None, particle=None):
+        # single position version of apply() for the scalar step. x is a 1-D
+        # position, changed in place. The rules, random draws, and stats are the
+        # same as apply() on a one row array, without building the array for the
+        # usual case of a feasible row. Returns True if the row is now inactive.
+        # particle (optional) is the index used for row_draws
+        in_bounds = self.row_in_bounds(x)
+        if in_bounds and self.row_constraint(x):
+            return False
+        if self.boundary == 4:
+            return True
+        if (self.boundary == 1) or in_bounds:
+            # in-bounds rows that fail the constraints use the random rule for every boundary
+            self.random_row(x, x_last, particle)
+        else:
+            # out of bounds reflecting or absorbing. Rare enough to use the array rules
+            X = x.reshape(1, -1)
+            X_last = None if x_last is None else np.reshape(x_last, (1, -1))
+            particles = None if particle is None else [particle]
+            if self.boundary == 2:
+                self.reflecting_bound(X, X_last=X_last, particles=particles)
+            else:
+                self.absorbing_bound(X, X_last=X_last, particles=particles)
+        return False
+
+
+    def random_row(self, x, x_last=None, particle=None):
+        # single position version of random_bound() for a row that is known to be
+        # infeasible. Draws the same numbers as random_bound() on a one row array
+        passes = 0
+        while True:
+            if (self.resample_budget is not None) and (passes >= self.resample_budget):
+                self.budget_exhausted = self.budget_exhausted + 1
+                if (self.resample_fallback == 'last_feasible') and (x_last is not None):
+                    x[:] = np.ravel(x_last)
+                else:
+                    np.clip(x, self.lbound, self.ubound, out=x)
+                return
+            if (particle is None) or (self.row_draws is None):
+                draws = self.rng.random(len(x))
+            else:
+                draws = self.row_draws(particle, len(x))
+            x[:] = np.round(draws*self.variation + self.lbound, self.number_decimals)
+            passes = passes + 1
+            self.resample_passes = self.resample_passes + 1
+            self.resampled = self.resampled + 1
+            if self.row_in_bounds(x) and self.row_constraint(x):
+                return
+
+
+    def check_constraints(self, X):
+        # length-N mask of rows that pass the constraint function
+        num_rows = np.shape(X)[0]
+        if num_rows < 1:
+            return np.ones((0), dtype=bool)
+        if self.batch_constraint:
+            passed = np.array(self.constr_func(X), dtype=bool).reshape(num_rows)
+            self.constraint_calls = self.constraint_calls + 1
+        else:
+            passed = np.ones((num_rows), dtype=bool)
+            for i in range(0, num_rows):
+                passed[i] = bool(self.constr_func(X[i]))
+            self.constraint_calls = self.constraint_calls + num_rows
+        self.constraint_checks = self.constraint_checks + num_rows
+        self.constraint_rejections = self.constraint_rejections + int(num_rows - np.count_nonzero(passed))
+        return passed
+
+
+    def apply(self, X, X_last=None, particles=None):
+        # applies the configured boundary rule to X in place.
+        # X_last (optional) holds the positions before the move, for the 'last_feasible' fallback.
+        # particles (optional) are the particle indices of the rows, for row_draws.
+        # Returns a length-N mask of rows that are now inactive (invisible bounds only)
+        inactive = np.zeros((np.shape(X)[0]), dtype=bool)
+        if self.boundary == 1:
+            self.random_bound(X, X_last=X_last, particles=particles)
+        elif self.boundary == 2:
+            self.reflecting_bound(X, X_last=X_last, particles=particles)
+        elif self.boundary == 3:
+            self.absorbing_bound(X, X_last=X_last, particles=particles)
+        elif self.boundary == 4:
+            inactive = self.invisible_bound(X)
+        return inactive
+
+
+    def random_bound(self, X, redo=None, X_last=None, particles=None):
+        # resample every row that is out of bounds or fails the constraints.
+        # Each coordinate gets its own random draw. Only the rows that still
+        # fail are redrawn on the next pass.
+        if redo is None:
+            redo = self.check_bounds(X)
+            redo[~redo] = ~self.check_constraints(X[~redo])
+        redo = np.array(redo, dtype=bool)
+
+        passes = 0
+        while np.any(redo):
+            if (self.resample_budget is not None) and (passes >= self.resample_budget):
+                self.fallback(X, redo, X_last)
+                break
+            idx = np.flatnonzero(redo)
+            rows = None if particles is None else np.asarray(particles)[idx]
+            X[idx] = np.round(self.uniform_rows(len(idx), np.shape(X)[1], rows)*self.variation + self.lbound,
+                              self.number_decimals)
+            still_bad = self.check_bounds(X[idx])
+            still_bad[~still_bad] = ~self.check_constraints(X[idx[~still_bad]])
+            redo[idx] = still_bad
+            passes = passes + 1
+            self.resample_passes = self.resample_passes + 1
+            self.resampled = self.resampled + len(idx)
+
+
+    def fallback(self, X, redo, X_last=None):
+        # the resampling budget ran out for the rows in redo
+        self.budget_exhausted = self.budget_exhausted + int(np.count_nonzero(redo))
+        if (self.resample_fallback == 'last_feasible') and (X_last is not None):
+            X[redo] = np.reshape(X_last, np.shape(X))[redo]
+        else:
+            X[redo] = np.clip(X[redo], self.lbound, self.ubound)
+
+
+    def reflecting_bound(self, X, X_last=None, particles=None):
+        # mirror out of bounds coordinates back into [lbound, ubound].
+        # Folding with a period of 2*(ubound-lbound) handles overshoots
+        # larger than the width of the bounds.
+        out = (X < self.lbound) | (X > self.ubound)
+        if np.any(out):
+            width = np.broadcast_to(self.variation, np.shape(X))
+            lb = np.broadcast_to(self.lbound, np.shape(X))
+            with np.errstate(all='ignore'):
+                folded = np.mod(X - lb, 2*width)
+                folded = np.where(folded > width, 2*width - folded, folded)
+            # zero-width dimensions can only take the bound value
+            folded = np.where(width > 0, folded, 0)
+            X[out] = np.round(lb[out] + folded[out], self.number_decimals)
+            np.clip(X, self.lbound, self.ubound, out=X)
+        self.resample_constraint_failures(X, X_last, particles)
+
+
+    def absorbing_bound(self, X, X_last=None, particles=None):
+        # out of bounds coordinates stop at the bound they crossed
+        np.clip(X, self.lbound, self.ubound, out=X)
+        self.resample_constraint_failures(X, X_last, particles)
+
+
+    def invisible_bound(self, X):
+        # out of bounds or constraint failing rows are no longer evaluated.
+        # X is not changed
+        inactive = self.check_bounds(X)
+        inactive[~inactive] = ~self.check_constraints(X[~inactive])
+        return inactive
+
+
+    def resample_constraint_failures(self, X, X_last=None, particles=None):
+        # in-bounds rows that fail the constraints use the random rule
+        redo = ~self.check_constraints(X)
+        if np.any(redo):
+            self.random_bound(X, redo, X_last, particles)
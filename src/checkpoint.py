@@ -0,0 +1,75 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/checkpoint.py'
+#   Binary checkpoint format for saving and resuming optimizer state.
+#       A checkpoint is an uncompressed .npz container. The 'header'
+#       entry is a JSON string with the format name, the version,
+#       the scalar state, and the random bit generator state. Every
+#       other entry is a state array. Nothing is pickled.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import os
+import json
+import numpy as np
+
+
+CHECKPOINT_FORMAT = 'chicken_swarm_checkpoint'
+CHECKPOINT_VERSION = 4   # 2: one random stream per role. 3: stop reason and early stopping state.
+                         # 4: move draws keyed by pass and particle
+
+
+def to_json_compatible(value):
+    # bit generator states are nested dicts that can hold numpy arrays and ints
+    if isinstance(value, dict):
+        return {k: to_json_compatible(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json_compatible(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    return value
+
+
+def write_checkpoint(path, header, arrays):
+    # header: dict of JSON-compatible values. The format name and version are added here.
+    # arrays: dict of name to numpy array.
+    # The file is written next to path and then renamed, so an interrupted write
+    # doesn't replace the last good checkpoint
+    header = dict(to_json_compatible(header))
+    header['format'] = CHECKPOINT_FORMAT
+    header['version'] = CHECKPOINT_VERSION
+    if 'header' in arrays:
+        raise ValueError("'header' is reserved for the checkpoint header")
+
+    tmp_path = str(path) + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, header=np.array(json.dumps(header)), **arrays)
+    os.replace(tmp_path, path)
+
+
+def read_checkpoint(path):
+    # returns (header, arrays). Raises ValueError if the file isn't a checkpoint,
+    # or was written by a newer version of the format
+    with np.load(path, allow_pickle=False) as data:
+        if 'header' not in data.files:
+            raise ValueError(str(path) + " is not a chicken swarm checkpoint")
+        header = json.loads(str(data['header']))
+        arrays = {name: data[name] for name in data.files if name != 'header'}
+
+    if header.get('format') != CHECKPOINT_FORMAT:
+        raise ValueError(str(path) + " is not a chicken swarm checkpoint")
+    if int(header.get('version', 0)) > CHECKPOINT_VERSION:
+        raise ValueError("checkpoint version " + str(header.get('version')) + \
+                         " is newer than the supported version " + str(CHECKPOINT_VERSION))
+    return header, arrays
@@ -11,21 +11,43 @@
 
 
 import numpy as np
-from numpy.random import Generator, MT19937
 import sys
+from population import population
+from boundary_handler import boundary_handler
+from events import event_stream, DEBUG, INFO
+from swarm_config import read_options
+from random_streams import random_streams, random_block
+from diversity import diversity_tracker, mean_absolute_deviation, group_centroid_distances, pareto_spread
 np.seterr(all='raise')
 
 
+def batch_objective(func):
+    # marks an objective function as batch-capable.
+    # A batch objective takes an (N x IN_VARS) array of positions and the output size,
+    # and returns an (N x OUT_VARS) array with a length-N boolean noErrors mask.
+    func.batch_capable = True
+    return func
+
+
+def batch_constraint(func):
+    # marks a constraint function as batch-capable.
+    # A batch constraint takes an (N x IN_VARS) array of positions,
+    # and returns a length-N boolean mask that is True where the constraints are met.
+    func.batch_capable = True
+    return func
+
+
 class swarm:
     # arguments should take the form: 
     # swarm([[float, float, ...]], [[float, float, ...]], [[float, ...]], float, int,
     # func, func,
-    # dataFrame,
+    # swarm_config,
     # class obj, 
     # bool, [int, int, ...], 
     # int)
     #  
-    # opt_df contains class-specific tuning parameters
+    # opt_df contains class-specific tuning parameters. Either a swarm_config, a dict,
+    #  or a one-row pandas DataFrame (see swarm_config.py)
     # boundary: int. 1 = random, 2 = reflecting, 3 = absorbing,   4 = invisible
     # RN: int
     # HN: int
@@ -33,17 +55,62 @@ class swarm:
     # CN: int
     # G: int
     #
+    # evaluator (optional) is a concurrent.futures executor or a worker count
+    #  used by evaluate_generation(). max_in_flight bounds the number of
+    #  submitted, unfinished objective calls. max_workers is the worker count of an
+    #  executor that is passed in (see parallel_evaluation.py).
+    # resample_budget (optional) caps the random resampling passes used to bring
+    #  a position back in bounds and within constraints. resample_fallback sets what
+    #  happens when it runs out: 'last_feasible' (return to the position before the move)
+    #  or 'clip' (clip to the bounds).
+    # eval_cache (optional) memoizes objective function calls on the rounded position.
+    #  Either an evaluation_cache object, True for an unbounded cache, or an int max size.
+    # checkpoint_path, checkpoint_every (optional) write a checkpoint to checkpoint_path
+    #  every checkpoint_every iterations. See save_checkpoint().
+    # seed (optional) seeds the random streams. An int or a numpy SeedSequence.
+    #  bit_generator selects the numpy bit generator: 'MT19937', 'PCG64', 'PCG64DXSM',
+    #  'Philox', or 'SFC64'. See random_streams.py.
+    # instrument (optional) turns on the phase timers and counters. See get_stats().
+    #  stats_callback(stats) is called with get_stats() every stats_interval iterations.
+    # event_sinks (optional) is a list of sinks, or (sink, level) pairs, subscribed to self.events.
+    #  See events.py.
+    # history (optional) records the convergence history once per generation (scalar mode:
+    #  once per pass over the swarm). Either a history_recorder object, True for an in-memory
+    #  ring buffer, an int ring buffer size, or a directory path to stream records to.
+    # stopping (optional) adds early stopping criteria to converged() and maxed(). Either a
+    #  stopping_criteria object or a dict of its arguments. See stopping.py and get_stop_reason().
+    # multi_objective (optional) ranks the chickens by Pareto front and crowding distance when
+    #  the swarm reorganizes, instead of by the norm of their fitness. Turns on the archive.
+    # pareto_archive (optional) keeps the non-dominated positions found during the run. Either a
+    #  pareto_archive object, True for the default size, or an int max size. See get_pareto_front().
 
     def __init__(self,  lbound, ubound, targets,E_TOL, maxit,
                  obj_func, constr_func, 
                  opt_df,
                  parent=None, 
                  evaluate_threshold=False, obj_threshold=None,
-                 decimal_limit = 4): 
+                 decimal_limit = 4,
+                 evaluator=None, max_in_flight=None, max_workers=None,
+                 resample_budget=None, resample_fallback='last_feasible',
+                 eval_cache=None,
+                 checkpoint_path=None, checkpoint_every=None,
+                 seed=None, bit_generator='MT19937',
+                 instrument=False, stats_callback=None, stats_interval=None,
+                 event_sinks=None, history=None, stopping=None,
+                 multi_objective=False, pareto_archive=None): 
 
         # Optional parent class func call to write out values that trigger constraint issues
         self.parent = parent 
 
+        # structured event stream. Payloads are only built if a sink is subscribed
+        self.events = event_stream()
+        if event_sinks is not None:
+            for sink in event_sinks:
+                if isinstance(sink, tuple):
+                    self.events.subscribe(sink[0], sink[1])
+                else:
+                    self.events.subscribe(sink)
+
 
         self.number_decimals = int(decimal_limit)  # limit the number of decimals
                                               # used in cases where real life has limitations on resolution
@@ -69,12 +136,13 @@ class swarm:
 
 
         #unpack the opt_df standardized vals
-        boundary = int(opt_df['BOUNDARY'][0])
-        RN = int(opt_df['RN'][0])
-        HN = int(opt_df['HN'][0])
-        MN = int(opt_df['MN'][0])
-        CN = int(opt_df['CN'][0])
-        G = int(opt_df['G'][0])
+        options = read_options(opt_df)
+        boundary = options.BOUNDARY
+        RN = options.RN
+        HN = options.HN
+        MN = options.MN
+        CN = options.CN
+        G = options.G
         NO_OF_PARTICLES = RN + HN + MN + CN
 
 
@@ -86,7 +154,11 @@ class swarm:
         lbound = np.array(lbound[0])
         ubound = np.array(ubound[0])
 
-        self.rng = Generator(MT19937())
+        # separate streams for initialization, bounds, and the hierarchy. The move
+        # draws are keyed by pass and particle (see random_block).
+        # self.rng is the initialization stream
+        self.streams = random_streams(seed, bit_generator)
+        self.rng = self.streams.get('init')
 
         if ((heightl > 1) and (widthl > 1)) \
            or ((heightu > 1) and (widthu > 1)) \
@@ -163,81 +235,30 @@ class swarm:
             # first chicken is a rooster, in case there's only 1 searching agent
             # chicken_info = array of [CLASSIFICATION(0-4), GROUP(0-(RN-1)), MOTHER-HEN-ID]
             # classificition: 0 = rooster, 1 = hen, 2 = mother hen, 3 = chicks
-            self.chicken_info = np.array([0, 0, -1])
-
-            #randomly initialize the positions 
-            # self.M = np.vstack(np.multiply(self.rng.random((np.max([heightl, 
-            #                                                          widthl]),1)), 
-            #                                                          variation) + 
-            #                                                          lbound)    
-
-            self.M = np.round(np.array(np.multiply(self.rng.random((1,np.max([heightl, widthl]))), variation)+lbound), self.number_decimals)
-            
-           
-
+            # population state (positions, bests, activity, hierarchy) is held
+            # in a preallocated struct-of-arrays container
+            self.output_size = len(targets)
+            self.number_of_particles = NO_OF_PARTICLES
+            self.pop = population(NO_OF_PARTICLES, np.max([heightl, widthl]), self.output_size)
+            self.assign_hierarchy()
 
-            if NO_OF_PARTICLES > 1:
-                # make temp classification list
-                classList = np.zeros(NO_OF_PARTICLES)
-                # rooster
-                classList[0:RN] = 0
-                # hen
-                start = RN
-                end = RN + HN
-                classList[start:end] = 1
-                # mother hen
-                start = RN + HN
-                end = RN + HN + MN
-                classList[start:end] = 2
-                # chicks
-                start = RN + HN + MN
-                classList[start:] = 3
-                # array of groups to use in random allocation
-                group_nums = np.arange(RN)
-
-            for i in range(2,int(NO_OF_PARTICLES)+1):
-                # set initial location
-                self.M = \
-                    np.round(np.vstack([self.M, 
-                               np.multiply( self.rng.random((1,np.max([heightl, widthl]))), 
-                                                                               variation) 
-                                                                               + lbound]), self.number_decimals)
-                if classList[i-1] == 0: #rooster
-                    # assign to the next group (i-1), and done.
-                    self.chicken_info = \
-                        np.vstack([self.chicken_info, 
-                                [classList[i-1], i-1, -1]])
-
-                elif (classList[i-1] == 1) or (classList[i-1] == 2): #hen, mother hen
-                    # assign to a random group.
-                    hen_group = self.rng.choice(group_nums)
-                    self.chicken_info = \
-                        np.vstack([self.chicken_info, 
-                                [classList[i-1], hen_group, -1]])
-
-                elif classList[i-1] == 3: #chick
-                    # select a random hen to be the 'mother' and assign to group
-                    groupAssigned = False
-
-                    while (groupAssigned == False):
-                        chicken_idx = self.rng.integers(0, i-1)# index after a chick will always be the chick
-                        if self.chicken_info[chicken_idx][0] == 2: #is mother hen
-                            # get the group the random mother hen is from
-                            mother_group = self.chicken_info[chicken_idx][1]         
-                            # assign chick to group, and to that mother hen                    
-                            self.chicken_info = \
-                                np.vstack([self.chicken_info, 
-                                        [classList[i-1], mother_group, chicken_idx]])
-                            groupAssigned = True
+            #randomly initialize the positions, all at once
+            self.pop.M[:] = np.round(np.multiply(self.rng.random((NO_OF_PARTICLES, np.max([heightl, widthl]))), variation) + lbound,
+                                     self.number_decimals)
+            # running position sums for the diversity metrics
+            self.diversity = diversity_tracker(self.pop.M)
+            # random numbers for the move operators, drawn in bulk once per pass
+            self.blocks = random_block(self.streams, self.number_of_particles, self.RN, np.shape(self.M)[1])
 
 
             '''
+            self.pop                    : population container that holds M, Pb, F_Pb, Active, Gb, F_Gb, and the hierarchy.
             self.M                      : An array of current particle (cat) locations.
             self.RN                     : Number of roosters. Integer.
             self.HN                     : Total number of hens. Integer. 
             self.MN                     : Number of mother hens. Integer.
             self.CN                     : Number of chicks. Integer.  
-            self.chicken_info           : classification (R,H,C), group #, mother ID. Array.          
+            self.chicken_info           : classification (R,H,C), group #, mother ID. Array. Built from self.pop on access.
             self.G                      : How often to randomize groups. Integer.
             self.output_size            : An integer value for the output size of obj func
             self.Active                 : An array indicating the activity status of each particle. (e.g., in bounds)
@@ -249,57 +270,435 @@ class swarm:
             self.maxit                  : Maximum number of iterations.
             self.E_TOL                  : Error tolerance.
             self.obj_func               : Objective function to be optimized.      
+            self.batch_objective        : Flag for a batch-capable objective function (see batch_objective()).
+            self.evaluator              : Optional pool_evaluator for concurrent objective calls in evaluate_generation().
+            self.eval_cache             : Optional evaluation_cache in front of the objective function.
             self.constr_func            : Constraint function.  
             self.iter                   : Current iteration count.
             self.current_particle       : Index of the current particle being evaluated.
             self.number_of_particles    : Total number of particles. 
             self.allow_update           : Flag indicating whether to allow updates.
             self.boundary               : Boundary conditions for the optimization problem.
+            self.bounds                 : boundary_handler that applies the boundary rule to sets of positions.
             self.Flist                  : List to store fitness values.
             self.Fvals                  : List to store fitness values.
-            self.Mlast                  : Last location of particle
+            self.Mlast                  : Last location of particle, before its most recent move
+            self.generation             : Generation counter. In the scalar mode, the number of completed passes over the swarm.
+            self.Fvals_gen              : Fitness values of every particle from the last evaluate_generation()
+            self.Flist_gen              : Target/threshold distances of every particle from the last evaluate_generation()
+            self.gen_evaluated          : Boolean array of particles successfully evaluated in the last generation
+            self.ask_queue              : Particles in the current generation not yet handed out by ask()
+            self.asked                  : Dict of ask() ids to particle index, waiting on tell()
+            self.next_ask_id            : Next id returned by ask()
+            self.tell_Fvals             : Fitness values collected by tell() for the current generation
+            self.tell_noError           : Boolean array of particles told successfully in the current generation
+            self.checkpoint_path        : File written by auto-checkpointing. None to turn it off.
+            self.checkpoint_every       : Number of iterations between automatic checkpoints.
+            self.last_checkpoint_iter   : Iteration of the last automatic checkpoint.
+            self.events                 : event_stream for step, generation, global best, reorganize, and complete events.
+            self.stats                  : swarm_stats phase timers and counters. None if instrumentation is off.
+            self.stats_callback         : Optional function called with get_stats() every stats_interval iterations.
+            self.stats_interval         : Number of iterations between stats_callback calls.
+            self.last_stats_iter        : Iteration of the last stats_callback call.
+            self.complete_reported      : True once the 'complete' event has been emitted.
+            self.history                : history_recorder for the convergence history. None if off.
+            self.diversity              : diversity_tracker with running position sums. See get_diversity().
+            self.blocks                 : random_block of pre-drawn random numbers for the move operators.
+            self.objective_calls        : Number of objective function calls, including results passed to tell().
+            self.stopping               : stopping_criteria for early stopping. None if off.
+            self.stop_reason            : Name of the early stopping criterion that fired. None while running.
+            self.multi_objective        : Flag for Pareto ranking in reorganize_swarm().
+            self.archive                : pareto_archive of the non-dominated positions. None if off.
             '''
 
-            self.output_size = len(targets)
-            self.Active = np.ones((NO_OF_PARTICLES))                        
-            self.Gb = sys.maxsize*np.ones((1,np.max([heightl, widthl])))   
-            self.F_Gb = sys.maxsize*np.ones((1,self.output_size))                
-            self.Pb = sys.maxsize*np.ones(np.shape(self.M))                 
-            self.F_Pb = sys.maxsize*np.ones((NO_OF_PARTICLES,self.output_size))  
             self.targets = np.array(targets).reshape(-1, 1)                    
             self.maxit = maxit                                             
             self.E_TOL = E_TOL                                              
             self.obj_func = obj_func                                             
+            self.batch_objective = bool(getattr(obj_func, 'batch_capable', False))
+            self.evaluator = None
+            if evaluator is not None:
+                from parallel_evaluation import pool_evaluator
+                self.evaluator = pool_evaluator(evaluator, max_in_flight=max_in_flight,
+                                                max_workers=max_workers)
+            self.eval_cache = None
+            if isinstance(eval_cache, bool):
+                if eval_cache:
+                    from evaluation_cache import evaluation_cache
+                    self.eval_cache = evaluation_cache(None, self.number_decimals)
+            elif isinstance(eval_cache, (int, np.integer)):
+                from evaluation_cache import evaluation_cache
+                self.eval_cache = evaluation_cache(eval_cache, self.number_decimals)
+            elif eval_cache is not None:
+                self.eval_cache = eval_cache
             self.constr_func = constr_func                                   
             self.iter = 0                                                   
             self.current_particle = 0                                       
-            self.number_of_particles = NO_OF_PARTICLES                      
             self.allow_update = 0                                           
             self.boundary = boundary                                       
+            self.bounds = boundary_handler(boundary, self.lbound, self.ubound, 
+                                           constr_func, self.streams.get('bounds'), self.number_decimals,
+                                           resample_budget=resample_budget,
+                                           resample_fallback=resample_fallback,
+                                           row_draws=self.bounds_draws)
             self.Flist = []                                                 
             self.Fvals = []                                                 
-            self.Mlast = 1*self.ubound                                      
-                                         
+            self.Mlast = 1*self.ubound
+            self.generation = 0
+            self.allocate_generation_state()
+            self.checkpoint_path = checkpoint_path
+            self.checkpoint_every = None if checkpoint_every is None else max(1, int(checkpoint_every))
+            self.last_checkpoint_iter = 0
+            self.stats = None
+            if instrument:
+                from instrumentation import swarm_stats
+                self.stats = swarm_stats()
+            self.stats_callback = stats_callback
+            self.stats_interval = None if stats_interval is None else max(1, int(stats_interval))
+            self.last_stats_iter = 0
+            self.complete_reported = False
+            self.history = None
+            if isinstance(history, bool):
+                if history:
+                    from history import history_recorder
+                    self.history = history_recorder()
+            elif isinstance(history, (int, np.integer)):
+                from history import history_recorder
+                self.history = history_recorder(history)
+            elif isinstance(history, str):
+                from history import history_recorder
+                self.history = history_recorder(path=history)
+            elif history is not None:
+                self.history = history
+            self.objective_calls = 0
+            self.stop_reason = None
+            self.stopping = None
+            if isinstance(stopping, dict):
+                from stopping import stopping_criteria
+                self.stopping = stopping_criteria(**stopping)
+            elif stopping is not None:
+                self.stopping = stopping
+                self.stopping.start()
+            self.multi_objective = bool(multi_objective)
+            if self.multi_objective and (pareto_archive is None):
+                pareto_archive = True
+            self.archive = None
+            if isinstance(pareto_archive, bool):
+                if pareto_archive:
+                    from pareto_archive import pareto_archive as archive_type
+                    self.archive = archive_type()
+            elif isinstance(pareto_archive, (int, np.integer)):
+                from pareto_archive import pareto_archive as archive_type
+                self.archive = archive_type(pareto_archive)
+            elif pareto_archive is not None:
+                self.archive = pareto_archive
+
 
             self.debug_message_printout("swarm successfully initialized")
             
 
+    def allocate_generation_state(self):
+        # per-generation buffers for evaluate_generation() and ask()/tell()
+        self.Fvals_gen = np.zeros((self.number_of_particles,self.output_size))
+        self.Flist_gen = np.zeros((self.number_of_particles,self.output_size))
+        self.gen_evaluated = np.zeros((self.number_of_particles), dtype=bool)
+        self.ask_queue = []
+        self.asked = {}
+        self.next_ask_id = 0
+        self.tell_Fvals = np.zeros((self.number_of_particles,self.output_size))
+        self.tell_noError = np.zeros((self.number_of_particles), dtype=bool)
+
+
+    # POPULATION STATE
+    # these are views into self.pop, kept for compatibility with drivers
+    # that read or set the arrays directly. Setting copies into the existing arrays.
+
+    @property
+    def M(self):
+        return self.pop.M
+
+    @M.setter
+    def M(self, value):
+        self.pop.set_array('M', value)
+
+    @property
+    def Pb(self):
+        return self.pop.Pb
+
+    @Pb.setter
+    def Pb(self, value):
+        self.pop.set_array('Pb', value)
+
+    @property
+    def F_Pb(self):
+        return self.pop.F_Pb
+
+    @F_Pb.setter
+    def F_Pb(self, value):
+        self.pop.set_array('F_Pb', value)
+
+    @property
+    def Active(self):
+        return self.pop.Active
+
+    @Active.setter
+    def Active(self, value):
+        self.pop.set_array('Active', value)
+
+    @property
+    def Gb(self):
+        return self.pop.Gb
+
+    @Gb.setter
+    def Gb(self, value):
+        self.pop.set_array('Gb', value)
+
+    @property
+    def F_Gb(self):
+        return self.pop.F_Gb
+
+    @F_Gb.setter
+    def F_Gb(self, value):
+        self.pop.set_array('F_Gb', value)
+
+    @property
+    def chicken_info(self):
+        return self.pop.get_chicken_info()
+
+    @chicken_info.setter
+    def chicken_info(self, value):
+        value = np.array(value).reshape(-1, 3)
+        self.pop.set_hierarchy(value[:, 0], value[:, 1], value[:, 2])
+
+
     def call_objective(self, allow_update):
         if self.Active[self.current_particle]:
             # call the objective function. If there's an issue with the function execution, 'noError' returns False
-            newFVals, noError = self.obj_func(self.M[self.current_particle], self.output_size)
+            if self.stats is not None:
+                t = self.stats.now()
+            if (self.eval_cache is None) and (not self.batch_objective):
+                # plain objective function. Called directly on the row, with no batch setup
+                newFVals, noError = self.obj_func(self.M[self.current_particle], self.output_size)
+                noError = bool(noError)
+                self.objective_calls = self.objective_calls + 1
+                if self.stats is not None:
+                    self.stats.count('objective_calls')
+                    self.stats.count('objective_failures', int(not noError))
+            else:
+                X = self.M[[self.current_particle]]
+                if self.eval_cache is not None:
+                    newFVals, noErrors = self.eval_cache.evaluate(X, self.evaluate_positions, False)
+                else:
+                    newFVals, noErrors = self.evaluate_positions(X, False)
+                newFVals = np.array(newFVals)[0]
+                noError = bool(noErrors[0])
+            if self.stats is not None:
+                self.stats.lap('objective', t)
             if noError == True:
                 self.Fvals = np.array(newFVals).reshape(-1, 1)
                 if allow_update:
                     # EVALUATE OBJECTIVE FUNCTION - TARGET OR THRESHOLD
                     self.Flist = self.objective_function_evaluation(self.Fvals, self.targets)# abs(self.targets - self.Fvals)
                     self.iter = self.iter + 1
+                    if self.archive is not None:
+                        self.archive.add_point(1*self.M[self.current_particle], self.Flist, self.Fvals)
                     self.allow_update = 1
                 else:
                     self.allow_update = 0
+            self.check_budget()
+            self.auto_checkpoint()
+            self.report_stats()
+            self.report_complete()
             return noError# return is for error reporting purposes only
 
 
+    def evaluate_positions(self, X, concurrent=True):
+        # evaluates each row of X with the objective function.
+        # Uses the evaluator (if there is one and concurrent is True), a single
+        # batch call for batch-capable objectives, or one call per row.
+        # Returns an (N x output_size) array and a length-N noErrors mask
+        num_rows = np.shape(X)[0]
+        Fvals = np.zeros((num_rows, self.output_size))
+        noErrors = np.zeros((num_rows), dtype=bool)
+        if num_rows < 1:
+            return Fvals, noErrors
+        self.objective_calls = self.objective_calls + num_rows
+        if self.stats is not None:
+            self.stats.count('objective_calls', num_rows)
+
+        if concurrent and (self.evaluator is not None):
+            # concurrent evaluation. Results come back in row order
+            Fvals, noErrors = self.evaluator.evaluate(self.obj_func, X,
+                                                      self.output_size, batch=self.batch_objective)
+        elif self.batch_objective:
+            # one call for every row. noErrors is a per-row mask
+            newFVals, newNoErrors = self.obj_func(X, self.output_size)
+            noErrors = np.array(newNoErrors, dtype=bool).reshape(-1)
+            Fvals[noErrors] = np.array(newFVals).reshape(num_rows, self.output_size)[noErrors]
+        else:
+            for i in range(0, num_rows):
+                newFVals, noErr = self.obj_func(X[i], self.output_size)
+                if noErr == True:
+                    Fvals[i] = np.array(newFVals).reshape(-1)
+                    noErrors[i] = True
+        if self.stats is not None:
+            self.stats.count('objective_failures', int(num_rows - np.count_nonzero(noErrors)))
+        return Fvals, noErrors
+
+
+    def evaluate_generation(self, allow_update):
+        # generation-synchronous version of call_objective().
+        # Every active chicken is evaluated once, and the results are held in
+        # self.Flist_gen until the next step_generation() call.
+        # Returns a per-particle noError array. Inactive particles are False.
+        noError = np.zeros((self.number_of_particles), dtype=bool)
+        Fvals_gen = np.zeros((self.number_of_particles, self.output_size))
+
+        particles = np.flatnonzero(self.Active)
+        if len(particles) > 0:
+            if self.stats is not None:
+                t = self.stats.now()
+            if self.eval_cache is not None:
+                newFVals, noErrors = self.eval_cache.evaluate(self.M[particles], self.evaluate_positions)
+            else:
+                newFVals, noErrors = self.evaluate_positions(self.M[particles])
+            Fvals_gen[particles[noErrors]] = newFVals[noErrors]
+            noError[particles[noErrors]] = True
+            if self.stats is not None:
+                self.stats.lap('objective', t)
+
+        self.store_generation(Fvals_gen, noError, allow_update)
+        return noError # return is for error reporting purposes only
+
+
+    def store_generation(self, Fvals_gen, noError, allow_update):
+        # holds the fitness values of a fully evaluated generation
+        # until the next step_generation() call
+        self.Fvals_gen = Fvals_gen
+        if allow_update:
+            # EVALUATE OBJECTIVE FUNCTION - TARGET OR THRESHOLD
+            self.Flist_gen = self.objective_function_evaluation_generation(self.Fvals_gen, self.targets)
+            self.gen_evaluated = noError
+            self.iter = self.iter + int(np.count_nonzero(noError))
+            if self.archive is not None:
+                self.archive.add(self.M[noError], self.Flist_gen[noError], self.Fvals_gen[noError])
+            self.allow_update = 1
+        else:
+            self.gen_evaluated = np.zeros((self.number_of_particles), dtype=bool)
+            self.allow_update = 0
+        self.check_budget()
+        self.auto_checkpoint()
+        self.report_stats()
+        self.report_complete()
+
+
+    # ASK/TELL INTERFACE
+    # for evaluations that happen outside of the swarm, e.g. in a remote job queue.
+    # Positions are handed out one generation at a time. The swarm only moves
+    # to the next generation after every position that was asked for has been told.
+
+    def ask(self, n=None):
+        # returns (ids, positions) for up to n candidates that have not been handed out.
+        # The arrays are empty if the optimizer is complete, or if every candidate in the
+        # current generation is out for evaluation.
+        while (len(self.ask_queue) == 0) and (len(self.asked) == 0) and not self.complete():
+            # the last generation has been fully told. start the next one
+            self.step_generation(True)
+            particles = np.flatnonzero(self.Active)
+            self.tell_Fvals = np.zeros((self.number_of_particles, self.output_size))
+            self.tell_noError = np.zeros((self.number_of_particles), dtype=bool)
+            if (self.eval_cache is not None) and (len(particles) > 0):
+                # cached positions are told right away, and aren't handed out
+                hit, F_cached = self.eval_cache.lookup(self.M[particles])
+                if np.any(hit):
+                    self.tell_Fvals[particles[hit]] = F_cached[hit]
+                    self.tell_noError[particles[hit]] = True
+                    particles = particles[~hit]
+                    if len(particles) == 0:
+                        # the whole generation was cached
+                        self.store_generation(self.tell_Fvals, self.tell_noError, True)
+                        continue
+            self.ask_queue = list(particles)
+            break
+
+        if n is None:
+            n = len(self.ask_queue)
+        particles = self.ask_queue[:max(0, int(n))]
+        self.ask_queue = self.ask_queue[len(particles):]
+
+        ids = np.arange(self.next_ask_id, self.next_ask_id + len(particles), dtype=np.int64)
+        self.next_ask_id = self.next_ask_id + len(particles)
+        for i, particle in zip(ids, particles):
+            self.asked[int(i)] = int(particle)
+
+        positions = np.array(self.M[np.array(particles, dtype=int)])
+        return ids, positions
+
+
+    def tell(self, ids, F_values, ok_mask=None):
+        # feeds back results for ids returned by ask(), in any order.
+        # F_values has one row of objective function outputs per id.
+        # ok_mask (optional) is the per-id noError flag. Defaults to all True.
+        ids = np.array(ids, dtype=np.int64).reshape(-1)
+        F_values = np.array(F_values, dtype=float).reshape(len(ids), -1)
+        if ok_mask is None:
+            ok_mask = np.ones((len(ids)), dtype=bool)
+        ok_mask = np.array(ok_mask, dtype=bool).reshape(-1)
+
+        for i, F, ok in zip(ids, F_values, ok_mask):
+            particle = self.asked.pop(int(i), None)
+            if particle is None:
+                self.debug_message_printout("WARNING: tell() received unknown or repeated id " + str(i) + ". Ignoring.")
+                continue
+            self.objective_calls = self.objective_calls + 1
+            if ok:
+                self.tell_Fvals[particle] = F
+                self.tell_noError[particle] = True
+                if self.eval_cache is not None:
+                    self.eval_cache.store(self.M[[particle]], F.reshape(1, -1))
+
+        if (len(self.ask_queue) == 0) and (len(self.asked) == 0):
+            # every candidate in this generation has been told
+            self.store_generation(self.tell_Fvals, self.tell_noError, True)
+
+
+    async def run(self, evaluator, max_in_flight=None):
+        # asyncio driver for ask()/tell(). 
+        # evaluator takes the same arguments as obj_func, (X, output_size), and returns 
+        # (F, noError). It can be a coroutine function, or a regular function that
+        # is then run in the default executor.
+        # Up to max_in_flight evaluations run at once (default: the swarm size).
+        import asyncio
+
+        if max_in_flight is None:
+            max_in_flight = self.number_of_particles
+        loop = asyncio.get_running_loop()
+
+        async def evaluate(X):
+            if asyncio.iscoroutinefunction(evaluator):
+                return await evaluator(X, self.output_size)
+            return await loop.run_in_executor(None, evaluator, X, self.output_size)
+
+        in_flight = {}
+        while True:
+            if not self.complete():
+                ids, positions = self.ask(max_in_flight - len(in_flight))
+                for i, X in zip(ids, positions):
+                    in_flight[asyncio.ensure_future(evaluate(X))] = i
+            if len(in_flight) == 0:
+                break
+
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                i = in_flight.pop(task)
+                try:
+                    F, noError = task.result()
+                    F = np.array(F, dtype=float).reshape(-1)
+                except Exception:
+                    F, noError = np.zeros((self.output_size)), False
+                self.tell([i], [F], [bool(noError)])
+
+
     def objective_function_evaluation(self, Fvals, targets):
         #pass in the Fvals & targets so that it's easier to track bugs
 
@@ -364,7 +763,28 @@ class swarm:
             Flist = abs(targets - Fvals)
 
         return Flist
-        
+
+
+    def objective_function_evaluation_generation(self, Fvals_gen, targets):
+        # same TARGET/THRESHOLD rules as objective_function_evaluation(),
+        # applied to a (number_of_particles x output_size) array in one pass
+        epsilon = np.finfo(float).eps #smallest system constant
+
+        t = np.array(targets).reshape(1, -1)
+        Flist_gen = np.abs(t - Fvals_gen)
+
+        if self.evaluate_threshold == True: #THRESHOLD
+            o_thres = np.array(self.obj_threshold).reshape(1, -1).astype(int)
+            if np.any((o_thres < 0) | (o_thres > 2)):
+                self.debug_message_printout("ERROR: unrecognized threshold value. Evaluating as TARGET")
+            # LESS THAN OR EQUAL and GREATER THAN OR EQUAL thresholds that are met
+            # are considered 'on target'
+            on_target = ((o_thres == 1) & (Fvals_gen <= t)) | \
+                        ((o_thres == 2) & (Fvals_gen >= t))
+            Flist_gen = np.where(on_target, epsilon, Flist_gen)
+
+        return Flist_gen
+
 
 
 
@@ -375,12 +795,11 @@ class swarm:
         epsilon = 10e-50 
 
         # choose a random rooster
-        rooster_arr = np.arange(self.RN)
-        random_rooster_idx = self.rng.choice(rooster_arr)
+        random_rooster_idx = self.blocks.rooster_idx[particle]
         # use L2 norm for fitness to account for multi-objective funcs
-        random_rooster_fitness = np.linalg.norm(self.F_Pb[random_rooster_idx])
+        random_rooster_fitness = self.pop.F_Pb_norm[random_rooster_idx]
         
-        this_rooster_fitness = np.linalg.norm(self.F_Pb[particle])
+        this_rooster_fitness = self.pop.F_Pb_norm[particle]
 
         if this_rooster_fitness <= random_rooster_fitness:
             sig_squared = 1
@@ -392,8 +811,8 @@ class swarm:
             sig_squared = np.exp(clipped_val)
 
 
-        #update new location based on random()
-        self.M[particle] = np.round(self.M[particle]*(1+self.rng.normal(0, sig_squared)), self.number_decimals)
+        #update new location based on random(). sig_squared is the standard deviation
+        self.M[particle] = np.round(self.M[particle]*(1+sig_squared*self.blocks.rooster_normal[particle]), self.number_decimals)
     
 
     def move_hen(self, particle):
@@ -406,23 +825,26 @@ class swarm:
         # NOTE: FitnessRoosterGroupmate and FitnessRandomChickenInSwarm cannot be the same chicken
 
         # get the rooster information
-        group_rooster_idx = int(self.chicken_info[particle][1]) #also the group index
+        group_rooster_idx = int(self.pop.group[particle]) #also the group index
         rooster_loc = self.M[group_rooster_idx]
-        fitness_rooster = np.linalg.norm(self.F_Pb[group_rooster_idx])
+        fitness_rooster = self.pop.F_Pb_norm[group_rooster_idx]
         
         # get the random chicken information
-        # initial random
-        random_chicken_idx = self.rng.integers(0, self.number_of_particles)
-        # random cannot be the idx of the rooster, the current chicken, or be from a chick
-        while (random_chicken_idx == group_rooster_idx) or \
-                        (random_chicken_idx == particle) or \
-                        (int(self.chicken_info[random_chicken_idx][0]) == 3):
-            random_chicken_idx = self.rng.integers(0, self.number_of_particles)
+        # random cannot be the idx of the rooster, the current chicken, or be from a chick.
+        # The first valid pre-drawn partner is used
+        random_chicken_idx = -1
+        for candidate in self.blocks.partners[particle]:
+            if (candidate != group_rooster_idx) and (candidate != particle) and \
+               (self.pop.chicken_class[candidate] != 3):
+                random_chicken_idx = candidate
+                break
+        if random_chicken_idx < 0:
+            random_chicken_idx = self.redraw_partner(particle, group_rooster_idx)
 
         random_chicken_loc = self.M[random_chicken_idx]
-        fitness_random_chicken = np.linalg.norm(self.F_Pb[random_chicken_idx])
+        fitness_random_chicken = self.pop.F_Pb_norm[random_chicken_idx]
 
-        fitness_this_chicken = np.linalg.norm(self.F_Pb[particle])
+        fitness_this_chicken = self.pop.F_Pb_norm[particle]
 
         # epsilon = 'smallest system constant'. improvised.
         epsilon = 10e-50 
@@ -439,7 +861,9 @@ class swarm:
         # still dealing with overflow issues. apply cap to S1
         S1 = np.clip(S1, -10e30, 10e30)
 
-        clipped_term1 = np.clip((S1*self.rng.uniform(0,1)*(rooster_loc-self.M[particle])), -10e30, 10e10)
+        # very small S1 values can underflow to zero. That is the intended result
+        with np.errstate(under='ignore'):
+            clipped_term1 = np.clip((S1*self.blocks.hen_uniform[particle, 0]*(rooster_loc-self.M[particle])), -10e30, 10e10)
         term_1 = clipped_term1
 
         #S2 = np.exp(float(fitness_random_chicken-fitness_this_chicken))
@@ -456,7 +880,8 @@ class swarm:
         # clipped_term2 = np.clip((S2*self.rng.uniform(0,1)*(random_chicken_loc-self.M[particle])), -10e50, 10e10)
         S2 = np.clip(S2, -10e30, 10e30)
 
-        clipped_term2 = np.clip((S2*self.rng.uniform(0,1)*(random_chicken_loc-self.M[particle])), -10e30, 10e10)
+        with np.errstate(under='ignore'):
+            clipped_term2 = np.clip((S2*self.blocks.hen_uniform[particle, 1]*(random_chicken_loc-self.M[particle])), -10e30, 10e10)
         term_2 = clipped_term2
 
         # new_loc = old_loc + term_1 + term_2
@@ -468,169 +893,365 @@ class swarm:
         # NOTE: FL is a value 0 or 2 that determines if a chick follows the mother
         #  The chick RANDOMLY chooses between 0 or 2
 
-        mother_idx = int(self.chicken_info[particle][2]) # the the idx of the mother chicken
+        mother_idx = int(self.pop.mother[particle]) # the the idx of the mother chicken
         mother_loc = self.M[mother_idx]
-        self.M[particle] = np.round(self.M[particle] + self.rng.choice([0,2])*(mother_loc-self.M[particle]), self.number_decimals)
+        self.M[particle] = np.round(self.M[particle] + self.blocks.chick_FL[particle]*(mother_loc-self.M[particle]), self.number_decimals)
+
+
+    # GENERATION-SYNCHRONOUS MOVEMENT MODELS
+    # these apply the same rules as move_rooster(), move_hen() and move_chick()
+    # to an array of particle indices at once
+
+    def move_roosters(self, particles):
+        # epsilon = 'smallest system constant'. improvised.
+        epsilon = 10e-50
+
+        # use L2 norm for fitness to account for multi-objective funcs
+        fitness_norms = self.pop.F_Pb_norm
+
+        # choose a random rooster for each rooster
+        random_rooster_idx = self.blocks.rooster_idx[particles]
+        random_rooster_fitness = fitness_norms[random_rooster_idx]
+        this_rooster_fitness = fitness_norms[particles]
+
+        sig_squared = np.ones(len(particles))
+        worse = this_rooster_fitness > random_rooster_fitness
+        clipped_val = np.clip(((random_rooster_fitness[worse]-this_rooster_fitness[worse])/(np.abs(this_rooster_fitness[worse])+epsilon)), -700.00, 700.00)
+        sig_squared[worse] = np.exp(clipped_val)
+
+        #update new location based on random()
+        self.M[particles] = np.round(self.M[particles]*(1+sig_squared*self.blocks.rooster_normal[particles]).reshape(-1, 1), self.number_decimals)
+
+
+    def move_hens(self, particles):
+        # epsilon = 'smallest system constant'. improvised.
+        epsilon = 10e-50
+
+        fitness_norms = self.pop.F_Pb_norm
+
+        # get the rooster information
+        group_rooster_idx = self.pop.group[particles] #also the group index
+        rooster_loc = self.M[group_rooster_idx]
+        fitness_rooster = fitness_norms[group_rooster_idx]
+
+        # random chicken cannot be the rooster, the current chicken, or a chick.
+        # The first valid pre-drawn partner is used
+        partners = self.blocks.partners[particles]
+        valid = (partners != group_rooster_idx.reshape(-1, 1)) & (partners != particles.reshape(-1, 1)) & \
+                (self.pop.chicken_class[partners] != 3)
+        random_chicken_idx = partners[np.arange(len(particles)), np.argmax(valid, axis=1)]
+        for i in np.flatnonzero(~np.any(valid, axis=1)):
+            random_chicken_idx[i] = self.redraw_partner(particles[i], group_rooster_idx[i])
+
+        random_chicken_loc = self.M[random_chicken_idx]
+        fitness_random_chicken = fitness_norms[random_chicken_idx]
+        fitness_this_chicken = fitness_norms[particles]
+        this_loc = self.M[particles]
+
+        # same clipping as move_hen() to keep exp() and the terms from overflowing
+        clipped_val = np.clip(((fitness_this_chicken-fitness_rooster)/(np.abs(fitness_this_chicken) + epsilon)), -700.00, 700.00)
+        # very small S1, S2 values can underflow to zero. That is the intended result
+        with np.errstate(under='ignore'):
+            S1 = np.clip(np.exp(clipped_val), -10e30, 10e30).reshape(-1, 1)
+            term_1 = np.clip((S1*self.blocks.hen_uniform[particles, 0:1]*(rooster_loc-this_loc)), -10e30, 10e10)
+
+            clipped_val = np.clip((fitness_random_chicken-fitness_this_chicken), -700.00, 700.00)
+            S2 = np.clip(np.exp(clipped_val), -10e30, 10e30).reshape(-1, 1)
+            term_2 = np.clip((S2*self.blocks.hen_uniform[particles, 1:2]*(random_chicken_loc-this_loc)), -10e30, 10e10)
+
+        # new_loc = old_loc + term_1 + term_2
+        self.M[particles] = np.round(this_loc + term_1 + term_2, self.number_decimals)
+
+
+    def redraw_partner(self, particle, group_rooster_idx):
+        # none of the pre-drawn partners were valid. Draw from the roosters and hens
+        # with the particle's own generator until one is, so that both modes redraw
+        # the same partner
+        rng = self.blocks.generator('hen', particle)
+        candidates = np.flatnonzero(self.pop.chicken_class != 3)
+        random_chicken_idx = candidates[rng.integers(0, len(candidates))]
+        while (random_chicken_idx == group_rooster_idx) or (random_chicken_idx == particle):
+            random_chicken_idx = candidates[rng.integers(0, len(candidates))]
+        return random_chicken_idx
+
+
+    def move_chicks(self, particles):
+        # FL is 0 or 2, chosen randomly for each chick
+        mother_idx = self.pop.mother[particles]
+        FL = self.blocks.chick_FL[particles].reshape(-1, 1)
+        self.M[particles] = np.round(self.M[particles] + FL*(self.M[mother_idx]-self.M[particles]), self.number_decimals)
+
+
+    def move_generation(self):
+        # roosters are moved first, then hens, then chicks so that chicks follow
+        # the updated mother hen locations. Bounds are handled after each class
+        # has moved, same as the per-particle order in step()
+        active = self.pop.Active
+        chicken_type = self.pop.chicken_class
+
+        roosters = np.flatnonzero(active & (chicken_type == 0))
+        hens = np.flatnonzero(active & ((chicken_type == 1) | (chicken_type == 2)))
+        chicks = np.flatnonzero(active & (chicken_type == 3))
+
+        # every particle gets a new row of random numbers
+        self.blocks.refill()
+
+        stats = self.stats
+        if stats is not None:
+            t = stats.now()
+            stats.count('moves_rooster', len(roosters))
+            stats.count('moves_hen', len(hens))
+            stats.count('moves_chick', len(chicks))
+
+        if len(roosters) > 0:
+            M_last = self.M[roosters]
+            self.move_roosters(roosters)
+            if stats is not None:
+                t = stats.lap('move_rooster', t)
+            self.handle_bounds_generation(roosters, M_last)
+            if stats is not None:
+                t = stats.lap('bounds', t)
+        if len(hens) > 0:
+            M_last = self.M[hens]
+            self.move_hens(hens)
+            if stats is not None:
+                t = stats.lap('move_hen', t)
+            self.handle_bounds_generation(hens, M_last)
+            if stats is not None:
+                t = stats.lap('bounds', t)
+        if len(chicks) > 0:
+            M_last = self.M[chicks]
+            self.move_chicks(chicks)
+            if stats is not None:
+                t = stats.lap('move_chick', t)
+            self.handle_bounds_generation(chicks, M_last)
+            if stats is not None:
+                t = stats.lap('bounds', t)
+
+        # the whole population moved, so the running sums are rebuilt (O(D) per move)
+        self.diversity.reset(self.M)
 
     def reorganize_swarm(self):
         # rank the chickens' fitness vals and establish hierarchial order
         # divide swarm into groups, determine relationship between mother hens and chicks
 
         #get the indexs that sort the personal best fitness from best (lowest) to worst
-        l2_norm_vals = []
-        for idx in range(0, self.number_of_particles):
-            l2_norm_vals.append(np.linalg.norm(self.F_Pb[idx]))
-      
-        fitness_sort_idx = np.argsort(l2_norm_vals)# lowest are first
-        
-        #use the idx values to sort self.M and personal best fitness self.F_Pb
-        temp_M = 1*self.M
-        temp_F_Pb = 1*self.F_Pb
-        temp_Active = 1*self.Active #tracking which are active
-        ctr = 0
-
-        for idx in fitness_sort_idx:
-            temp_M[ctr] = self.M[idx]
-            temp_F_Pb[ctr] = self.F_Pb[idx]
-            temp_Active[ctr] = self.Active[idx]
-            ctr = ctr + 1
-        self.M = 1*temp_M
-        self.F_Pb = 1*temp_F_Pb
-        self.Active = 1*temp_Active
+        if self.multi_objective:
+            # by Pareto front, then least crowded first within a front
+            from pareto_archive import pareto_order
+            fitness_sort_idx = pareto_order(self.pop.F_Pb)
+        else:
+            fitness_sort_idx = np.argsort(self.pop.F_Pb_norm, kind='stable')# lowest are first
+
+        #use the idx values to sort self.M, personal bests, and activity in place.
+        # Pb is sorted with F_Pb so that each personal best stays with its fitness
+        self.pop.permute(fitness_sort_idx)
 
         # update the chicken_information (category, group, mother-child ID)
         # top RN are roosters. Middle HN are hens, with MN being mother hens.
         # last (and worst preforming) are chicks
+        self.assign_hierarchy()
+        # the running sums are resynced here, so rounding error can't build up
+        self.diversity.reset(self.M)
+        self.events.emit(DEBUG, 'reorganize', self.reorganize_event)
+        if self.stats is not None:
+            self.stats.count('reorganizations')
+
+
+    def assign_hierarchy(self):
+        # builds the hierarchy for a population sorted from best to worst.
+        # CLASSIFICATION(0-4), GROUP(0-m), MOTHER-CHILD ID
+        #  - roosters are the first RN chickens, and each leads the group matching its index
+        #  - hens and mother hens are assigned to a random group
+        #  - chicks are assigned to a random mother hen, and join her group
+        rng = self.streams.get('hierarchy')
+        number_of_particles = self.number_of_particles
+        chicken_class = self.pop.chicken_class
+        group = self.pop.group
+        mother = self.pop.mother
+        chicken_class[:] = 0
+        group[:] = 0
+        mother[:] = -1
+
+        hen_start = self.RN
+        mother_start = self.RN + self.HN
+        chick_start = self.RN + self.HN + self.MN
+
+        # classification
+        chicken_class[hen_start:mother_start] = 1
+        chicken_class[mother_start:chick_start] = 2
+        chicken_class[chick_start:] = 3
+
+        # rooster groups
+        num_roosters = min(self.RN, number_of_particles)
+        group[0:num_roosters] = np.arange(num_roosters)
+
+        # hen, mother hen groups
+        num_hens = max(0, min(chick_start, number_of_particles) - hen_start)
+        if (num_hens > 0) and (self.RN > 0):
+            group[hen_start:hen_start+num_hens] = rng.integers(0, self.RN, size=num_hens)
+
+        # chicks. sample the mother hens directly
+        num_chicks = max(0, number_of_particles - chick_start)
+        if (num_chicks > 0) and (self.MN > 0):
+            mother_idx = mother_start + rng.integers(0, self.MN, size=num_chicks)
+            group[chick_start:] = group[mother_idx]
+            mother[chick_start:] = mother_idx
+
 
-        # make temp classification list
-        classList = np.zeros(self.number_of_particles)
-        # rooster
-        classList[0:self.RN] = 0
-        # hen
-        start = self.RN
-        end = self.RN + self.HN
-        classList[start:end] = 1
-        # mother hen
-        start = self.RN + self.HN
-        end = self.RN + self.HN + self.MN
-        classList[start:end] = 2
-        # chicks
-        start = self.RN + self.HN + self.MN
-        classList[start:] = 3
-        # array of groups to use in random allocation
-        group_nums = np.arange(self.RN)
-
-        # first rooster, to reset the array
-        self.chicken_info = np.array([0, 0, -1])
-
-        for i in range(1,int(self.number_of_particles)):
-            if classList[i] == 0: #rooster
-                # assign to the next group (i-1), and done.
-                # CLASSIFICATION(0-4), GROUP(0-m), MOTHER-CHILD ID
-                self.chicken_info = \
-                    np.vstack([self.chicken_info, [classList[i], i, -1]])
-
-            elif (classList[i] == 1) or (classList[i] == 2): #hen, mother hen
-                # assign to a random group.
-                # CLASSIFICATION(0-4), GROUP(0-m), MOTHER-CHILD ID
-                hen_group = self.rng.choice(group_nums)
-                self.chicken_info = \
-                    np.vstack([self.chicken_info,[classList[i], hen_group, -1]])
-
-            elif classList[i] == 3: #chick
-                # select a random hen to be the 'mother' and assign to group
-                # CLASSIFICATION(0-4), GROUP(0-m), MOTHER-CHILD ID
-                groupAssigned = False
-                while (groupAssigned == False):
-                    chicken_idx = self.rng.integers(0, i-1, endpoint=False)# index after a chick will always be the chick
-                    if self.chicken_info[chicken_idx][0] == 2: #is mother hen
-                        # get the group the random mother hen is from
-                        mother_group = self.chicken_info[chicken_idx][1]         
-                        # assign chick to group, and to that mother hen                    
-                        self.chicken_info = \
-                            np.vstack([self.chicken_info,[classList[i], mother_group, chicken_idx]])
-
-                        groupAssigned = True
-
-
-  
     def check_bounds(self, particle):
+        # returns the index+1 of the last out of bounds dimension, 0 if in bounds
+        out_of_bounds = np.flatnonzero((self.lbound > self.M[particle]) | (self.ubound < self.M[particle]))
         update = 0
-        for i in range(0,(np.shape(self.M)[1])):
-            if (self.lbound[i] > self.M[particle,i]) \
-               or (self.ubound[i] < self.M[particle,i]):
-                update = i+1        
+        if len(out_of_bounds) > 0:
+            update = int(out_of_bounds[-1]) + 1
         return update
 
 
+    # BOUNDARY RULES
+    # the per-particle rules pass a single row to the boundary handler.
+    # See boundary_handler.py for the rules.
+
     def random_bound(self, particle):
         # If particle is out of bounds, bring the particle back in bounds
         # The first condition checks if constraints are met, 
         # and the second determins if the values are to large (positive or negitive)
         # and may cause a buffer overflow with large exponents (a bug that was found experimentally)
-        update = self.check_bounds(particle) or not self.constr_func(self.M[particle])
-        if update > 0:
-            while (self.check_bounds(particle) > 0) or (self.constr_func(self.M[particle]) == False):
-                variation = self.ubound - self.lbound
-                self.M[particle] = np.round(
-                    np.squeeze(
-                        self.rng.random() *
-                        np.multiply(np.ones((1, np.shape(self.M)[1])), variation) +
-                        self.lbound
-                    ), self.number_decimals)
+        X = self.M[[particle]]
+        self.bounds.random_bound(X, particles=[particle])
+        self.M[particle] = X[0]
 
-            
     def reflecting_bound(self, particle):        
-        update = self.check_bounds(particle)
-        constr = self.constr_func(self.M[particle])
-        if (update > 0) and constr:
-            self.M[particle] = 1*self.Mlast
-            NewV = np.multiply(-1,self.V[update-1,particle])
-            self.V[update-1,particle] = NewV
-        if not constr:
-            self.random_bound(particle)
+        X = self.M[[particle]]
+        self.bounds.reflecting_bound(X, particles=[particle])
+        self.M[particle] = X[0]
 
     def absorbing_bound(self, particle):
-        update = self.check_bounds(particle)
-        constr = self.constr_func(self.M[particle])
-        if (update > 0) and constr:
-            self.M[particle] = 1*self.Mlast
-            self.V[particle,update-1] = 0
-        if not constr:
-            self.random_bound(particle)
+        X = self.M[[particle]]
+        self.bounds.absorbing_bound(X, particles=[particle])
+        self.M[particle] = X[0]
 
     def invisible_bound(self, particle):
-        update = self.check_bounds(particle) or not self.constr_func(self.M[particle])
-        if update > 0:
-            self.Active[particle] = 0  
-        else:
-            pass          
+        if self.bounds.invisible_bound(self.M[[particle]])[0]:
+            self.Active[particle] = False
 
+    def bounds_draws(self, particle, count):
+        # the particle's resampling draws for the current pass. See random_block.resample_draws()
+        return self.blocks.resample_draws(particle, count)
 
     def handle_bounds(self, particle):
-        if self.boundary == 1:
-            self.random_bound(particle)
-        elif self.boundary == 2:
-            self.reflecting_bound(particle)
-        elif self.boundary == 3:
-            self.absorbing_bound(particle)
-        elif self.boundary == 4:
-            self.invisible_bound(particle)
-        else:
+        # scalar version of handle_bounds_generation(). The row is checked and fixed
+        # in place without building a (1 x D) array. See boundary_handler.apply_row()
+        if self.boundary not in (1, 2, 3, 4):
+            self.debug_message_printout("Error: No boundary is set!")
+            return
+        if self.bounds.apply_row(self.M[particle], self.Mlast, particle):
+            self.Active[particle] = False
+
+    def handle_bounds_generation(self, particles, M_last=None):
+        # bounds for the whole set of particles are handled in one array pass.
+        # M_last (optional) are the positions before the move, used if the
+        # resampling budget runs out
+        if self.boundary not in (1, 2, 3, 4):
             self.debug_message_printout("Error: No boundary is set!")
+            return
+        particles = np.array(particles, dtype=int)
+        X = self.M[particles]
+        inactive = self.bounds.apply(X, M_last, particles)
+        self.M[particles] = X
+        self.Active[particles[inactive]] = False
 
     def check_global_local(self, Flist, particle):
 
-        if np.linalg.norm(Flist) < np.linalg.norm(self.F_Gb):
-            self.F_Gb = np.array([Flist])
-            self.Gb = np.array(self.M[particle])
+        # fitness norms of the bests are cached in self.pop, 
+        # so only the new value needs a norm
+        Flist_norm = np.linalg.norm(Flist)
+        if Flist_norm < self.pop.F_Gb_norm:
+            self.pop.update_global_best(Flist, self.M[particle], Flist_norm)
+            if self.stats is not None:
+                self.stats.count('global_best_updates')
+            self.events.emit(INFO, 'global_best', self.global_best_event)
         
-        if np.linalg.norm(Flist) < np.linalg.norm(self.F_Pb[particle]):
-            self.F_Pb[particle] = np.squeeze(Flist)
-            self.Pb[particle] = self.M[particle]
-    
+        if Flist_norm < self.pop.F_Pb_norm[particle]:
+            self.pop.update_personal_best([particle], Flist, self.M[[particle]], [Flist_norm])
+
+    def check_global_local_generation(self, Flist_gen, evaluated):
+        # vectorized check_global_local() over every particle evaluated in the last generation
+        particles = np.flatnonzero(evaluated)
+        if len(particles) < 1:
+            return
+
+        Flist_norms = np.linalg.norm(Flist_gen[particles], axis=1)
+
+        best = np.argmin(Flist_norms)
+        if Flist_norms[best] < self.pop.F_Gb_norm:
+            self.pop.update_global_best(Flist_gen[particles[best]], self.M[particles[best]], Flist_norms[best])
+            if self.stats is not None:
+                self.stats.count('global_best_updates')
+            self.events.emit(INFO, 'global_best', self.global_best_event)
+
+        improved_mask = Flist_norms < self.pop.F_Pb_norm[particles]
+        improved = particles[improved_mask]
+        self.pop.update_personal_best(improved, Flist_gen[improved], self.M[improved], Flist_norms[improved_mask])
+
+    def get_best_chickens(self, n):
+        # personal best positions and fitness values of the n best chickens, best first.
+        # Used to send migrants to other swarms
+        best = np.argsort(self.pop.F_Pb_norm, kind='stable')[:max(0, int(n))]
+        return np.array(self.Pb[best]), np.array(self.F_Pb[best])
+
+    def insert_chickens(self, positions, F):
+        # replaces the worst chickens with migrants from another swarm.
+        # positions and F are the migrants' best positions and fitness values.
+        # A migrant only replaces a chicken with a worse personal best.
+        # Returns the number of chickens replaced
+        positions = np.reshape(positions, (-1, self.pop.dimensions))
+        F = np.reshape(F, (-1, self.output_size))
+        F_norms = np.linalg.norm(F, axis=1)
+        order = np.argsort(F_norms, kind='stable')
+        worst = np.argsort(self.pop.F_Pb_norm, kind='stable')[::-1][:len(order)]
+        keep = F_norms[order] < self.pop.F_Pb_norm[worst]
+        migrants = order[keep]
+        replaced = worst[keep]
+        if len(replaced) < 1:
+            return 0
+
+        self.M[replaced] = positions[migrants]
+        self.Active[replaced] = True
+        self.diversity.reset(self.M)
+        self.pop.update_personal_best(replaced, F[migrants], positions[migrants], F_norms[migrants])
+        # the last generation's results belong to the old chickens
+        self.gen_evaluated[replaced] = False
+
+        best = migrants[0]
+        if F_norms[best] < self.pop.F_Gb_norm:
+            self.pop.update_global_best(F[best], positions[best], F_norms[best])
+        return len(replaced)
+
+    # EVENT PAYLOADS
+    # passed to self.events.emit() uncalled, so they only run if a sink is subscribed
+
+    def global_best_event(self):
+        return {'iter': self.iter,
+                'generation': self.generation,
+                'best_eval': self.pop.F_Gb_norm,
+                'Gb': np.array(self.Gb[0]),
+                'F_Gb': np.array(self.F_Gb[0])}
+
+    def reorganize_event(self):
+        return {'iter': self.iter,
+                'generation': self.generation}
+
+    def complete_event(self):
+        return {'iter': self.iter,
+                'generation': self.generation,
+                'reason': self.get_stop_reason(),
+                'best_eval': self.pop.F_Gb_norm,
+                'Gb': np.array(self.Gb[0]),
+                'F_Gb': np.array(self.F_Gb[0])}
+
     def converged(self):
-        convergence = np.linalg.norm(self.F_Gb) < self.E_TOL
+        convergence = self.pop.F_Gb_norm < self.E_TOL
         return convergence
     
     def maxed(self):
@@ -638,29 +1259,67 @@ class swarm:
         return max_iter
     
     def complete(self):
-        done = self.converged() or self.maxed()
+        done = self.converged() or self.maxed() or (self.stop_reason is not None)
         return done
+
+    def get_stop_reason(self):
+        # why the run completed: 'converged', 'maxit', the early stopping criterion
+        # that fired ('patience', 'diversity', 'time', 'evaluations'), or 'no_active'
+        # (generation mode, every chicken out of bounds). None while running
+        if self.converged():
+            return 'converged'
+        if self.maxed():
+            return 'maxit'
+        return self.stop_reason
+
+    def check_budget(self):
+        # time and objective call budgets. Checked after each evaluation
+        if self.stopping is not None:
+            self.stop_reason = self.stopping.check_budget(self.objective_calls)
+
+    def end_generation(self):
+        # called once per generation (scalar mode: once per pass over the swarm)
+        if self.history is not None:
+            self.record_history()
+        if self.stopping is not None:
+            self.stop_reason = self.stopping.end_generation(self.pop.F_Gb_norm,
+                                                            self.diversity.spread_norm())
     
     def step(self, suppress_output):
-        if not suppress_output:
-            msg = "\n-----------------------------\n" + \
-                "STEP #" + str(self.iter) +"\n" + \
-                "-----------------------------\n" + \
-                "Current Particle:\n" + \
-                str(self.current_particle) +"\n" + \
-                "Current Particle Active\n" + \
-                str(self.Active[self.current_particle]) +"\n" + \
-                "Current Particle Location\n" + \
-                str(self.M[self.current_particle]) +"\n" + \
-                "Absolute mean deviation\n" + \
-                str(self.absolute_mean_deviation_of_particles()) +"\n" + \
-                "-----------------------------"
-            self.debug_message_printout(msg)
+        # the step details are only gathered if they are printed, or if an
+        # event sink wants DEBUG events
+        if (not suppress_output) or self.events.enabled_for(DEBUG):
+            info = {'iter': self.iter,
+                    'particle': self.current_particle,
+                    'active': bool(self.Active[self.current_particle]),
+                    'position': np.array(self.M[self.current_particle]),
+                    'mean_absolute_deviation': self.absolute_mean_deviation_of_particles()}
+            self.events.emit(DEBUG, 'step', info)
+            if not suppress_output:
+                msg = "\n-----------------------------\n" + \
+                    "STEP #" + str(info['iter']) +"\n" + \
+                    "-----------------------------\n" + \
+                    "Current Particle:\n" + \
+                    str(info['particle']) +"\n" + \
+                    "Current Particle Active\n" + \
+                    str(info['active']) +"\n" + \
+                    "Current Particle Location\n" + \
+                    str(info['position']) +"\n" + \
+                    "Absolute mean deviation\n" + \
+                    str(info['mean_absolute_deviation']) +"\n" + \
+                    "-----------------------------"
+                self.debug_message_printout(msg)
             
         if self.allow_update: # The first time step is called, this is false
+            stats = self.stats
+            if stats is not None:
+                stats.count('steps')
+                t = stats.now()
             if self.Active[self.current_particle]:
                 # save global best
                 self.check_global_local(self.Flist,self.current_particle)
+                if stats is not None:
+                    t = stats.lap('global_best', t)
 
                 # every self.G full cycle iterations reorganize the swarm
                 #  self.G_steps is the # of chickens multiplied by the generations for the number of iterations
@@ -669,36 +1328,115 @@ class swarm:
                     self.reorganize_swarm()
                     #start with the new best rooster
                     self.current_particle = 0
+                    if stats is not None:
+                        t = stats.lap('reorganize', t)
                 
+                # save the location before the move
+                self.Mlast = 1*self.M[self.current_particle]
+                # this particle's row of pre-drawn random numbers
+                self.blocks.take(self.current_particle)
+
                 # move chickens
                 # roosters are always at the top of the list so that they're moved first.
                 # Then the hens are moved. It doesn't matter which type of hen is moved first.
                 # Chicks are moved last so that they can follow the mother hens
-                chicken_type = self.chicken_info[self.current_particle][0]
+                chicken_type = self.pop.chicken_class[self.current_particle]
                 if chicken_type == 0: #update rooster location
                     self.move_rooster(self.current_particle)
+                    phase = 'rooster'
 
                 elif (chicken_type == 1): #update hen
                     self.move_hen(self.current_particle)
+                    phase = 'hen'
 
                 elif (chicken_type == 2): #update hen location
                     self.move_hen(self.current_particle)
+                    phase = 'hen'
 
                 elif chicken_type == 3: #update chick location
                     self.move_chick(self.current_particle)
+                    phase = 'chick'
+
+                if stats is not None:
+                    stats.count('moves_' + phase)
+                    t = stats.lap('move_' + phase, t)
 
                 # handle any out-of-bounds situation
                 self.handle_bounds(self.current_particle)
+                self.diversity.move(self.Mlast, self.M[self.current_particle])
+                if stats is not None:
+                    stats.lap('bounds', t)
 
             self.current_particle = self.current_particle + 1
             if self.current_particle == self.number_of_particles:
                 self.current_particle = 0
+                # a completed pass counts as a generation for the history and events
+                self.generation = self.generation + 1
+                self.end_generation()
+
+            if self.complete() and not suppress_output:
+                msg =  "\nPoints: \n" + str(self.Gb) + "\n" + \
+                    "Iterations: \n" + str(self.iter) + "\n" + \
+                    "Flist: \n" + str(self.F_Gb) + "\n" + \
+                    "Norm Flist: \n" + str(self.pop.F_Gb_norm) + "\n"
+                self.debug_message_printout(msg)
+
+    def step_generation(self, suppress_output):
+        # generation-synchronous version of step(). The whole population is
+        # moved in one call: all roosters, then all hens, then all chicks.
+        # Use with evaluate_generation() in place of step() and call_objective().
+        # The two modes should not be mixed within a single run.
+        if (not suppress_output) or self.events.enabled_for(DEBUG):
+            info = {'iter': self.iter,
+                    'generation': self.generation,
+                    'active_count': int(np.count_nonzero(self.Active)),
+                    'mean_absolute_deviation': self.absolute_mean_deviation_of_particles()}
+            self.events.emit(DEBUG, 'generation', info)
+            if not suppress_output:
+                msg = "\n-----------------------------\n" + \
+                    "GENERATION #" + str(info['generation']) +"\n" + \
+                    "-----------------------------\n" + \
+                    "Iterations:\n" + \
+                    str(info['iter']) +"\n" + \
+                    "Active Particles\n" + \
+                    str(info['active_count']) +"\n" + \
+                    "Absolute mean deviation\n" + \
+                    str(info['mean_absolute_deviation']) +"\n" + \
+                    "-----------------------------"
+                self.debug_message_printout(msg)
+
+        if self.allow_update: # The first time step is called, this is false
+            stats = self.stats
+            if stats is not None:
+                stats.count('generations')
+                t = stats.now()
+
+            # save global and personal bests from the last evaluated generation
+            self.check_global_local_generation(self.Flist_gen, self.gen_evaluated)
+            self.gen_evaluated = np.zeros((self.number_of_particles), dtype=bool)
+            self.generation = self.generation + 1
+            if stats is not None:
+                t = stats.lap('global_best', t)
+            self.end_generation()
+
+            # every self.G generations reorganize the swarm
+            if self.generation%self.G == 0:
+                self.reorganize_swarm()
+                if stats is not None:
+                    stats.lap('reorganize', t)
+
+            # move chickens
+            self.move_generation()
+            # an inactive chicken is never moved again in this mode, so with none
+            # left active the iteration count can't grow. Stop instead of looping
+            if not np.any(self.Active):
+                self.stop_reason = 'no_active'
 
             if self.complete() and not suppress_output:
                 msg =  "\nPoints: \n" + str(self.Gb) + "\n" + \
                     "Iterations: \n" + str(self.iter) + "\n" + \
                     "Flist: \n" + str(self.F_Gb) + "\n" + \
-                    "Norm Flist: \n" + str(np.linalg.norm(self.F_Gb)) + "\n"
+                    "Norm Flist: \n" + str(self.pop.F_Gb_norm) + "\n"
                 self.debug_message_printout(msg)
 
     def export_swarm(self):
@@ -778,10 +1516,19 @@ class swarm:
         self.CN = int(swarm_export['CN'][0]) 
         self.G = int(swarm_export['G'][0]) 
         self.number_of_particles = int(swarm_export['number_of_particles'][0]) 
+        self.G_steps = self.G*self.number_of_particles
 
         # shared format vars for AntennaCAT set
-
-        self.M = np.array(swarm_export['M'][0]) 
+        M = np.array(swarm_export['M'][0]).reshape(self.number_of_particles, -1)
+        if (self.pop.number_of_particles != self.number_of_particles) or \
+           (self.pop.dimensions != np.shape(M)[1]) or \
+           (self.pop.output_size != self.output_size):
+            # swarm dimensions changed. reallocate the population store
+            self.pop = population(self.number_of_particles, np.shape(M)[1], self.output_size)
+            self.assign_hierarchy()
+            self.allocate_generation_state()
+
+        self.M = M
         self.Active = np.array(swarm_export['Active'][0])                    
         self.Gb = np.array(swarm_export['Gb'][0]) 
         self.F_Gb = np.array(swarm_export['F_Gb'][0])
@@ -790,30 +1537,312 @@ class swarm:
         self.Flist = np.array(swarm_export['Flist'][0])                                                 
         self.Fvals= np.array(swarm_export['Fvals'][0])                                               
         self.Mlast= np.array(swarm_export['Mlast'][0]) 
-
+        self.diversity.reset(self.M)
+        self.blocks = random_block(self.streams, self.number_of_particles, self.RN, np.shape(self.M)[1])
+
+        # bounds may have changed
+        self.bounds = boundary_handler(self.boundary, self.lbound, self.ubound,
+                                       self.constr_func, self.streams.get('bounds'), self.number_decimals,
+                                       resample_budget=self.bounds.resample_budget,
+                                       resample_fallback=self.bounds.resample_fallback,
+                                       row_draws=self.bounds_draws)
+
+
+    # CHECKPOINTS
+    # a checkpoint holds everything needed to resume a run exactly where it stopped:
+    # every state array, the hierarchy, the counters, and the random bit generator state.
+    # The objective and constraint functions, the evaluator, and the evaluation cache are
+    # not saved. They come from the constructor of the swarm the checkpoint is loaded into.
+    # Save between evaluating and stepping (e.g. after call_objective()), which is where
+    # auto-checkpointing saves, and resume the usual step()/call_objective() loop after loading.
+
+    def save_checkpoint(self, path):
+        from checkpoint import write_checkpoint
+
+        header = {
+            'evaluate_threshold': bool(self.evaluate_threshold),
+            'output_size': self.output_size,
+            'maxit': self.maxit,
+            'E_TOL': self.E_TOL,
+            'iter': self.iter,
+            'objective_calls': self.objective_calls,
+            'current_particle': self.current_particle,
+            'allow_update': self.allow_update,
+            'boundary': self.boundary,
+            'number_decimals': self.number_decimals,
+            'RN': self.RN,
+            'HN': self.HN,
+            'MN': self.MN,
+            'CN': self.CN,
+            'G': self.G,
+            'G_steps': self.G_steps,
+            'number_of_particles': self.number_of_particles,
+            'generation': self.generation,
+            'next_ask_id': self.next_ask_id,
+            'asked': [[i, p] for i, p in self.asked.items()],
+            'rng_state': self.streams.get_state(),
+            'stop_reason': self.stop_reason,
+            'stopping_state': None if self.stopping is None else self.stopping.get_state(),
+            }
+
+        arrays = {
+            'targets': np.array(self.targets),
+            'lbound': np.array(self.lbound),
+            'ubound': np.array(self.ubound),
+            'M': self.pop.M,
+            'Pb': self.pop.Pb,
+            'F_Pb': self.pop.F_Pb,
+            'Active': self.pop.Active,
+            'chicken_class': self.pop.chicken_class,
+            'group': self.pop.group,
+            'mother': self.pop.mother,
+            'Gb': self.pop.Gb,
+            'F_Gb': self.pop.F_Gb,
+            'Flist': np.array(self.Flist, dtype=float),
+            'Fvals': np.array(self.Fvals, dtype=float),
+            'Mlast': np.array(self.Mlast, dtype=float),
+            'Fvals_gen': self.Fvals_gen,
+            'Flist_gen': self.Flist_gen,
+            'gen_evaluated': self.gen_evaluated,
+            'ask_queue': np.array(self.ask_queue, dtype=np.int64),
+            'tell_Fvals': self.tell_Fvals,
+            'tell_noError': self.tell_noError,
+            }
+        if self.obj_threshold is not None:
+            arrays['obj_threshold'] = np.array(self.obj_threshold)
+        # the pre-drawn random numbers for the rest of the current pass
+        for name, value in self.blocks.get_arrays().items():
+            arrays['block_' + name] = value
+        if self.archive is not None:
+            for name, value in self.archive.get_arrays().items():
+                arrays['archive_' + name] = value
+
+        write_checkpoint(path, header, arrays)
+
+
+    def load_checkpoint(self, path):
+        from checkpoint import read_checkpoint
+
+        header, arrays = read_checkpoint(path)
+
+        self.evaluate_threshold = bool(header['evaluate_threshold'])
+        self.obj_threshold = arrays.get('obj_threshold', None)
+        self.targets = arrays['targets'].reshape(-1, 1)
+        self.lbound = arrays['lbound']
+        self.ubound = arrays['ubound']
+        self.output_size = int(header['output_size'])
+        self.maxit = int(header['maxit'])
+        self.E_TOL = float(header['E_TOL'])
+        self.iter = int(header['iter'])
+        self.objective_calls = int(header.get('objective_calls', 0))
+        self.current_particle = int(header['current_particle'])
+        self.allow_update = int(header['allow_update'])
+        self.boundary = int(header['boundary'])
+        self.number_decimals = int(header['number_decimals'])
+        self.RN = int(header['RN'])
+        self.HN = int(header['HN'])
+        self.MN = int(header['MN'])
+        self.CN = int(header['CN'])
+        self.G = int(header['G'])
+        self.G_steps = int(header['G_steps'])
+        self.number_of_particles = int(header['number_of_particles'])
+        self.generation = int(header['generation'])
+
+        M = arrays['M']
+        if (self.pop.number_of_particles != self.number_of_particles) or \
+           (self.pop.dimensions != np.shape(M)[1]) or \
+           (self.pop.output_size != self.output_size):
+            # swarm dimensions changed. reallocate the population store
+            self.pop = population(self.number_of_particles, np.shape(M)[1], self.output_size)
+        for name in ('M', 'Pb', 'F_Pb', 'Active', 'Gb', 'F_Gb'):
+            self.pop.set_array(name, arrays[name])
+        self.pop.set_hierarchy(arrays['chicken_class'], arrays['group'], arrays['mother'])
+
+        self.Flist = arrays['Flist']
+        self.Fvals = arrays['Fvals']
+        self.Mlast = arrays['Mlast']
+
+        self.diversity.reset(self.M)
+        self.blocks = random_block(self.streams, self.number_of_particles, self.RN, np.shape(self.M)[1])
+        # older checkpoints drew the blocks from streams. Their rows are dropped, and
+        # the next pass is drawn with the key that follows the generation count
+        if 'block_block' in arrays:
+            self.blocks.set_arrays({name: arrays['block_' + name] for name in random_block.ARRAYS})
+        else:
+            self.blocks.block = self.generation - 1
+        # the archive is only restored if this swarm keeps one
+        if (self.archive is not None) and ('archive_F' in arrays):
+            self.archive.set_arrays({name[len('archive_'):]: value for name, value in arrays.items()
+                                     if name.startswith('archive_')})
+
+        self.allocate_generation_state()
+        self.Fvals_gen = arrays['Fvals_gen']
+        self.Flist_gen = arrays['Flist_gen']
+        self.gen_evaluated = arrays['gen_evaluated']
+        self.ask_queue = [int(p) for p in arrays['ask_queue']]
+        self.asked = {int(i): int(p) for i, p in header['asked']}
+        self.next_ask_id = int(header['next_ask_id'])
+        self.tell_Fvals = arrays['tell_Fvals']
+        self.tell_noError = arrays['tell_noError']
+
+        # restore the random streams. A different bit generator type is swapped in
+        if int(header['version']) < 2:
+            self.debug_message_printout("WARNING: checkpoint has a single random stream. " + \
+                                        "The run will not repeat exactly from here.")
+        else:
+            if int(header['version']) < 4:
+                self.debug_message_printout("WARNING: checkpoint has streamed move draws. " + \
+                                            "The run will not repeat exactly from here.")
+            self.streams.set_state(header['rng_state'])
+            self.rng = self.streams.get('init')
+
+        # bounds may have changed
+        self.bounds = boundary_handler(self.boundary, self.lbound, self.ubound,
+                                       self.constr_func, self.streams.get('bounds'), self.number_decimals,
+                                       resample_budget=self.bounds.resample_budget,
+                                       resample_fallback=self.bounds.resample_fallback,
+                                       row_draws=self.bounds_draws)
+        self.last_checkpoint_iter = self.iter
+        self.last_stats_iter = self.iter
+        # a run that stopped early stays stopped. The early stopping counters and
+        # time budget continue from the checkpoint (they start over for older checkpoints,
+        # or if the checkpointed run had no stopping criteria)
+        self.stop_reason = header.get('stop_reason', None)
+        if self.stopping is not None:
+            self.stopping.start()
+            if header.get('stopping_state', None) is not None:
+                self.stopping.set_state(header['stopping_state'])
+
+
+    def auto_checkpoint(self):
+        # writes a checkpoint once checkpoint_every iterations have passed since the last one
+        if (self.checkpoint_path is None) or (self.checkpoint_every is None):
+            return
+        if (self.iter - self.last_checkpoint_iter) >= self.checkpoint_every:
+            self.save_checkpoint(self.checkpoint_path)
+            self.last_checkpoint_iter = self.iter
 
     def get_obj_inputs(self):
         return np.vstack(self.M[self.current_particle])
     
     def get_convergence_data(self):
-        best_eval = np.linalg.norm(self.F_Gb)
+        best_eval = self.pop.F_Gb_norm
         iteration = 1*self.iter
         return iteration, best_eval
         
+    def get_stats(self):
+        # counters and phase timers. 'times' and 'counts' are None if
+        # instrumentation is off. The boundary handler counters are always kept
+        stats = {'iter': self.iter,
+                 'generation': self.generation,
+                 'instrumented': self.stats is not None,
+                 'times': None,
+                 'total_time': None,
+                 'counts': None,
+                 'boundary': self.bounds.get_stats(),
+                 'cache': self.get_cache_stats()}
+        if self.stats is not None:
+            stats.update(self.stats.get_stats())
+        return stats
+
+    def reset_stats(self):
+        if self.stats is not None:
+            self.stats.reset()
+        self.bounds.reset_stats()
+        if self.eval_cache is not None:
+            self.eval_cache.reset_stats()
+
+    def report_stats(self):
+        # calls stats_callback once stats_interval iterations have passed since the last call
+        if (self.stats_callback is None) or (self.stats_interval is None):
+            return
+        if (self.iter - self.last_stats_iter) >= self.stats_interval:
+            self.last_stats_iter = self.iter
+            self.stats_callback(self.get_stats())
+
+    def report_complete(self):
+        # emits the 'complete' event once, after the evaluation that completes the run
+        if self.complete_reported or (not self.events.enabled_for(INFO)):
+            return
+        if self.complete():
+            self.complete_reported = True
+            self.events.emit(INFO, 'complete', self.complete_event)
+
+    def get_boundary_stats(self):
+        # constraint calls, rejection rate, and resampling counters from the boundary handler
+        return self.bounds.get_stats()
+
+    def get_cache_stats(self):
+        # hit/miss counts of the evaluation cache. None if there isn't one
+        if self.eval_cache is None:
+            return None
+        return self.eval_cache.get_stats()
+
+    def get_fitness_norms(self):
+        # read-only view of the cached personal best fitness norms, 
+        # and the cached global best fitness norm
+        F_Pb_norm = self.pop.F_Pb_norm.view()
+        F_Pb_norm.flags.writeable = False
+        return F_Pb_norm, self.pop.F_Gb_norm
+
+    def record_history(self):
+        # adds a record to the history recorder (subject to its decimation rate)
+        self.history.record(self.iter, self.generation, self.pop.F_Gb_norm,
+                            self.Gb[0], self.F_Gb[0],
+                            self.absolute_mean_deviation_of_particles(),
+                            int(np.count_nonzero(self.Active)))
+
+    def get_history(self):
+        # the recorded convergence history held in memory, oldest first, as a dict
+        # of arrays. None if there is no recorder. Use history.load_history() for
+        # a recording on disk
+        if self.history is None:
+            return None
+        return self.history.get_history()
+
+    def get_pareto_front(self):
+        # the non-dominated positions found so far and their objective function
+        # outputs, as (positions, outputs) sorted by the first objective's distance
+        # to its target. None if there is no archive
+        if self.archive is None:
+            return None
+        X, F, outputs = self.archive.get_front()
+        return X, outputs
+
     def get_optimized_soln(self):
         return self.Gb.reshape(-1, 1) #standardization  
     
     def get_optimized_outs(self):
-        return self.F_Gb[0] #correction for extra brackets that happen with the math/passing
+        return self.F_Gb[0].reshape(-1, 1) #correction for extra brackets that happen with the math/passing
     
     def absolute_mean_deviation_of_particles(self):
-        mean_data = np.array(np.mean(self.M, axis=0)).reshape(1, -1)
-        abs_data = np.zeros(np.shape(self.M))
-        for i in range(0,self.number_of_particles):
-            abs_data[i] = np.squeeze(np.abs(self.M[i]-mean_data))
-
-        abs_mean_dev = np.linalg.norm(np.mean(abs_data,axis=0))
-        return abs_mean_dev
+        return mean_absolute_deviation(self.M)
+
+    def get_diversity(self):
+        # diversity metrics of the current positions, for logging or stagnation checks.
+        # 'spread' (per-dimension standard deviation), 'spread_norm', and 'centroid'
+        # come from the running sums. The others are computed on call
+        # personal bests that have been set (they start at sys.maxsize)
+        F_Pb = self.pop.F_Pb[np.all(self.pop.F_Pb < sys.maxsize, axis=1)]
+        return {'mean_absolute_deviation': mean_absolute_deviation(self.M),
+                'spread': self.diversity.spread(),
+                'spread_norm': self.diversity.spread_norm(),
+                'centroid': self.diversity.centroid(),
+                'group_centroid_distances': group_centroid_distances(self.M, self.pop.group),
+                'pareto_spread': pareto_spread(F_Pb) if len(F_Pb) > 0 else 0.0}
+
+    def close(self):
+        # shuts down a worker pool created by the swarm. 
+        # An executor that was passed in is left running.
+        # An evaluation cache with a path is saved to disk, and event sinks and the
+        # history recorder are flushed and closed.
+        if self.evaluator is not None:
+            self.evaluator.shutdown()
+        if (self.eval_cache is not None) and (self.eval_cache.path is not None):
+            self.eval_cache.save()
+        self.events.close()
+        if self.history is not None:
+            self.history.close()
 
     def debug_message_printout(self, msg):
         if self.parent == None:
@@ -0,0 +1,114 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/diversity.py'
+#   Diversity metrics for the chicken swarm.
+#       The functions take the (N x D) position array and are
+#       vectorized over the particles. diversity_tracker keeps running
+#       sums of the positions, so that the centroid and per-dimension
+#       spread are updated in O(D) per particle move instead of being
+#       recomputed in O(N*D).
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+from pareto_archive import non_dominated_mask
+
+
+def mean_absolute_deviation(M):
+    # norm of the per-dimension mean absolute deviation from the centroid
+    M = np.atleast_2d(M)
+    return float(np.linalg.norm(np.mean(np.abs(M - np.mean(M, axis=0)), axis=0)))
+
+
+def dimension_spread(M):
+    # per-dimension standard deviation of the positions
+    return np.std(np.atleast_2d(M), axis=0)
+
+
+def group_centroids(M, group):
+    # centroid of each rooster group. group holds the group index of each
+    # particle. Returns a (number of groups x D) array
+    M = np.atleast_2d(M)
+    group = np.asarray(group, dtype=np.intp)
+    number_of_groups = int(np.max(group)) + 1
+    sums = np.zeros((number_of_groups, np.shape(M)[1]))
+    np.add.at(sums, group, M)
+    counts = np.bincount(group, minlength=number_of_groups).reshape(-1, 1)
+    return sums/np.maximum(counts, 1)
+
+
+def group_centroid_distances(M, group):
+    # distance from each rooster group's centroid to the centroid of the swarm.
+    # Small distances mean the groups have collapsed onto the same region
+    centroids = group_centroids(M, group)
+    return np.linalg.norm(centroids - np.mean(np.atleast_2d(M), axis=0), axis=1)
+
+
+def pareto_spread(F):
+    # extent of the non-dominated set of F: the norm of its per-objective range.
+    # 0 for a single objective, or when the non-dominated set is a single point
+    F = np.atleast_2d(F)
+    if np.shape(F)[1] < 2:
+        return 0.0
+    front = F[non_dominated_mask(F)]
+    return float(np.linalg.norm(np.max(front, axis=0) - np.min(front, axis=0)))
+
+
+class diversity_tracker:
+    # arguments should take the form:
+    # diversity_tracker([[float, float, ...]])
+    #
+    # M: (N x D) array of the starting positions
+    #
+    # move() is called with the old and new position of a single particle.
+    # reset() recomputes the sums from the full array (after a whole
+    # generation moves, or when positions are replaced). Running sums
+    # slowly collect rounding error, so reset() should also be called
+    # now and then (the swarm calls it when it reorganizes).
+
+    def __init__(self, M):
+        self.reset(M)
+
+
+    def reset(self, M):
+        '''
+        self.N      : number of particles
+        self.sum    : per-dimension sum of the positions
+        self.sum_sq : per-dimension sum of the squared positions
+        '''
+        M = np.atleast_2d(M)
+        self.N = np.shape(M)[0]
+        self.sum = np.sum(M, axis=0)
+        self.sum_sq = np.sum(M*M, axis=0)
+
+
+    def move(self, old_position, new_position):
+        old_position = np.ravel(old_position)
+        new_position = np.ravel(new_position)
+        self.sum = self.sum + (new_position - old_position)
+        self.sum_sq = self.sum_sq + (new_position*new_position - old_position*old_position)
+
+
+    def centroid(self):
+        return self.sum/self.N
+
+
+    def variance(self):
+        # per-dimension population variance. Clipped at 0 for rounding error
+        mean = self.sum/self.N
+        return np.maximum(self.sum_sq/self.N - mean*mean, 0.0)
+
+
+    def spread(self):
+        # per-dimension standard deviation, as dimension_spread()
+        return np.sqrt(self.variance())
+
+
+    def spread_norm(self):
+        # single value summary of the spread. Used for stagnation checks
+        return float(np.sqrt(np.sum(self.variance())))
@@ -0,0 +1,188 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/evaluation_cache.py'
+#   Memoization layer for objective function calls.
+#       Positions are rounded to decimal_limit decimals before every
+#       evaluation, so repeated positions (e.g. chicks with FL=0, or
+#       positions absorbed at a bound) can be matched exactly on the
+#       bytes of the rounded position. Only successful evaluations
+#       are cached. The least recently used entries are evicted once
+#       max_size is reached, and the cache can be saved to an .npz
+#       file to be reused between runs.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import os
+import numpy as np
+from collections import OrderedDict
+
+
+class evaluation_cache:
+    # arguments should take the form:
+    # evaluation_cache(int, int, str)
+    #
+    # max_size: max number of cached positions. None = no limit
+    # decimal_limit: number of decimals positions are rounded to for the key.
+    #   Should match the decimal_limit of the swarm
+    # path (optional): path to an .npz file the cache is loaded from (if it exists) and saved to
+
+    def __init__(self, max_size=None, decimal_limit=4, path=None):
+        self.max_size = None if max_size is None else max(1, int(max_size))
+        self.number_decimals = int(decimal_limit)
+        self.path = path
+        self.entries = OrderedDict()
+        self.reset_stats()
+
+        if (self.path is not None) and os.path.exists(self.path):
+            self.load(self.path)
+
+
+    def reset_stats(self):
+        '''
+        self.hits       : positions answered from the cache, including repeats within one batch
+        self.misses     : positions passed on to the objective function
+        self.evictions  : entries dropped to stay under max_size
+        '''
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+    def get_stats(self):
+        hit_rate = 0.0
+        if (self.hits + self.misses) > 0:
+            hit_rate = self.hits/(self.hits + self.misses)
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': hit_rate,
+                'evictions': self.evictions,
+                'size': len(self.entries),
+                'max_size': self.max_size}
+
+
+    def key(self, position):
+        # adding 0.0 turns -0.0 into 0.0 so both give the same bytes
+        position = np.round(np.asarray(position, dtype=np.float64).reshape(-1), self.number_decimals) + 0.0
+        return position.tobytes()
+
+
+    def lookup(self, X):
+        # checks every row of X against the cache.
+        # Returns a length-N hit mask, and an (N x output_size) array that
+        # holds the cached values for the hits (None if there are no hits)
+        num_rows = np.shape(X)[0]
+        hit = np.zeros((num_rows), dtype=bool)
+        F = None
+        for i in range(0, num_rows):
+            k = self.key(X[i])
+            if k in self.entries:
+                self.entries.move_to_end(k)
+                if F is None:
+                    F = np.zeros((num_rows, np.size(self.entries[k])))
+                F[i] = self.entries[k]
+                hit[i] = True
+        self.hits = self.hits + int(np.count_nonzero(hit))
+        self.misses = self.misses + int(num_rows - np.count_nonzero(hit))
+        return hit, F
+
+
+    def store(self, X, F, noErrors=None):
+        # adds the successfully evaluated rows of X to the cache
+        X = np.atleast_2d(X)
+        F = np.reshape(np.asarray(F, dtype=np.float64), (np.shape(X)[0], -1))
+        if noErrors is None:
+            noErrors = np.ones((np.shape(X)[0]), dtype=bool)
+        for i in np.flatnonzero(noErrors):
+            k = self.key(X[i])
+            self.entries[k] = np.array(F[i])
+            self.entries.move_to_end(k)
+        if self.max_size is not None:
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions = self.evictions + 1
+
+
+    def evaluate(self, X, eval_func, *args):
+        # evaluates the rows of X through the cache.
+        # eval_func(X_missed, *args) is called once with the rows that aren't cached,
+        # with repeated rows removed, and returns (F, noErrors) for those rows.
+        # Returns an (N x output_size) array and a length-N noErrors mask for all of X
+        num_rows = np.shape(X)[0]
+        hit, F_cached = self.lookup(X)
+
+        # repeated positions in the missed rows are only evaluated once
+        first_row = {}
+        source = np.zeros((num_rows), dtype=int)
+        for i in np.flatnonzero(~hit):
+            k = self.key(X[i])
+            if k not in first_row:
+                first_row[k] = len(first_row)
+            source[i] = first_row[k]
+        num_unique = len(first_row)
+        # lookup() counted the repeats as misses
+        num_repeats = int(num_rows - np.count_nonzero(hit) - num_unique)
+        self.misses = self.misses - num_repeats
+        self.hits = self.hits + num_repeats
+
+        F = None
+        noErrors = np.array(hit)
+        if num_unique > 0:
+            unique_rows = np.zeros((num_unique), dtype=int)
+            for i in np.flatnonzero(~hit)[::-1]:
+                unique_rows[source[i]] = i
+            newFVals, newNoErrors = eval_func(X[unique_rows], *args)
+            newFVals = np.reshape(np.asarray(newFVals, dtype=np.float64), (num_unique, -1))
+            newNoErrors = np.array(newNoErrors, dtype=bool).reshape(-1)
+            self.store(X[unique_rows], newFVals, newNoErrors)
+
+            F = np.zeros((num_rows, np.shape(newFVals)[1]))
+            missed = np.flatnonzero(~hit)
+            F[missed] = newFVals[source[missed]]
+            noErrors[missed] = newNoErrors[source[missed]]
+
+        if F is None:
+            F = F_cached
+        elif F_cached is not None:
+            F[hit] = F_cached[hit]
+        return F, noErrors
+
+
+    def clear(self):
+        self.entries = OrderedDict()
+
+
+    def save(self, path=None):
+        # writes the cache to an .npz file. Entries are written oldest first
+        # so the LRU order is kept when the file is loaded
+        if path is None:
+            path = self.path
+        if path is None:
+            raise ValueError("evaluation_cache.save() needs a path")
+        if len(self.entries) > 0:
+            positions = np.vstack([np.frombuffer(k, dtype=np.float64) for k in self.entries.keys()])
+            values = np.vstack([v.reshape(1, -1) for v in self.entries.values()])
+        else:
+            positions = np.zeros((0, 0))
+            values = np.zeros((0, 0))
+        # saved through a file handle, so np.savez() doesn't add .npz to a path
+        # without it, and the file is found again by __init__() and load()
+        with open(path, 'wb') as f:
+            np.savez(f, positions=positions, values=values,
+                     decimal_limit=np.array(self.number_decimals))
+
+
+    def load(self, path=None):
+        # adds the entries of a saved cache. Positions are re-keyed with the
+        # current decimal_limit
+        if path is None:
+            path = self.path
+        with np.load(path, allow_pickle=False) as data:
+            positions = data['positions']
+            values = data['values']
+        if np.shape(positions)[0] > 0:
+            self.store(positions, values)
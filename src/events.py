@@ -0,0 +1,186 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/events.py'
+#   Structured event stream for the chicken swarm.
+#       Events have a level, a name, and a payload dict. A payload
+#       can be passed as a function, which is only called if a sink
+#       at that level is subscribed. Sinks:
+#       queue_sink:  bounded, non-blocking queue for GUI parents that
+#                    poll from their own thread
+#       jsonl_sink:  batched writes of one JSON object per line
+#       parent_sink: forwards a text version to a debug_message_printout()
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import time
+import json
+import queue
+import numpy as np
+
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: 'DEBUG', INFO: 'INFO', WARNING: 'WARNING', ERROR: 'ERROR'}
+
+# higher than any level. Nothing is emitted with no sinks
+NO_SINKS = ERROR + 1
+
+
+class event_stream:
+    # arguments should take the form:
+    # event_stream()
+    #
+    # sinks are subscribed with a minimum level. A sink is any callable
+    # that takes a single event dict
+
+    def __init__(self):
+        self.sinks = []
+        self.min_level = NO_SINKS
+
+
+    def subscribe(self, sink, level=INFO):
+        self.sinks.append((sink, int(level)))
+        self.min_level = min(self.min_level, int(level))
+        return sink
+
+
+    def unsubscribe(self, sink):
+        self.sinks = [(s, l) for s, l in self.sinks if s is not sink]
+        self.min_level = min([l for s, l in self.sinks], default=NO_SINKS)
+
+
+    def enabled_for(self, level):
+        # cheap check before building an expensive payload
+        return level >= self.min_level
+
+
+    def emit(self, level, name, payload=None):
+        # payload is a dict, or a function that returns one.
+        # Nothing is built unless a sink wants this level
+        if level < self.min_level:
+            return
+        if callable(payload):
+            payload = payload()
+        event = {'time': time.time(), 'level': LEVEL_NAMES.get(level, str(level)), 'event': name}
+        if payload is not None:
+            event.update(payload)
+        for sink, sink_level in self.sinks:
+            if level >= sink_level:
+                sink(event)
+
+
+    def close(self):
+        # flushes and closes sinks that have a close()
+        for sink, sink_level in self.sinks:
+            if hasattr(sink, 'close'):
+                sink.close()
+
+
+class queue_sink:
+    # arguments should take the form:
+    # queue_sink(int, bool)
+    #
+    # maxsize: max number of events held. Never blocks the swarm
+    # drop_oldest: when full, drop the oldest event (True) or the new event (False)
+
+    def __init__(self, maxsize=1000, drop_oldest=True):
+        self.queue = queue.Queue(maxsize=max(1, int(maxsize)))
+        self.drop_oldest = bool(drop_oldest)
+        self.dropped = 0
+
+
+    def __call__(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            self.dropped = self.dropped + 1
+            if self.drop_oldest:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    self.queue.put_nowait(event)
+                except queue.Full:
+                    pass
+
+
+    def get_events(self, max_events=None):
+        # returns the waiting events (up to max_events) without blocking.
+        # Meant to be polled, e.g. from a GUI timer
+        events = []
+        while (max_events is None) or (len(events) < max_events):
+            try:
+                events.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return events
+
+
+def to_json_value(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+class jsonl_sink:
+    # arguments should take the form:
+    # jsonl_sink(str, int)
+    #
+    # path: file events are appended to, one JSON object per line
+    # batch_size: number of events buffered before a write
+
+    def __init__(self, path, batch_size=100):
+        self.path = path
+        self.batch_size = max(1, int(batch_size))
+        self.buffer = []
+        self.file = open(path, 'a')
+
+
+    def __call__(self, event):
+        self.buffer.append(json.dumps(event, default=to_json_value))
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+
+    def flush(self):
+        if len(self.buffer) > 0:
+            self.file.write("\n".join(self.buffer) + "\n")
+            self.file.flush()
+            self.buffer = []
+
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+class parent_sink:
+    # arguments should take the form:
+    # parent_sink(obj)
+    #
+    # target: anything with a debug_message_printout(str) method (e.g. the
+    #  parent class of the swarm). Events are formatted as text here, so this
+    #  sink is as slow as the old printouts. Use queue_sink for fast updates.
+
+    def __init__(self, target):
+        self.target = target
+
+
+    def __call__(self, event):
+        lines = ["[" + event['level'] + "] " + event['event']]
+        for key, value in event.items():
+            if key in ('time', 'level', 'event'):
+                continue
+            lines.append(str(key) + ": " + str(value))
+        self.target.debug_message_printout("\n".join(lines))
@@ -0,0 +1,140 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/ground_truth.py'
+#   Reference landscapes and Pareto fronts for the problem packages.
+#       Evaluates a problem's batch objective and constraint functions
+#       over a regular grid, one chunk of grid points at a time, so the
+#       full coordinate array is never built. Results can be cached to
+#       .npy files keyed on the problem, bounds, and resolution. The
+#       reference Pareto front is found with a sorted sweep (2
+#       objectives) or a chunked non-dominated filter (3 or more).
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import hashlib
+import os
+import numpy as np
+from pareto_archive import non_dominated_mask
+
+
+def grid_axes(lbound, ubound, resolution):
+    # one linspace per input variable. resolution is an int (same for every
+    # variable) or a list with one entry per variable
+    lbound = np.ravel(lbound)
+    ubound = np.ravel(ubound)
+    resolution = np.broadcast_to(np.ravel(resolution), np.shape(lbound))
+    return [np.linspace(lb, ub, int(n)) for lb, ub, n in zip(lbound, ubound, resolution)]
+
+
+def grid_coordinates(axes, rows):
+    # coordinates of the given rows of the flattened grid, in
+    # np.meshgrid(*axes, indexing='ij') order. rows is an array of flat indices
+    # (e.g. np.flatnonzero(valid)). Returns a (len(rows) x number of axes) array
+    shape = tuple(len(a) for a in axes)
+    index = np.unravel_index(np.asarray(rows, dtype=np.intp), shape)
+    return np.stack([a[i] for a, i in zip(axes, index)], axis=-1)
+
+
+def grid_points(axes, start, stop):
+    # rows [start, stop) of the flattened grid
+    return grid_coordinates(axes, np.arange(start, stop))
+
+
+def evaluate_grid(obj_func_batch, constr_func_batch, axes, out_vars, chunk_size=65536):
+    # evaluates every grid point with the batch objective function. Points that
+    # fail the constraints are not evaluated.
+    # Returns F (number of points x out_vars) and the valid mask (constraints met and
+    # no error). F is 0 where valid is False
+    number_of_points = int(np.prod([len(a) for a in axes]))
+    F = np.zeros((number_of_points, out_vars))
+    valid = np.zeros((number_of_points), dtype=bool)
+    chunk_size = max(1, int(chunk_size))
+    for start in range(0, number_of_points, chunk_size):
+        stop = min(start + chunk_size, number_of_points)
+        X = grid_points(axes, start, stop)
+        feasible = np.flatnonzero(np.array(constr_func_batch(X), dtype=bool).reshape(-1))
+        if len(feasible) < 1:
+            continue
+        newFVals, noErrors = obj_func_batch(X[feasible], out_vars)
+        noErrors = np.array(noErrors, dtype=bool).reshape(-1)
+        rows = start + feasible[noErrors]
+        F[rows] = np.array(newFVals).reshape(len(feasible), out_vars)[noErrors]
+        valid[rows] = True
+    return F, valid
+
+
+def reference_front(F, valid=None, chunk_size=4096):
+    # indices of the non-dominated rows of F (all objectives minimized), sorted by
+    # the first objective. Rows where valid is False are skipped.
+    # Objective vectors that repeat are only listed once
+    F = np.atleast_2d(F)
+    rows = np.arange(len(F)) if valid is None else np.flatnonzero(valid)
+    if len(rows) < 1:
+        return rows
+    if np.shape(F)[1] == 1:
+        return rows[[np.argmin(F[rows, 0])]]
+
+    if np.shape(F)[1] == 2:
+        # sort by f1 (ties by f2). A point is on the front if its f2 is lower
+        # than every f2 before it
+        order = rows[np.lexsort((F[rows, 1], F[rows, 0]))]
+        f2 = F[order, 1]
+        on_front = np.ones((len(order)), dtype=bool)
+        on_front[1:] = f2[1:] < np.minimum.accumulate(f2)[:-1]
+        return order[on_front]
+
+    # 3 or more objectives. The front so far is merged with one chunk at a time,
+    # so the pairwise comparison stays (front + chunk)^2
+    front = rows[:0]
+    chunk_size = max(1, int(chunk_size))
+    for start in range(0, len(rows), chunk_size):
+        candidates = np.concatenate((front, rows[start:start + chunk_size]))
+        candidates = candidates[non_dominated_mask(F[candidates])]
+        front = candidates[np.sort(np.unique(F[candidates], axis=0, return_index=True)[1])]
+    return front[np.lexsort(np.flipud(F[front].T))]
+
+
+def cache_key(name, lbound, ubound, resolution):
+    # file name stem for a problem on a grid. The bounds are hashed so that a
+    # change to the problem's configs doesn't reuse an old grid
+    shape = "x".join(str(int(n)) for n in resolution)
+    bounds = np.concatenate((np.ravel(lbound), np.ravel(ubound))).astype(float)
+    digest = hashlib.sha1(bounds.tobytes()).hexdigest()[:8]
+    return str(name).replace('.', '_') + "_" + shape + "_" + digest
+
+
+def problem_grid(configs, resolution, chunk_size=65536, cache_dir=None):
+    # evaluates a problem package's configs (e.g. lundquist_3_var.configs_F) over a grid.
+    # configs is the configs_F module, or a dict with the same names.
+    # cache_dir (optional) is a directory for the .npy cache. A cached grid is loaded
+    # instead of being evaluated again.
+    # Returns a dict with 'axes', 'shape', 'F', and 'valid'. F and valid are flat, in
+    # np.meshgrid(*axes, indexing='ij') order. Use F.reshape(shape + (out_vars,))
+    get = configs.get if isinstance(configs, dict) else lambda name: getattr(configs, name)
+    axes = grid_axes(get('LB'), get('UB'), resolution)
+    shape = tuple(len(a) for a in axes)
+    out_vars = int(get('OUT_VARS'))
+
+    if cache_dir is not None:
+        stem = os.path.join(cache_dir, cache_key(get('OBJECTIVE_FUNC_NAME'),
+                                                 get('LB'), get('UB'), shape))
+        if os.path.exists(stem + "_F.npy") and os.path.exists(stem + "_valid.npy"):
+            return {'axes': axes, 'shape': shape,
+                    'F': np.load(stem + "_F.npy"), 'valid': np.load(stem + "_valid.npy")}
+
+    F, valid = evaluate_grid(get('OBJECTIVE_FUNC_BATCH'), get('CONSTR_FUNC_BATCH'),
+                             axes, out_vars, chunk_size)
+
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        # written to temporary names first, so an interrupted write isn't loaded later
+        for suffix, value in (("_F.npy", F), ("_valid.npy", valid)):
+            with open(stem + suffix + ".tmp", 'wb') as f:
+                np.save(f, value)
+            os.replace(stem + suffix + ".tmp", stem + suffix)
+    return {'axes': axes, 'shape': shape, 'F': F, 'valid': valid}
@@ -22,3 +22,22 @@ def func_F(X, NO_OF_OUTS=1):
         noErrors = False
 
     return F, noErrors
+
+
+def func_F_batch(X, NO_OF_OUTS=1):
+    # batch version of func_F. X is an (N x 2) array of positions.
+    # returns an (N x NO_OF_OUTS) array and a length-N noErrors mask
+    X = np.atleast_2d(X)
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    try:
+        with np.errstate(all='ignore'):
+            x = X[:, 0]
+            y = X[:, 1]
+            F[:, 0] = (x**2 + y - 11)**2 + (x + y**2 - 7)**2
+        noErrors = np.all(np.isfinite(F), axis=1)
+    except:
+        noErrors = np.zeros((np.shape(X)[0]), dtype=bool)
+
+    return F, noErrors
+
+func_F_batch.batch_capable = True
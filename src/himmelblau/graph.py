@@ -10,9 +10,15 @@
 ##-------------------------------------------------------------------------------\
 
 
+import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 
+# the shared ground truth generator is in src/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ground_truth import problem_grid
+
 import configs_F as f_c
 # problem constraints - pulled from the function configs for the optimizers
 LOWER_BOUNDS = f_c.LB[0]
@@ -21,7 +27,6 @@ LB_x = LOWER_BOUNDS[0]
 LB_y = LOWER_BOUNDS[1]
 UB_x = UPPER_BOUNDS[0]
 UB_y = UPPER_BOUNDS[1]
-FUNC_F = f_c.OBJECTIVE_FUNC
 GLOBAL_MIN = f_c.GLOBAL_MIN
 
 
@@ -29,31 +34,14 @@ GLOBAL_MIN = f_c.GLOBAL_MIN
 plotname = "himmelblau_plots.png"
 
 
-# Define range and step size
-x = np.linspace(LB_x, UB_x, 600)
-y = np.linspace(LB_y, UB_y, 600)
+# Evaluate function over a 600 x 600 grid with the batch function.
+# Cached in ./ground_truth_cache after the first run
+grid = problem_grid(f_c, 600, cache_dir='ground_truth_cache')
+x, y = grid['axes']
 X, Y = np.meshgrid(x, y)
 
-# Reshape X and Y to 1D arrays
-X_flat = X.flatten()
-Y_flat = Y.flatten()
-
-# Stack X and Y to create coords as a 2D array
-coords = np.stack((X_flat, Y_flat), axis=-1)
-
-# Evaluate function
-
-Z = []
-for c in coords:
-    z, noErr = FUNC_F(c)
-    if noErr == True:
-        Z.append(z)
-
-# Convert Z to a NumPy array
-Z = np.array(Z)
-
-# Reshape Z to ensure it's 2-dimensional
-Z = Z.reshape(X.shape)
+# the grid is in (x, y) order. meshgrid() puts y on the rows
+Z = grid['F'][:, 0].reshape(grid['shape']).T
 
 # Create figure and subplots
 fig = plt.figure(figsize=(14, 7))
@@ -0,0 +1,179 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/history.py'
+#   Convergence history recorder for the chicken swarm.
+#       One record is taken per generation (or every Nth generation)
+#       with the iteration, best norm, Gb, F_Gb, diversity, and active
+#       count. Records are kept in a fixed size ring buffer, or appended
+#       to a columnar directory (one raw binary file per column and a
+#       JSON header) so that memory use stays bounded on long runs.
+#       load_history() memory-maps a recorded directory.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import os
+import json
+import numpy as np
+
+
+HISTORY_FORMAT = 'chicken_swarm_history'
+HISTORY_VERSION = 1
+HEADER_FILE = 'header.json'
+
+
+def history_columns(in_size, out_size):
+    # column name: (dtype, values per record)
+    return {'iter': ('int64', 1),
+            'generation': ('int64', 1),
+            'best_eval': ('float64', 1),
+            'Gb': ('float64', int(in_size)),
+            'F_Gb': ('float64', int(out_size)),
+            'diversity': ('float64', 1),
+            'active_count': ('int64', 1)}
+
+
+class history_recorder:
+    # arguments should take the form:
+    # history_recorder(int, str, int, int)
+    #
+    # capacity: number of records kept in memory. With no path, this is a
+    #  ring buffer and the oldest records are overwritten. With a path, it
+    #  is the number of records buffered before they are appended to disk.
+    # path: directory for the columnar file. None to keep history in memory only.
+    # every: decimation rate. A record is taken every 'every' generations.
+    # flush_every: with a path, records are written once this many are buffered
+    #  (defaults to capacity).
+
+    def __init__(self, capacity=10000, path=None, every=1, flush_every=None):
+        self.capacity = max(1, int(capacity))
+        self.path = path
+        self.every = max(1, int(every))
+        self.flush_every = self.capacity if flush_every is None \
+            else min(self.capacity, max(1, int(flush_every)))
+        self.columns = None
+        self.buffers = None
+        self.files = None
+
+        '''
+        self.count      : number of records taken (including those written to disk)
+        self.written    : number of records appended to the file
+        self.next_slot  : next buffer row to write
+        self.calls      : number of record() calls, used for decimation
+        '''
+        self.count = 0
+        self.written = 0
+        self.next_slot = 0
+        self.calls = 0
+
+
+    def allocate(self, in_size, out_size):
+        # buffers are sized on the first record, once the problem size is known
+        self.columns = history_columns(in_size, out_size)
+        self.buffers = {}
+        for name, (dtype, width) in self.columns.items():
+            shape = (self.capacity,) if width == 1 else (self.capacity, width)
+            self.buffers[name] = np.zeros(shape, dtype=dtype)
+        if self.path is not None:
+            os.makedirs(self.path, exist_ok=True)
+            header = {'format': HISTORY_FORMAT,
+                      'version': HISTORY_VERSION,
+                      'columns': {name: [dtype, width] for name, (dtype, width) in self.columns.items()},
+                      'every': self.every}
+            with open(os.path.join(self.path, HEADER_FILE), 'w') as f:
+                json.dump(header, f, indent=2)
+            # a new recording replaces an old one in the same directory
+            self.files = {name: open(os.path.join(self.path, name + '.bin'), 'wb')
+                          for name in self.columns}
+
+
+    def record(self, iteration, generation, best_eval, Gb, F_Gb, diversity, active_count):
+        # returns True if a record was taken. Gb and F_Gb are 1D arrays
+        self.calls = self.calls + 1
+        if (self.calls - 1) % self.every != 0:
+            return False
+        Gb = np.ravel(Gb)
+        F_Gb = np.ravel(F_Gb)
+        if self.buffers is None:
+            self.allocate(len(Gb), len(F_Gb))
+
+        i = self.next_slot
+        self.buffers['iter'][i] = iteration
+        self.buffers['generation'][i] = generation
+        self.buffers['best_eval'][i] = best_eval
+        # columns of width 1 are stored as 1D buffers
+        self.buffers['Gb'][i] = Gb if self.columns['Gb'][1] > 1 else Gb[0]
+        self.buffers['F_Gb'][i] = F_Gb if self.columns['F_Gb'][1] > 1 else F_Gb[0]
+        self.buffers['diversity'][i] = diversity
+        self.buffers['active_count'][i] = active_count
+        self.count = self.count + 1
+        self.next_slot = (i + 1) % self.capacity
+
+        if (self.files is not None) and ((self.count - self.written) >= self.flush_every):
+            self.flush()
+        return True
+
+
+    def flush(self):
+        # appends the buffered records to the column files
+        if self.files is None:
+            return
+        n = self.count - self.written
+        if n < 1:
+            return
+        start = (self.next_slot - n) % self.capacity
+        rows = (start + np.arange(0, n)) % self.capacity
+        for name, f in self.files.items():
+            f.write(np.ascontiguousarray(self.buffers[name][rows]).tobytes())
+            f.flush()
+        self.written = self.count
+
+
+    def close(self):
+        self.flush()
+        if self.files is not None:
+            for f in self.files.values():
+                f.close()
+            self.files = None
+
+
+    def get_history(self):
+        # returns the records held in memory, oldest first, as a dict of arrays.
+        # With a path, load_history() returns the full recording
+        if self.buffers is None:
+            return {}
+        n = min(self.count, self.capacity)
+        start = (self.next_slot - n) % self.capacity
+        rows = (start + np.arange(0, n)) % self.capacity
+        return {name: buffer[rows] for name, buffer in self.buffers.items()}
+
+
+def load_history(path):
+    # memory-maps every column of a recorded directory. Returns a dict of
+    # read-only arrays, so long histories are not read into memory
+    with open(os.path.join(path, HEADER_FILE), 'r') as f:
+        header = json.load(f)
+    if header.get('format') != HISTORY_FORMAT:
+        raise ValueError(str(path) + " is not a chicken swarm history")
+    if int(header.get('version', 0)) > HISTORY_VERSION:
+        raise ValueError("history version " + str(header['version']) + \
+                         " is newer than this code supports (" + str(HISTORY_VERSION) + ")")
+    history = {}
+    for name, (dtype, width) in header['columns'].items():
+        file_path = os.path.join(path, name + '.bin')
+        itemsize = np.dtype(dtype).itemsize*int(width)
+        # a run that is still recording may have a partial record at the end
+        n = os.path.getsize(file_path)//itemsize
+        if n == 0:
+            shape = (0,) if width == 1 else (0, width)
+            history[name] = np.zeros(shape, dtype=dtype)
+            continue
+        shape = (n,) if width == 1 else (n, width)
+        history[name] = np.memmap(file_path, dtype=dtype, mode='r', shape=shape)
+    # columns are flushed one at a time, so trim to the shortest
+    n = min(len(column) for column in history.values())
+    return {name: column[:n] for name, column in history.items()}
@@ -0,0 +1,70 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/instrumentation.py'
+#   Phase timers and counters for the chicken swarm.
+#       Times come from time.perf_counter() (monotonic). The swarm
+#       only holds a swarm_stats object when instrumentation is turned
+#       on, so when it is off, each instrumented phase costs a single
+#       'is not None' check.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import time
+
+
+PHASES = ('move_rooster', 'move_hen', 'move_chick',
+          'bounds', 'reorganize', 'global_best', 'objective')
+
+COUNTERS = ('steps', 'generations',
+            'moves_rooster', 'moves_hen', 'moves_chick',
+            'objective_calls', 'objective_failures',
+            'reorganizations', 'global_best_updates')
+
+
+class swarm_stats:
+    # arguments should take the form:
+    # swarm_stats()
+    #
+    # usage in an instrumented phase:
+    #   t = stats.now()
+    #   ... phase ...
+    #   t = stats.lap('phase_name', t)
+
+    def __init__(self):
+        self.reset()
+
+
+    def reset(self):
+        '''
+        self.times  : total seconds spent in each phase of PHASES
+        self.counts : totals for each counter in COUNTERS
+        '''
+        self.times = dict.fromkeys(PHASES, 0.0)
+        self.counts = dict.fromkeys(COUNTERS, 0)
+
+
+    def now(self):
+        return time.perf_counter()
+
+
+    def lap(self, phase, t_start):
+        # adds the time since t_start to phase. Returns the current time,
+        # so that it can be the start of the next phase
+        t = time.perf_counter()
+        self.times[phase] = self.times[phase] + (t - t_start)
+        return t
+
+
+    def count(self, name, n=1):
+        self.counts[name] = self.counts[name] + n
+
+
+    def get_stats(self):
+        return {'times': dict(self.times),
+                'total_time': sum(self.times.values()),
+                'counts': dict(self.counts)}
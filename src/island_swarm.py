@@ -0,0 +1,230 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/island_swarm.py'
+#   Island model for the chicken swarm. Several sub-swarms (islands)
+#       run in separate processes in generation-synchronous mode.
+#       Every migration_interval generations, each island writes its
+#       best chickens to a shared memory block. After a barrier, it
+#       takes migrants from its neighbors to replace its worst
+#       chickens. The neighbors are set by the topology:
+#       'ring':   island i receives from island i-1
+#       'full':   every island receives the best migrants of all others
+#       'random': every island receives from a random other island
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from chicken_swarm import swarm
+from swarm_config import read_options
+from multi_start import quiet_parent
+
+
+# columns of the status array
+DONE = 0
+CONVERGED = 1
+ITERATIONS = 2
+
+
+def shared_arrays(shm, islands, migrants, width):
+    # carves the emigrant, status, and result arrays out of one shared memory block
+    # emigrants: (islands x migrants x width). [position, fitness, fitness norm] per row
+    # status:    (islands x 3). [done, converged, iterations]
+    # results:   (islands x width). best [position, fitness, fitness norm] of each island
+    shapes = [(islands, migrants, width), (islands, 3), (islands, width)]
+    arrays = []
+    offset = 0
+    for shape in shapes:
+        arrays.append(np.ndarray(shape, dtype=np.float64, buffer=shm.buf, offset=offset))
+        offset = offset + int(np.prod(shape))*8
+    return arrays
+
+
+def shared_size(islands, migrants, width):
+    return 8*(islands*migrants*width + islands*3 + islands*width)
+
+
+def run_island(island, seed, shm_name, barrier, islands, migrants, dimensions, output_size,
+               swarm_args, swarm_kwargs, migration_interval, topology, stop_on_converge):
+    # runs in the island process
+    width = dimensions + output_size + 1
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        emigrants, status, results = shared_arrays(shm, islands, migrants, width)
+        swarm_seed, migration_seed = seed.spawn(2)
+        migration_rng = np.random.default_rng(migration_seed)
+        mySwarm = swarm(*swarm_args, parent=quiet_parent(), seed=swarm_seed, **swarm_kwargs)
+
+        # the first generation is evaluated before any migration
+        mySwarm.step_generation(True)
+        mySwarm.evaluate_generation(True)
+        while True:
+            for gen in range(0, migration_interval):
+                if mySwarm.complete():
+                    break
+                mySwarm.step_generation(True)
+                mySwarm.evaluate_generation(True)
+
+            # check the last generation's results so the bests are current
+            mySwarm.check_global_local_generation(mySwarm.Flist_gen, mySwarm.gen_evaluated)
+
+            # publish this island's best chickens and status
+            positions, F = mySwarm.get_best_chickens(migrants)
+            emigrants[island, :, 0:dimensions] = positions
+            emigrants[island, :, dimensions:dimensions+output_size] = F
+            emigrants[island, :, -1] = np.linalg.norm(F, axis=1)
+            status[island] = [mySwarm.complete(), mySwarm.converged(), mySwarm.iter]
+            barrier.wait()
+
+            # every island sees the same status here, so they all stop together
+            stop = np.all(status[:, DONE] > 0) or (stop_on_converge and np.any(status[:, CONVERGED] > 0))
+            if not stop:
+                if topology == 'ring':
+                    sources = [(island - 1) % islands]
+                elif topology == 'full':
+                    sources = [i for i in range(0, islands) if i != island]
+                else:
+                    sources = [(island + migration_rng.integers(1, islands)) % islands]
+                incoming = np.vstack([emigrants[i] for i in sources])
+                best = np.argsort(incoming[:, -1], kind='stable')[:migrants]
+                mySwarm.insert_chickens(incoming[best, 0:dimensions],
+                                        incoming[best, dimensions:dimensions+output_size])
+            # nobody writes new emigrants until every island has read them
+            barrier.wait()
+            if stop:
+                break
+
+        results[island, 0:dimensions] = mySwarm.Gb[0]
+        results[island, dimensions:dimensions+output_size] = mySwarm.F_Gb[0]
+        results[island, -1] = mySwarm.pop.F_Gb_norm
+        status[island] = [1, mySwarm.converged(), mySwarm.iter]
+        mySwarm.close()
+    finally:
+        shm.close()
+
+
+class island_swarm:
+    # arguments should take the form:
+    # island_swarm([[float, float, ...]], [[float, float, ...]], [[float, ...]], float, int,
+    # func, func,
+    # dataFrame,
+    # int, int, int, str,
+    # int or SeedSequence, bool,
+    # dict)
+    #
+    # the first 8 arguments are the same as for swarm(). opt_df sets the size of each island
+    #  and maxit is the iteration limit of each island.
+    # islands: number of sub-swarms (processes)
+    # migration_interval: number of generations between migrations
+    # migrants: number of chickens each island sends per migration
+    # topology: 'ring', 'full', or 'random'
+    # seed: int, SeedSequence, or None. The island seeds are spawned from it
+    # stop_on_converge: stop every island once one reaches E_TOL
+    # swarm_kwargs: other keyword arguments for swarm(). Must be picklable.
+
+    def __init__(self, lbound, ubound, targets, E_TOL, maxit,
+                 obj_func, constr_func,
+                 opt_df,
+                 islands=4, migration_interval=10, migrants=1, topology='ring',
+                 seed=None, stop_on_converge=True,
+                 swarm_kwargs=None):
+
+        if topology not in ('ring', 'full', 'random'):
+            raise ValueError("topology must be 'ring', 'full', or 'random'")
+
+        # converted here so that the workers don't need pandas to unpickle a DataFrame
+        self.swarm_args = (lbound, ubound, targets, E_TOL, maxit, obj_func, constr_func,
+                           read_options(opt_df))
+        self.swarm_kwargs = {} if swarm_kwargs is None else dict(swarm_kwargs)
+        for key in ('parent', 'seed'):
+            if key in self.swarm_kwargs:
+                raise ValueError("'" + key + "' is set by island_swarm")
+
+        self.islands = max(2, int(islands))
+        self.migration_interval = max(1, int(migration_interval))
+        self.migrants = max(1, int(migrants))
+        self.topology = topology
+        self.stop_on_converge = bool(stop_on_converge)
+        self.dimensions = int(np.shape(lbound)[1])
+        self.output_size = len(targets)
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+        self.seeds = self.seed_sequence.spawn(self.islands)
+
+        '''
+        self.results    : per-island dicts from the last run(), in island order
+        '''
+        self.results = []
+
+
+    def run(self):
+        # runs every island to completion. Returns the per-island results
+        width = self.dimensions + self.output_size + 1
+        shm = shared_memory.SharedMemory(create=True,
+                                         size=shared_size(self.islands, self.migrants, width))
+        try:
+            emigrants, status, results = shared_arrays(shm, self.islands, self.migrants, width)
+            emigrants[...] = np.inf
+            status[...] = 0
+            results[...] = np.inf
+
+            barrier = mp.Barrier(self.islands)
+            processes = []
+            for i in range(0, self.islands):
+                p = mp.Process(target=run_island,
+                               args=(i, self.seeds[i], shm.name, barrier, self.islands, self.migrants,
+                                     self.dimensions, self.output_size, self.swarm_args, self.swarm_kwargs,
+                                     self.migration_interval, self.topology, self.stop_on_converge))
+                p.start()
+                processes.append(p)
+
+            failed = False
+            while any(p.is_alive() for p in processes):
+                for p in processes:
+                    p.join(timeout=0.1)
+                    if (p.exitcode is not None) and (p.exitcode != 0) and not failed:
+                        # an island died. release the others from the barrier
+                        failed = True
+                        barrier.abort()
+            for p in processes:
+                p.join()
+            if failed or any(p.exitcode != 0 for p in processes):
+                raise RuntimeError("an island process exited with an error")
+
+            D = self.dimensions
+            out = self.output_size
+            self.results = [{'island': i,
+                             'iterations': int(status[i, ITERATIONS]),
+                             'converged': bool(status[i, CONVERGED]),
+                             'best_eval': float(results[i, -1]),
+                             'solution': np.array(results[i, 0:D]),
+                             'outputs': np.array(results[i, D:D+out])}
+                            for i in range(0, self.islands)]
+        finally:
+            shm.close()
+            shm.unlink()
+        return self.results
+
+
+    def get_optimized_soln(self):
+        # best position over all islands
+        best = int(np.argmin([r['best_eval'] for r in self.results]))
+        return self.results[best]['solution'].reshape(-1, 1)
+
+    def get_optimized_outs(self):
+        best = int(np.argmin([r['best_eval'] for r in self.results]))
+        return self.results[best]['outputs'].reshape(-1, 1)
+
+    def get_convergence_data(self):
+        # total iterations over all islands, and the best fitness norm
+        iteration = int(sum(r['iterations'] for r in self.results))
+        best_eval = float(np.min([r['best_eval'] for r in self.results]))
+        return iteration, best_eval
@@ -12,10 +12,22 @@
 ##--------------------------------------------------------------------\
 
 
+import numpy as np
+
 def constr_F(X):
     F = True
     # objective function/problem constraints
     if (X[2] > X[0]/2) or (X[2] < 0.1):
         F = False
 
-    return F
\ No newline at end of file
+    return F
+
+
+def constr_F_batch(X):
+    # batch version of constr_F. X is an (N x 3) array of positions.
+    # returns a length-N boolean mask that is True where the constraints are met
+    X = np.atleast_2d(X)
+    F = ~((X[:, 2] > X[:, 0]/2) | (X[:, 2] < 0.1))
+    return F
+
+constr_F_batch.batch_capable = True
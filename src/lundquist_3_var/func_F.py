@@ -25,3 +25,21 @@ def func_F(X, NO_OF_OUTS=2):
     
     return F, noErrors
 
+
+def func_F_batch(X, NO_OF_OUTS=2):
+    # batch version of func_F. X is an (N x 3) array of positions.
+    # returns an (N x NO_OF_OUTS) array and a length-N noErrors mask
+    X = np.atleast_2d(X)
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    try:
+        with np.errstate(all='ignore'):
+            F[:, 0] = (X[:, 0]-0.5) ** 2 + (X[:, 1]-0.1) ** 2
+            F[:, 1] = (X[:, 2]-0.2) ** 4
+        noErrors = np.all(np.isfinite(F), axis=1)
+    except:
+        noErrors = np.zeros((np.shape(X)[0]), dtype=bool)
+
+    return F, noErrors
+
+func_F_batch.batch_capable = True
+
@@ -10,10 +10,15 @@
 #   Last update: May 25, 2024
 ##-------------------------------------------------------------------------------\
 
+import os
+import sys
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
 
+# the shared ground truth generator is in src/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ground_truth import problem_grid, reference_front, grid_coordinates
+
 import configs_F as f_c
 # problem constraints - pulled from the function configs for the optimizers
 LOWER_BOUNDS = f_c.LB[0]
@@ -24,75 +29,30 @@ LB_y = LOWER_BOUNDS[1]
 UB_y = UPPER_BOUNDS[1]
 LB_z = LOWER_BOUNDS[2]
 UB_z = UPPER_BOUNDS[2]
-IN_VARS = f_c.IN_VARS
-FUNC_F = f_c.OBJECTIVE_FUNC
-CONSTR_F = f_c.CONSTR_FUNC
 
-# for exporting df to csv
+# for exporting the front to csv
 filename = 'lundquist_3var_pareto_coords_output.csv'
 plotname ='lundquist_3var_plots.png'
 
-def pareto_front(X, Y, minimize=True):
-    pareto_front_X = []
-    pareto_front_Y = []
-
-    if minimize:
-        # Find Pareto front for minimizing objectives
-        pareto_front_Y_max = float('inf')
-        for x, y in sorted(zip(X, Y)):
-            if y < pareto_front_Y_max:
-                pareto_front_X.append(x)
-                pareto_front_Y.append(y)
-                pareto_front_Y_max = y
-    else:
-        # Find Pareto front for maximizing objectives
-        pareto_front_Y_min = float('-inf')
-        for x, y in sorted(zip(X, Y), reverse=True):
-            if y > pareto_front_Y_min:
-                pareto_front_X.append(x)
-                pareto_front_Y.append(y)
-                pareto_front_Y_min = y
-
-    return pareto_front_X, pareto_front_Y
-
-
-# Define range and step size
-x = np.linspace(LB_x, UB_x, 100)
-y = np.linspace(LB_y, UB_y, 100)
-z = np.linspace(LB_z, UB_z, 100)
-
-x_grid = np.array(np.meshgrid(x, y, z)).T.reshape(-1, IN_VARS) 
-
-# Evaluate function + apply constraints
-# this is the same function used by the optimizers, so the format reflects that
-validCoords = [] # the valid x,y coordinates
-paretoCoords = [] #col1: f1, col2: f2
-for c in x_grid:
-    # check if point is in the constraints.
-    point_is_valid = CONSTR_F(c)
-    if point_is_valid == True:
-        # add point to validCoords
-        validCoords.append(c)
-        # pass point to the function to get the minimized F set
-        objective_space, noErr = FUNC_F(c)
-        if noErr == True:
-            paretoCoords.append(objective_space)
-
-
-# Convert validCoords to a NumPy array
-validCoords = np.array(validCoords)
+# Evaluate function + apply constraints over a 100 x 100 x 100 grid.
+# this is the batch version of the function used by the optimizers.
+# Cached in ./ground_truth_cache after the first run
+grid = problem_grid(f_c, 100, cache_dir='ground_truth_cache')
+valid = grid['valid']
+# only the valid points' coordinates are built, from their flat grid indices
+validCoords = grid_coordinates(grid['axes'], np.flatnonzero(valid))
 valid_x = validCoords[:,0]
 valid_y = validCoords[:,1]
 valid_z = validCoords[:,2]
 
-# Convert paretoCoords to a NumPy array
-paretoCoords = np.array(paretoCoords)
-
 # Get the feasible objective space
+paretoCoords = grid['F'][valid] #col1: f1, col2: f2
 objective_x = paretoCoords[:,0]
 objective_y = paretoCoords[:,1]
 # Get the Pareto front from the feasible objective space
-pareto_x, pareto_y = pareto_front(objective_x,objective_y)
+front = reference_front(grid['F'], valid)
+pareto_x = grid['F'][front, 0]
+pareto_y = grid['F'][front, 1]
 
 # Create figure and subplots
 fig = plt.figure(figsize=(14, 7))
@@ -121,18 +81,9 @@ ax2.set_xlabel('$f_{1}(x_1,x_2,x_3)$')
 ax2.set_ylabel('$f_{2}(x_1,x_2,x_3)$')
 ax2.set_title('Pareto Front & Feasible Objective Space')
 
-#data frame for getting the coords for the various pareto fronts
-df = pd.DataFrame({})
-
-# Add two new columns to the dataframe
-x_col = "x"
-y_col = "y"
-df_loop = pd.DataFrame({x_col: pareto_x,
-                        y_col: pareto_y}) #not looped, but using name for consistency
-df = pd.concat([df, df_loop], axis=1) 
-
-# Write DataFrame to CSV
-df.to_csv(filename, index=False)  
+# Write the Pareto front coords to CSV
+np.savetxt(filename, np.column_stack((pareto_x, pareto_y)),
+           delimiter=',', header='x,y', comments='')
 
 # Adjust layout
 plt.tight_layout()
@@ -14,9 +14,9 @@
 ##--------------------------------------------------------------------\
 
 
-import pandas as pd
 import time
 from chicken_swarm import swarm
+from swarm_config import swarm_config
 
 # OBJECTIVE FUNCTION SELECTION
 #import one_dim_x_test.configs_F as func_configs     # single objective, 1D input
@@ -67,18 +67,17 @@ class TestDetails():
         self.allow_update = True      # Allow objective call to update state 
 
         # Constant variables
-        opt_params = {'BOUNDARY': [BOUNDARY],   # int boundary 1 = random,      2 = reflecting
-                                                #              3 = absorbing,   4 = invisible
-                    'RN': [RN],                 # Total number of roosters
-                    'HN': [HN],                 # Total number of hens
-                    'MN': [MN],                 # Number of mother hens in total hens
-                    'CN': [CN],                 # Total number of chicks
-                    'G': [G]}                   # Reorganize groups every G steps 
-
-        opt_df = pd.DataFrame(opt_params)
+        opt_config = swarm_config(BOUNDARY=BOUNDARY,         # int boundary 1 = random,      2 = reflecting
+                                                             #              3 = absorbing,   4 = invisible
+                                  RN=RN,                     # Total number of roosters
+                                  HN=HN,                     # Total number of hens
+                                  MN=MN,                     # Number of mother hens in total hens
+                                  CN=CN,                     # Total number of chicks
+                                  G=G)                       # Reorganize groups every G steps
+
         self.mySwarm = swarm(LB, UB, TARGETS, TOL, MAXIT,
                                 func_F, constr_F,
-                                opt_df,
+                                opt_config,
                                 parent=parent)   
 
 
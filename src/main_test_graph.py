@@ -17,10 +17,10 @@
 
 
 import numpy as np
-import pandas as pd
 import time
 import matplotlib.pyplot as plt
 from chicken_swarm import swarm
+from swarm_config import swarm_config
 
 # OBJECTIVE FUNCTION SELECTION
 #import one_dim_x_test.configs_F as func_configs     # single objective, 1D input
@@ -73,18 +73,17 @@ class TestGraph():
         self.allow_update = True      # Allow objective call to update state 
 
         # Constant variables
-        opt_params = {'BOUNDARY': [BOUNDARY],   # int boundary 1 = random,      2 = reflecting
-                                                #              3 = absorbing,   4 = invisible
-                    'RN': [RN],                 # Total number of roosters
-                    'HN': [HN],                 # Total number of hens
-                    'MN': [MN],                 # Number of mother hens in total hens
-                    'CN': [CN],                 # Total number of chicks
-                    'G': [G]}                   # Reorganize groups every G steps 
-
-        opt_df = pd.DataFrame(opt_params)
+        opt_config = swarm_config(BOUNDARY=BOUNDARY,         # int boundary 1 = random,      2 = reflecting
+                                                             #              3 = absorbing,   4 = invisible
+                                  RN=RN,                     # Total number of roosters
+                                  HN=HN,                     # Total number of hens
+                                  MN=MN,                     # Number of mother hens in total hens
+                                  CN=CN,                     # Total number of chicks
+                                  G=G)                       # Reorganize groups every G steps
+
         self.mySwarm = swarm(LB, UB, TARGETS, TOL, MAXIT,
                                 func_F, constr_F,
-                                opt_df,
+                                opt_config,
                                 parent=parent)  
 
         # Matplotlib setup
@@ -0,0 +1,229 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/multi_start.py'
+#   Runs independent replicas of the chicken swarm across a process
+#       pool. Each replica gets its own seed, spawned from a single
+#       numpy SeedSequence, so a set of replicas can be repeated from
+#       one seed. Convergence data is streamed back while the
+#       replicas run. Once one replica reaches E_TOL, the remaining
+#       replicas can optionally be cancelled.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import os
+import queue
+import numpy as np
+from multiprocessing import Manager
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from chicken_swarm import swarm
+from swarm_config import read_options
+
+
+class quiet_parent:
+    # stand-in parent for the swarm in a worker process.
+    # Keeps swarm messages from being printed by every replica
+    def debug_message_printout(self, msg):
+        pass
+
+    def record_params(self):
+        pass
+
+
+def replica_result(replica, seed):
+    # result dict of a replica that hasn't run. The seed is kept so the
+    # replica can be rerun on its own
+    return {'replica': replica,
+            'entropy': seed.entropy,
+            'spawn_key': tuple(seed.spawn_key),
+            'iterations': 0,
+            'best_eval': np.inf,
+            'converged': False,
+            'cancelled': False,
+            'solution': None,
+            'outputs': None}
+
+
+def run_replica(replica, seed, swarm_args, swarm_kwargs, mode,
+                report_every, progress_queue, cancel_event, cancel_on_converge):
+    # runs in the worker. Returns a dict with the result of one replica
+    result = replica_result(replica, seed)
+
+    if cancel_event.is_set():
+        # another replica already converged
+        result['cancelled'] = True
+        return result
+
+    mySwarm = swarm(*swarm_args, parent=quiet_parent(), seed=seed, **swarm_kwargs)
+    last_report = 0
+    while not mySwarm.complete():
+        if mode == 'generation':
+            mySwarm.step_generation(True)
+            mySwarm.evaluate_generation(True)
+        else:
+            mySwarm.step(True)
+            mySwarm.call_objective(True)
+
+        if (mySwarm.iter - last_report) >= report_every:
+            last_report = mySwarm.iter
+            iteration, best_eval = mySwarm.get_convergence_data()
+            progress_queue.put((replica, iteration, best_eval))
+            if cancel_event.is_set():
+                result['cancelled'] = True
+                break
+
+    iteration, best_eval = mySwarm.get_convergence_data()
+    progress_queue.put((replica, iteration, best_eval))
+    if mySwarm.converged() and cancel_on_converge:
+        cancel_event.set()
+
+    result['iterations'] = iteration
+    result['best_eval'] = best_eval
+    result['converged'] = bool(mySwarm.converged())
+    result['solution'] = np.array(mySwarm.get_optimized_soln()).reshape(-1)
+    result['outputs'] = np.array(mySwarm.get_optimized_outs()).reshape(-1)
+    mySwarm.close()
+    return result
+
+
+class multi_start:
+    # arguments should take the form:
+    # multi_start([[float, float, ...]], [[float, float, ...]], [[float, ...]], float, int,
+    # func, func,
+    # dataFrame,
+    # int, int or SeedSequence, int,
+    # str, bool, int,
+    # dict)
+    #
+    # the first 8 arguments are the same as for swarm()
+    # replicas: number of independent runs
+    # seed: int, SeedSequence, or None. The replica seeds are spawned from it
+    # max_workers: number of worker processes. Defaults to the number of CPUs
+    # mode: 'generation' (step_generation/evaluate_generation) or 'step' (step/call_objective)
+    # cancel_on_converge: stop the remaining replicas once one reaches E_TOL
+    # report_every: number of iterations between progress reports from each replica
+    # swarm_kwargs: other keyword arguments for swarm(). Must be picklable.
+    #
+    # obj_func and constr_func are sent to the worker processes, so they must be
+    # module level functions (like the ones in the problem folders).
+
+    def __init__(self, lbound, ubound, targets, E_TOL, maxit,
+                 obj_func, constr_func,
+                 opt_df,
+                 replicas=20, seed=None, max_workers=None,
+                 mode='generation', cancel_on_converge=False, report_every=100,
+                 swarm_kwargs=None):
+
+        if mode not in ('generation', 'step'):
+            raise ValueError("mode must be 'generation' or 'step'")
+
+        # converted here so that the workers don't need pandas to unpickle a DataFrame
+        self.swarm_args = (lbound, ubound, targets, E_TOL, maxit, obj_func, constr_func,
+                           read_options(opt_df))
+        self.swarm_kwargs = {} if swarm_kwargs is None else dict(swarm_kwargs)
+        for key in ('parent', 'seed'):
+            if key in self.swarm_kwargs:
+                raise ValueError("'" + key + "' is set by multi_start")
+
+        self.replicas = max(1, int(replicas))
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+        # spawned once, so that every run() repeats the same replicas
+        self.seeds = self.seed_sequence.spawn(self.replicas)
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.mode = mode
+        self.cancel_on_converge = bool(cancel_on_converge)
+        self.report_every = max(1, int(report_every))
+
+        '''
+        self.seeds      : per-replica SeedSequence. A replica can be rerun on its own with swarm(..., seed=self.seeds[r])
+        self.history    : per-replica list of (iteration, best_eval) progress reports
+        self.results    : per-replica result dicts from the last run(), in replica order
+        '''
+        self.history = {}
+        self.results = []
+
+
+    def run(self, callback=None):
+        # runs every replica and returns the results, in replica order.
+        # callback(replica, iteration, best_eval) (optional) is called in this
+        # process for every progress report as it arrives
+        seeds = self.seeds
+        self.history = {r: [] for r in range(0, self.replicas)}
+        results = [None]*self.replicas
+
+        with Manager() as manager, ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            progress_queue = manager.Queue()
+            cancel_event = manager.Event()
+            pending = {}
+            for r in range(0, self.replicas):
+                future = executor.submit(run_replica, r, seeds[r], self.swarm_args, self.swarm_kwargs,
+                                         self.mode, self.report_every, progress_queue,
+                                         cancel_event, self.cancel_on_converge)
+                pending[future] = r
+
+            while len(pending) > 0:
+                done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                self.drain(progress_queue, callback)
+                for future in done:
+                    r = pending.pop(future)
+                    results[r] = future.result()
+                if self.cancel_on_converge and cancel_event.is_set():
+                    # replicas that haven't started yet are dropped
+                    for future in list(pending):
+                        if future.cancel():
+                            r = pending.pop(future)
+                            results[r] = replica_result(r, seeds[r])
+                            results[r]['cancelled'] = True
+            self.drain(progress_queue, callback)
+
+        self.results = results
+        return results
+
+
+    def drain(self, progress_queue, callback=None):
+        # moves every waiting progress report into self.history
+        while True:
+            try:
+                replica, iteration, best_eval = progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.history[replica].append((iteration, best_eval))
+            if callback is not None:
+                callback(replica, iteration, best_eval)
+
+
+    def get_summary(self):
+        # best-of-R, median, and spread of the final best_eval of the replicas that ran
+        finished = [r for r in self.results if (r is not None) and (r['solution'] is not None)]
+        if len(finished) == 0:
+            return None
+        evals = np.array([r['best_eval'] for r in finished])
+        best = finished[int(np.argmin(evals))]
+        return {'replicas': len(self.results),
+                'finished': len(finished),
+                'converged': int(sum(r['converged'] for r in finished)),
+                'cancelled': int(sum(r['cancelled'] for r in self.results if r is not None)),
+                'best_replica': best['replica'],
+                'best_eval': float(np.min(evals)),
+                'best_solution': best['solution'],
+                'best_outputs': best['outputs'],
+                'median_eval': float(np.median(evals)),
+                'mean_eval': float(np.mean(evals)),
+                'std_eval': float(np.std(evals)),
+                'worst_eval': float(np.max(evals)),
+                'iqr_eval': float(np.percentile(evals, 75) - np.percentile(evals, 25))}
+
+
+    def get_result_table(self):
+        # one row per replica: [replica, iterations, best_eval, converged, cancelled]
+        table = np.zeros((len(self.results), 5))
+        for i, r in enumerate(self.results):
+            table[i] = [r['replica'], r['iterations'], r['best_eval'], r['converged'], r['cancelled']]
+        return table
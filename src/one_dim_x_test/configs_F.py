@@ -14,16 +14,20 @@ import sys
 
 try: # for outside func calls
     sys.path.insert(0, './chicken_swarm_python/src/')
-    from one_dim_x_test.func_F import func_F
-    from one_dim_x_test.constr_F import constr_F
+    from one_dim_x_test.func_F import func_F, func_F_batch
+    from one_dim_x_test.constr_F import constr_F, constr_F_batch
 except: # for local
-    from func_F import func_F
-    from constr_F import constr_F
+    from func_F import func_F, func_F_batch
+    from constr_F import constr_F, constr_F_batch
 
 OBJECTIVE_FUNC = func_F
+OBJECTIVE_FUNC_BATCH = func_F_batch  # batch-capable version. Takes an (N x IN_VARS) array
 CONSTR_FUNC = constr_F
+CONSTR_FUNC_BATCH = constr_F_batch  # batch-capable version. Returns an N-length mask
 OBJECTIVE_FUNC_NAME = "one_dim_x_test.func_F"
+OBJECTIVE_FUNC_BATCH_NAME = "one_dim_x_test.func_F_batch"
 CONSTR_FUNC_NAME = "one_dim_x_test.constr_F"
+CONSTR_FUNC_BATCH_NAME = "one_dim_x_test.constr_F_batch"
 
 # problem dependent variables
 LB = [[0]]             # Lower boundaries
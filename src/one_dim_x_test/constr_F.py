@@ -9,6 +9,16 @@
 #   Last update: March 30, 2024
 ##-------------------------------------------------------------------------------\
 
+import numpy as np
+
 def constr_F(x):
     F = True
-    return F
\ No newline at end of file
+    return F
+
+
+def constr_F_batch(X):
+    # batch version of constr_F. X is an (N x IN_VARS) array of positions.
+    # returns a length-N boolean mask
+    return np.ones((np.shape(X)[0]), dtype=bool)
+
+constr_F_batch.batch_capable = True
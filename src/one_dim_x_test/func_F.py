@@ -25,3 +25,22 @@ def func_F(X, NO_OF_OUTS=1):
         noErrors = False
 
     return [F], noErrors
+
+
+def func_F_batch(X, NO_OF_OUTS=1):
+    # batch version of func_F. X is an (N x 1) array of positions.
+    # returns an (N x NO_OF_OUTS) array and a length-N noErrors mask
+    X = np.atleast_2d(X)
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    try:
+        with np.errstate(all='ignore'):
+            x = X[:, 0]
+            F[:, 0] = np.sin(5 * x**3) + np.cos(5 * x) * (1 - np.tanh(x ** 2))
+        noErrors = np.all(np.isfinite(F), axis=1)
+    except Exception as e:
+        print(e)
+        noErrors = np.zeros((np.shape(X)[0]), dtype=bool)
+
+    return F, noErrors
+
+func_F_batch.batch_capable = True
@@ -10,33 +10,30 @@
 ##-------------------------------------------------------------------------------\
 
 
+import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 
+# the shared ground truth generator is in src/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ground_truth import problem_grid
+
 import configs_F as f_c
 # problem constraints - pulled from the function configs for the optimizers
 LOWER_BOUNDS = f_c.LB[0]
 UPPER_BOUNDS = f_c.UB[0]
 LB_x = LOWER_BOUNDS[0] 
 UB_x = UPPER_BOUNDS[0]
-FUNC_F = f_c.OBJECTIVE_FUNC
 GLOBAL_MIN = f_c.GLOBAL_MIN
 
 #write out plot
 plotname = "1D_test_plots.png"
 
-# Define range and step size
-X = np.vstack(np.linspace(LB_x, UB_x, 1000))
-# Reshape X to 1D array
-X_flat = X.flatten()
-
-# Evaluate function
-
-Y = []
-for c in X:
-    y, noErr = FUNC_F(c)
-    if noErr == True:
-        Y.append(y)
+# Evaluate function at 1000 points with the batch function
+grid = problem_grid(f_c, 1000)
+X = grid['axes'][0][grid['valid']]
+Y = grid['F'][grid['valid'], 0]
 
 
 # Create figure and subplots
@@ -0,0 +1,119 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/parallel_evaluation.py'
+#   Evaluation backend for dispatching a generation of objective
+#       function calls to a concurrent.futures executor. Results are
+#       returned in the order the positions were passed in, regardless
+#       of the order the calls complete in.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import os
+import numpy as np
+from concurrent.futures import Executor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+
+def evaluate_point(obj_func, position, output_size):
+    # runs in the worker. Exceptions count as a failed evaluation
+    # so that one bad call doesn't take down the whole generation
+    try:
+        newFVals, noError = obj_func(position, output_size)
+        return np.array(newFVals).reshape(-1), bool(noError)
+    except Exception:
+        return np.zeros((output_size)), False
+
+
+def evaluate_chunk(obj_func, positions, output_size):
+    # runs in the worker for batch-capable objective functions
+    try:
+        newFVals, noErrors = obj_func(positions, output_size)
+        newFVals = np.array(newFVals).reshape(len(positions), output_size)
+        noErrors = np.array(noErrors, dtype=bool).reshape(-1)
+        return newFVals, noErrors
+    except Exception:
+        return np.zeros((len(positions), output_size)), np.zeros((len(positions)), dtype=bool)
+
+
+class pool_evaluator:
+    # arguments should take the form:
+    # pool_evaluator(concurrent.futures.Executor OR int,
+    #                int, int)
+    #
+    # evaluator: an existing executor, or a worker count for a new ProcessPoolExecutor.
+    #            An executor that is passed in is not shut down by this class.
+    # max_in_flight: the maximum number of submitted, unfinished calls.
+    #                Defaults to 2x the number of workers.
+    # max_workers: number of workers of an executor that is passed in. Executors
+    #              don't report it, so it defaults to max_in_flight, or else the
+    #              number of CPUs. Ignored when evaluator is a worker count.
+
+    def __init__(self, evaluator, max_in_flight=None, max_workers=None):
+
+        if isinstance(evaluator, Executor):
+            self.executor = evaluator
+            self.owns_executor = False
+            if max_workers is not None:
+                self.max_workers = max(1, int(max_workers))
+            elif max_in_flight is not None:
+                self.max_workers = max(1, int(max_in_flight))
+            else:
+                self.max_workers = os.cpu_count() or 1
+        else:
+            self.max_workers = int(evaluator)
+            if self.max_workers < 1:
+                self.max_workers = os.cpu_count() or 1
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            self.owns_executor = True
+
+        if max_in_flight is None:
+            self.max_in_flight = 2*self.max_workers
+        else:
+            self.max_in_flight = max(1, int(max_in_flight))
+
+
+    def evaluate(self, obj_func, positions, output_size, batch=False):
+        # evaluate each row of positions. Returns an (N x output_size) array
+        # and a length-N noErrors array, both in the row order of positions
+        num_positions = np.shape(positions)[0]
+        Fvals = np.zeros((num_positions, output_size))
+        noErrors = np.zeros((num_positions), dtype=bool)
+
+        if batch:
+            # split into one chunk per worker so each worker gets a single batch call
+            num_chunks = max(1, min(self.max_workers, num_positions))
+            tasks = [(evaluate_chunk, idx, positions[idx])
+                     for idx in np.array_split(np.arange(num_positions), num_chunks) if len(idx) > 0]
+        else:
+            tasks = [(evaluate_point, idx, positions[idx]) for idx in range(0, num_positions)]
+
+        # bounded in-flight queue. Submit up to max_in_flight, then
+        # refill as calls complete
+        pending = {}
+        next_task = 0
+        while (next_task < len(tasks)) or (len(pending) > 0):
+            while (next_task < len(tasks)) and (len(pending) < self.max_in_flight):
+                func, idx, X = tasks[next_task]
+                pending[self.executor.submit(func, obj_func, X, output_size)] = idx
+                next_task = next_task + 1
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx = pending.pop(future)
+                try:
+                    newFVals, noError = future.result()
+                except Exception: # e.g. a worker process that died
+                    continue
+                Fvals[idx] = newFVals
+                noErrors[idx] = noError
+
+        return Fvals, noErrors
+
+
+    def shutdown(self):
+        if self.owns_executor:
+            self.executor.shutdown(wait=True)
@@ -0,0 +1,206 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/pareto_archive.py'
+#   Pareto archive for multi-objective runs of the chicken swarm.
+#       Keeps a bounded set of non-dominated positions seen during a
+#       run. New points are checked against the archive in batches,
+#       and when the archive is over its size limit, the most crowded
+#       points (lowest crowding distance) are removed one at a time.
+#       All objectives are minimized.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+
+
+def dominance_matrix(F):
+    # D[i, j] is True if row i of F dominates row j: no worse in every
+    # objective, and better in at least one
+    F = np.atleast_2d(F)
+    less_equal = np.all(F[:, None, :] <= F[None, :, :], axis=2)
+    less = np.any(F[:, None, :] < F[None, :, :], axis=2)
+    return less_equal & less
+
+
+def non_dominated_mask(F):
+    # True for each row of F (N x objectives) that no other row dominates
+    return ~np.any(dominance_matrix(F), axis=0)
+
+
+def non_dominated_sort(F):
+    # front rank of each row of F. 0 is the non-dominated front, 1 is the
+    # front once rank 0 is removed, and so on. The dominance matrix is built
+    # once, and each front is peeled off by updating the domination counts
+    D = dominance_matrix(F)
+    N = np.shape(D)[0]
+    dominated_by = np.sum(D, axis=0)
+    rank = -1*np.ones((N), dtype=np.int64)
+    current = 0
+    remaining = np.ones((N), dtype=bool)
+    while np.any(remaining):
+        front = remaining & (dominated_by == 0)
+        rank[front] = current
+        remaining = remaining & ~front
+        dominated_by = dominated_by - np.sum(D[front], axis=0)
+        current = current + 1
+    return rank
+
+
+def crowding_distance(F):
+    # crowding distance of each row of F within its own set. The extreme
+    # points of each objective get an infinite distance so they are kept
+    F = np.atleast_2d(F)
+    N, objectives = np.shape(F)
+    distance = np.zeros((N))
+    if N < 3:
+        distance[:] = np.inf
+        return distance
+    for m in range(0, objectives):
+        order = np.argsort(F[:, m], kind='stable')
+        values = F[order, m]
+        span = values[-1] - values[0]
+        distance[order[0]] = np.inf
+        distance[order[-1]] = np.inf
+        if span > 0:
+            distance[order[1:-1]] = distance[order[1:-1]] + (values[2:] - values[:-2])/span
+    return distance
+
+
+def pareto_order(F):
+    # indices of the rows of F sorted by front rank, and within a front by
+    # crowding distance (least crowded first). Used to rank the chickens
+    rank = non_dominated_sort(F)
+    crowding = np.zeros((len(rank)))
+    for r in np.unique(rank):
+        members = np.flatnonzero(rank == r)
+        crowding[members] = crowding_distance(F[members])
+    return np.lexsort((-crowding, rank))
+
+
+class pareto_archive:
+    # arguments should take the form:
+    # pareto_archive(int, int)
+    #
+    # max_size: most points kept. Extra points are removed by crowding distance
+    # batch_size: points added with add_point() are held and checked together
+    #  once this many are waiting (or when the front is read)
+
+    def __init__(self, max_size=100, batch_size=64):
+        self.max_size = max(2, int(max_size))
+        self.batch_size = max(1, int(batch_size))
+
+        '''
+        self.X          : (n x dimensions) positions in the archive
+        self.F          : (n x objectives) objective values used for dominance (the swarm's Flist)
+        self.outputs    : (n x objectives) objective function outputs at those positions
+        self.pending    : points from add_point() that haven't been checked yet
+        '''
+        self.X = None
+        self.F = None
+        self.outputs = None
+        self.pending = []
+
+
+    def __len__(self):
+        self.flush()
+        return 0 if self.F is None else len(self.F)
+
+
+    def add_point(self, x, f, output=None):
+        self.pending.append((np.ravel(x), np.ravel(f), np.ravel(f if output is None else output)))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+
+    def flush(self):
+        if len(self.pending) == 0:
+            return
+        X = np.array([p[0] for p in self.pending])
+        F = np.array([p[1] for p in self.pending])
+        outputs = np.array([p[2] for p in self.pending])
+        self.pending = []
+        self.add(X, F, outputs)
+
+
+    def add(self, X, F, outputs=None):
+        # adds a batch of points. Returns the number that made it into the archive
+        F = np.atleast_2d(np.array(F, dtype=float))
+        X = np.reshape(np.array(X, dtype=float), (len(F), -1))
+        outputs = F if outputs is None else np.reshape(np.array(outputs, dtype=float), np.shape(F))
+        keep = np.all(np.isfinite(F), axis=1)
+        X, F, outputs = X[keep], F[keep], outputs[keep]
+        if len(F) == 0:
+            return 0
+
+        if self.F is not None:
+            # drop the new points that an archived point already matches or beats
+            weakly_dominated = np.any(np.all(self.F[:, None, :] <= F[None, :, :], axis=2), axis=0)
+            X, F, outputs = X[~weakly_dominated], F[~weakly_dominated], outputs[~weakly_dominated]
+            if len(F) == 0:
+                return 0
+            old_count = len(self.F)
+            X = np.vstack((self.X, X))
+            F = np.vstack((self.F, F))
+            outputs = np.vstack((self.outputs, outputs))
+        else:
+            old_count = 0
+
+        keep = non_dominated_mask(F)
+        # identical objective values are only kept once. The older point stays
+        unique = np.zeros((len(F)), dtype=bool)
+        unique[np.unique(F, axis=0, return_index=True)[1]] = True
+        keep = keep & unique
+        added = int(np.count_nonzero(keep[old_count:]))
+        self.X, self.F, self.outputs = X[keep], F[keep], outputs[keep]
+        self.prune()
+        return added
+
+
+    def prune(self):
+        # removes the most crowded point until the archive fits
+        while len(self.F) > self.max_size:
+            worst = np.argmin(crowding_distance(self.F))
+            keep = np.arange(len(self.F)) != worst
+            self.X, self.F, self.outputs = self.X[keep], self.F[keep], self.outputs[keep]
+
+
+    def get_front(self):
+        # returns (positions, objective values, outputs), sorted by the first objective
+        self.flush()
+        if self.F is None:
+            return np.zeros((0, 0)), np.zeros((0, 0)), np.zeros((0, 0))
+        order = np.argsort(self.F[:, 0], kind='stable')
+        return np.array(self.X[order]), np.array(self.F[order]), np.array(self.outputs[order])
+
+
+    def get_arrays(self):
+        # for checkpoints. Kept in archive order, and the unchecked points are saved
+        # as they are, so a resumed run batches and prunes the same way
+        empty = np.zeros((0, 0))
+        arrays = {'X': empty, 'F': empty, 'outputs': empty,
+                  'pending_X': empty, 'pending_F': empty, 'pending_outputs': empty}
+        if self.F is not None:
+            arrays['X'], arrays['F'], arrays['outputs'] = self.X, self.F, self.outputs
+        if len(self.pending) > 0:
+            arrays['pending_X'] = np.array([p[0] for p in self.pending])
+            arrays['pending_F'] = np.array([p[1] for p in self.pending])
+            arrays['pending_outputs'] = np.array([p[2] for p in self.pending])
+        return arrays
+
+
+    def set_arrays(self, arrays):
+        if len(arrays['F']) == 0:
+            self.X, self.F, self.outputs = None, None, None
+        else:
+            self.X = np.array(arrays['X'])
+            self.F = np.array(arrays['F'])
+            self.outputs = np.array(arrays['outputs'])
+        self.pending = []
+        if 'pending_F' in arrays:
+            self.pending = [(np.array(x), np.array(f), np.array(o)) for x, f, o in
+                            zip(arrays['pending_X'], arrays['pending_F'], arrays['pending_outputs'])]
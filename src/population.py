@@ -0,0 +1,121 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/population.py'
+#   Struct-of-arrays container for the chicken swarm population.
+#       Every state array has a fixed dtype and is allocated once.
+#       Updates happen in place, and the per-particle fitness norms
+#       are kept in sync with the personal best fitness values.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+import sys
+
+
+class population:
+    # arguments should take the form:
+    # population(int, int, int)
+    #
+    # number_of_particles: total number of chickens
+    # dimensions: number of input variables (length of a position)
+    # output_size: number of objective function outputs
+
+    __slots__ = ('number_of_particles', 'dimensions', 'output_size',
+                 'M', 'Pb', 'F_Pb', 'F_Pb_norm', 'Active',
+                 'chicken_class', 'group', 'mother',
+                 'Gb', 'F_Gb', 'F_Gb_norm')
+
+    def __init__(self, number_of_particles, dimensions, output_size):
+        self.number_of_particles = int(number_of_particles)
+        self.dimensions = int(dimensions)
+        self.output_size = int(output_size)
+
+        N = self.number_of_particles
+        '''
+        self.M              : (N x dimensions) float64. Current chicken locations.
+        self.Pb             : (N x dimensions) float64. Personal best locations.
+        self.F_Pb           : (N x output_size) float64. Personal best fitness values.
+        self.F_Pb_norm      : (N) float64. L2 norm of each row of F_Pb.
+        self.Active         : (N) bool. Activity status of each chicken (e.g., in bounds).
+        self.chicken_class  : (N) int8. 0 = rooster, 1 = hen, 2 = mother hen, 3 = chick
+        self.group          : (N) int32. Group (rooster index) each chicken belongs to.
+        self.mother         : (N) int32. Mother hen index of each chick. -1 for non-chicks.
+        self.Gb             : (1 x dimensions) float64. Global best location.
+        self.F_Gb           : (1 x output_size) float64. Global best fitness value.
+        self.F_Gb_norm      : float. L2 norm of F_Gb.
+        '''
+        self.M = np.zeros((N, self.dimensions), dtype=np.float64)
+        self.Pb = sys.maxsize*np.ones((N, self.dimensions), dtype=np.float64)
+        self.F_Pb = sys.maxsize*np.ones((N, self.output_size), dtype=np.float64)
+        self.F_Pb_norm = np.linalg.norm(self.F_Pb, axis=1)
+        self.Active = np.ones((N), dtype=bool)
+        self.chicken_class = np.zeros((N), dtype=np.int8)
+        self.group = np.zeros((N), dtype=np.int32)
+        self.mother = -1*np.ones((N), dtype=np.int32)
+        self.Gb = sys.maxsize*np.ones((1, self.dimensions), dtype=np.float64)
+        self.F_Gb = sys.maxsize*np.ones((1, self.output_size), dtype=np.float64)
+        self.F_Gb_norm = float(np.linalg.norm(self.F_Gb))
+
+
+    def set_array(self, name, value):
+        # copy value into an existing state array, keeping its dtype and shape.
+        # Used when state is set from outside (e.g. import_swarm()).
+        arr = getattr(self, name)
+        value = np.asarray(value, dtype=arr.dtype)
+        if np.size(value) != np.size(arr):
+            raise ValueError("population." + name + " expects " + str(np.size(arr)) + \
+                             " values, got " + str(np.size(value)))
+        arr[...] = value.reshape(np.shape(arr))
+        if name in ('F_Pb', 'F_Gb'):
+            self.refresh_norms()
+
+
+    def refresh_norms(self):
+        self.F_Pb_norm[:] = np.linalg.norm(self.F_Pb, axis=1)
+        self.F_Gb_norm = float(np.linalg.norm(self.F_Gb))
+
+
+    def update_personal_best(self, particles, F, positions, F_norms=None):
+        # F is (len(particles) x output_size), positions is (len(particles) x dimensions).
+        # F_norms can be passed in if the caller already has them
+        F = np.reshape(F, (-1, self.output_size))
+        if F_norms is None:
+            F_norms = np.linalg.norm(F, axis=1)
+        self.F_Pb[particles] = F
+        self.F_Pb_norm[particles] = F_norms
+        self.Pb[particles] = positions
+
+
+    def update_global_best(self, F, position, F_norm=None):
+        # F_norm can be passed in if the caller already has it
+        self.F_Gb[0] = np.reshape(F, -1)
+        self.Gb[0] = np.reshape(position, -1)
+        if F_norm is None:
+            F_norm = np.linalg.norm(self.F_Gb)
+        self.F_Gb_norm = float(F_norm)
+
+
+    def permute(self, order):
+        # reorder every per-particle array by order (e.g. sorted by fitness).
+        # The hierarchy is rebuilt after a permute, so it isn't moved here.
+        self.M[:] = self.M[order]
+        self.Pb[:] = self.Pb[order]
+        self.F_Pb[:] = self.F_Pb[order]
+        self.F_Pb_norm[:] = self.F_Pb_norm[order]
+        self.Active[:] = self.Active[order]
+
+
+    def set_hierarchy(self, chicken_class, group, mother):
+        self.chicken_class[:] = chicken_class
+        self.group[:] = group
+        self.mother[:] = mother
+
+
+    def get_chicken_info(self):
+        # legacy (N x 3) float array of [CLASSIFICATION, GROUP, MOTHER-HEN-ID]
+        return np.column_stack([self.chicken_class, self.group, self.mother]).astype(np.float64)
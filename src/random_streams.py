@@ -0,0 +1,222 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/random_streams.py'
+#   Seeded random streams for the chicken swarm.
+#       One SeedSequence seeds an independent stream for each role
+#       (initialization, bounds resampling outside of a move, and
+#       hierarchy assignment), so the draws of one role don't shift the
+#       draws of another. The move draws are keyed instead of streamed:
+#       random_block draws the numbers for pass (or generation) k from
+#       a counter-based Philox generator keyed by (role, k), and a
+#       particle's resampling and hen fallback draws come from one
+#       keyed by (role, k, particle). A particle gets the same numbers no
+#       matter what order the particles are moved in, or which mode
+#       moves them.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import numpy as np
+from numpy.random import Generator, SeedSequence
+
+
+BIT_GENERATORS = {'MT19937': np.random.MT19937,
+                  'PCG64': np.random.PCG64,
+                  'PCG64DXSM': np.random.PCG64DXSM,
+                  'Philox': np.random.Philox,
+                  'SFC64': np.random.SFC64}
+
+# roles with a stream that is drawn from in order
+ROLES = ('init', 'bounds', 'hierarchy')
+# roles whose draws are keyed by the pass and particle. See keyed_generator()
+KEYED_ROLES = ('rooster', 'hen', 'chick', 'bounds')
+
+
+class random_streams:
+    # arguments should take the form:
+    # random_streams(int, str)
+    #
+    # seed: int, numpy SeedSequence, or None for a random seed
+    # bit_generator: name from BIT_GENERATORS
+
+    def __init__(self, seed=None, bit_generator='MT19937'):
+        if bit_generator not in BIT_GENERATORS:
+            raise ValueError("unknown bit generator " + str(bit_generator) + \
+                             ". Options are " + ", ".join(BIT_GENERATORS.keys()))
+        '''
+        self.seed_seq       : root SeedSequence. Its entropy repeats the run
+        self.bit_generator  : name of the bit generator type
+        self.generators     : dict of role to numpy Generator
+        self.keys           : dict of keyed role to its Philox key
+        '''
+        self.seed_seq = seed if isinstance(seed, SeedSequence) else SeedSequence(seed)
+        self.bit_generator = bit_generator
+        self.generators = {role: Generator(BIT_GENERATORS[bit_generator](self.child_seed((i,))))
+                           for i, role in enumerate(ROLES)}
+        self.set_keys()
+
+
+    def set_keys(self):
+        # one Philox key per keyed role, from the root seed
+        self.keys = {role: self.child_seed((len(ROLES) + i,)).generate_state(2, np.uint64)
+                     for i, role in enumerate(KEYED_ROLES)}
+
+
+    def child_seed(self, key):
+        # SeedSequence for a spawn key under the root. Unlike spawn(), this doesn't
+        # change the root, so the same key always gives the same stream
+        return SeedSequence(self.seed_seq.entropy,
+                            spawn_key=tuple(self.seed_seq.spawn_key) + tuple(key),
+                            pool_size=self.seed_seq.pool_size)
+
+
+    def get(self, role):
+        return self.generators[role]
+
+
+    def keyed_generator(self, role, block, particle=None):
+        # new Generator for a keyed role. The same (role, block, particle) always gives
+        # the same numbers, so the draws don't depend on what was drawn before.
+        # particle is None for the whole block. Philox is counter-based, so
+        # (block, particle) is set as the starting counter under the role's key
+        # instead of seeding a new state. The first counter word is left for the draws
+        if particle is None:
+            counter = [0, 0, int(block), 0]
+        else:
+            counter = [0, int(particle), int(block), 1]
+        return Generator(np.random.Philox(key=self.keys[role], counter=counter))
+
+
+    def get_state(self):
+        return {'bit_generator': self.bit_generator,
+                'entropy': self.seed_seq.entropy,
+                'spawn_key': [int(k) for k in self.seed_seq.spawn_key],
+                'streams': {role: rng.bit_generator.state for role, rng in self.generators.items()}}
+
+
+    def set_state(self, state):
+        # restores the state from get_state(). The bit generator type is swapped if needed
+        if state['bit_generator'] != self.bit_generator:
+            self.bit_generator = state['bit_generator']
+            self.generators = {role: Generator(BIT_GENERATORS[self.bit_generator]())
+                               for role in ROLES}
+        self.seed_seq = SeedSequence(state['entropy'], spawn_key=tuple(state['spawn_key']))
+        self.set_keys()
+        # streams for roles that are no longer streamed (older checkpoints) are skipped
+        for role, rng_state in state['streams'].items():
+            if role in self.generators:
+                self.generators[role].bit_generator.state = rng_state
+
+
+class random_block:
+    # arguments should take the form:
+    # random_block(random_streams, int, int, int, int)
+    #
+    # streams: random_streams the block is drawn from
+    # number_of_particles: rows in the block. Row i is used by particle i
+    # RN: number of roosters (the range of the random rooster index)
+    # dimensions: number of input variables, for the resampling draws
+    # partner_draws: candidate partners drawn for each hen. The first valid one is used
+    #
+    # Every random number the move operators need for one pass over the swarm
+    # is drawn in bulk, so that a single particle move only indexes arrays
+    # instead of making several scalar Generator calls. Pass k is drawn from
+    # generators keyed by (role, k), so row i is the same for particle i whether
+    # the particles are moved one at a time or all at once. The block is empty
+    # until the first refill(), so building one doesn't draw anything.
+
+    ARRAYS = ('rooster_idx', 'rooster_normal', 'partners', 'hen_uniform', 'chick_FL',
+              'resample', 'resample_used', 'used', 'block')
+
+    def __init__(self, streams, number_of_particles, RN, dimensions, partner_draws=6):
+        self.streams = streams
+        self.number_of_particles = int(number_of_particles)
+        self.RN = max(1, int(RN))
+        self.dimensions = int(dimensions)
+        self.partner_draws = max(1, int(partner_draws))
+
+        '''
+        self.rooster_idx    : random rooster compared against by each rooster
+        self.rooster_normal : standard normal draw for each rooster move
+        self.partners       : (N x partner_draws) candidate random chickens for each hen
+        self.hen_uniform    : (N x 2) uniform draws for the two hen move terms
+        self.chick_FL       : 0 or 2 for each chick
+        self.resample       : (N x D) uniform draws for each particle's first resampling pass
+        self.resample_used  : True for rows whose resample draws have been handed out
+        self.used           : True for rows that have been handed out since the last refill
+        self.block          : index of the current pass. -1 before the first refill
+        self.generators     : keyed Generators made for single particles in this pass
+        '''
+        N = self.number_of_particles
+        self.rooster_idx = np.zeros((N), dtype=np.int64)
+        self.rooster_normal = np.zeros((N))
+        self.partners = np.zeros((N, self.partner_draws), dtype=np.int64)
+        self.hen_uniform = np.zeros((N, 2))
+        self.chick_FL = np.zeros((N), dtype=np.int64)
+        self.resample = np.zeros((N, self.dimensions))
+        self.resample_used = np.ones((N), dtype=bool)
+        self.used = np.ones((N), dtype=bool)
+        self.block = -1
+        self.generators = {}
+
+
+    def refill(self):
+        # draws the next pass. Each role draws from its own generator for this pass
+        N = self.number_of_particles
+        self.block = self.block + 1
+        rooster_rng = self.streams.keyed_generator('rooster', self.block)
+        hen_rng = self.streams.keyed_generator('hen', self.block)
+        chick_rng = self.streams.keyed_generator('chick', self.block)
+        bounds_rng = self.streams.keyed_generator('bounds', self.block)
+        self.rooster_idx = rooster_rng.integers(0, self.RN, size=N)
+        self.rooster_normal = rooster_rng.standard_normal(N)
+        self.partners = hen_rng.integers(0, N, size=(N, self.partner_draws))
+        self.hen_uniform = hen_rng.random((N, 2))
+        self.chick_FL = 2*chick_rng.integers(0, 2, size=N)
+        self.resample = bounds_rng.random((N, self.dimensions))
+        self.resample_used = np.zeros((N), dtype=bool)
+        self.used = np.zeros((N), dtype=bool)
+        self.generators = {}
+
+
+    def take(self, particle):
+        # marks a particle's row as used. If the particle already used its
+        # row, a new pass has started and the block is refilled first
+        if self.used[particle]:
+            self.refill()
+        self.used[particle] = True
+
+
+    def generator(self, role, particle):
+        # Generator for the draws one particle makes in this pass that can't be
+        # pre-drawn: hen partner redraws and repeated bounds resampling, where the
+        # number of draws isn't known. Made on first use, and kept until the next refill
+        key = (role, int(particle))
+        if key not in self.generators:
+            self.generators[key] = self.streams.keyed_generator(role, self.block, particle)
+        return self.generators[key]
+
+
+    def resample_draws(self, particle, count):
+        # uniform draws for one resampling pass of a particle. The first pass in a
+        # pass over the swarm uses the pre-drawn row. Later ones draw from the
+        # particle's bounds generator
+        if (not self.resample_used[particle]) and (count == self.dimensions):
+            self.resample_used[particle] = True
+            return self.resample[particle]
+        return self.generator('bounds', particle).random(count)
+
+
+    def get_arrays(self):
+        return {name: np.array(getattr(self, name)) for name in self.ARRAYS}
+
+
+    def set_arrays(self, arrays):
+        for name in self.ARRAYS:
+            setattr(self, name, np.array(arrays[name]))
+        self.block = int(self.block)
+        self.generators = {}
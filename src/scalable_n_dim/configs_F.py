@@ -0,0 +1,87 @@
+#! /usr/bin/python3
+
+##-------------------------------------------------------------------------------\
+#   chicken_swarm_python
+#   '.src/scalable_n_dim/configs_F.py'
+#   configurations for the scalable test functions. FUNCTION and IN_VARS
+#       set the module level values used by the example scripts.
+#       scaled_configs() returns the values for any function and
+#       number of input variables (used by benchmark.py).
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##-------------------------------------------------------------------------------\
+
+
+import sys
+import numpy as np
+
+try: # for outside func calls
+    sys.path.insert(0, './chicken_swarm_python/src/')
+    import scalable_n_dim.func_F as func_F
+    from scalable_n_dim.constr_F import constr_F, constr_F_batch
+except: # for local
+    import func_F
+    from constr_F import constr_F, constr_F_batch
+
+
+# [lower bound, upper bound, number of outputs, optimum position (per input)]
+# the optimum position is None for the multi objective functions
+FUNCTION_SETTINGS = {'rastrigin':  [-5.12, 5.12, 1, 0.0],
+                     'rosenbrock': [-5.0, 10.0, 1, 1.0],
+                     'ackley':     [-32.768, 32.768, 1, 0.0],
+                     'schwefel':   [-500.0, 500.0, 1, 420.9687462275036],
+                     'zdt1':       [0.0, 1.0, 2, None],
+                     'dtlz2':      [0.0, 1.0, 3, None]}
+
+
+def scaled_configs(dimensions, function='rastrigin', out_vars=None):
+    # returns a dict with the same values as the module level configs.
+    # out_vars only applies to dtlz2 (default 3), which needs dimensions >= out_vars
+    if function not in FUNCTION_SETTINGS:
+        raise ValueError("unknown function " + str(function) + \
+                         ". Options are " + ", ".join(FUNCTION_SETTINGS.keys()))
+    lower, upper, outs, optimum = FUNCTION_SETTINGS[function]
+    dimensions = int(dimensions)
+    if (function == 'dtlz2') and (out_vars is not None):
+        outs = int(out_vars)
+    if (function == 'dtlz2') and (dimensions < outs):
+        raise ValueError("dtlz2 needs at least as many inputs as outputs")
+    if (function == 'rosenbrock') and (dimensions < 2):
+        raise ValueError("rosenbrock needs at least 2 inputs")
+
+    return {'LB': [[lower]*dimensions],
+            'UB': [[upper]*dimensions],
+            'IN_VARS': dimensions,
+            'OUT_VARS': outs,
+            'TARGETS': [0]*outs,
+            'GLOBAL_MIN': None if optimum is None else [[optimum]*dimensions],
+            'OBJECTIVE_FUNC': getattr(func_F, 'func_F_' + function),
+            'OBJECTIVE_FUNC_BATCH': getattr(func_F, 'func_F_' + function + '_batch'),
+            'CONSTR_FUNC': constr_F,
+            'CONSTR_FUNC_BATCH': constr_F_batch,
+            'OBJECTIVE_FUNC_NAME': "scalable_n_dim.func_F_" + function,
+            'OBJECTIVE_FUNC_BATCH_NAME': "scalable_n_dim.func_F_" + function + "_batch"}
+
+
+# problem selection for the example scripts
+FUNCTION = 'rastrigin'      # rastrigin, rosenbrock, ackley, schwefel, zdt1, dtlz2
+IN_VARS = 30                # Number of input variables (x-values)
+
+DEFAULT_CONFIGS = scaled_configs(IN_VARS, FUNCTION)
+
+OBJECTIVE_FUNC = DEFAULT_CONFIGS['OBJECTIVE_FUNC']
+OBJECTIVE_FUNC_BATCH = DEFAULT_CONFIGS['OBJECTIVE_FUNC_BATCH']  # batch-capable version. Takes an (N x IN_VARS) array
+CONSTR_FUNC = constr_F
+CONSTR_FUNC_BATCH = constr_F_batch  # batch-capable version. Returns an N-length mask
+OBJECTIVE_FUNC_NAME = DEFAULT_CONFIGS['OBJECTIVE_FUNC_NAME']
+OBJECTIVE_FUNC_BATCH_NAME = DEFAULT_CONFIGS['OBJECTIVE_FUNC_BATCH_NAME']
+CONSTR_FUNC_NAME = "scalable_n_dim.constr_F"
+CONSTR_FUNC_BATCH_NAME = "scalable_n_dim.constr_F_batch"
+
+# problem dependent variables
+LB = DEFAULT_CONFIGS['LB']                 # Lower boundaries
+UB = DEFAULT_CONFIGS['UB']                 # Upper boundaries
+OUT_VARS = DEFAULT_CONFIGS['OUT_VARS']     # Number of output variables (y-values)
+TARGETS = DEFAULT_CONFIGS['TARGETS']       # Target values for output
+GLOBAL_MIN = DEFAULT_CONFIGS['GLOBAL_MIN'] # Global minima, if they exist
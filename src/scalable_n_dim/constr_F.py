@@ -0,0 +1,25 @@
+#! /usr/bin/python3
+
+##-------------------------------------------------------------------------------\
+#   chicken_swarm_python
+#   '.src/scalable_n_dim/constr_F.py'
+#   constraints function for function compatable with project optimizers.
+#       The scalable test functions only use the bounds.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##-------------------------------------------------------------------------------\
+
+import numpy as np
+
+def constr_F(x):
+    F = True
+    return F
+
+
+def constr_F_batch(X):
+    # batch version of constr_F. X is an (N x IN_VARS) array of positions.
+    # returns a length-N boolean mask
+    return np.ones((np.shape(X)[0]), dtype=bool)
+
+constr_F_batch.batch_capable = True
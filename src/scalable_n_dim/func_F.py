@@ -0,0 +1,172 @@
+#! /usr/bin/python3
+
+##-------------------------------------------------------------------------------\
+#   chicken_swarm_python
+#   '.src/scalable_n_dim/func_F.py'
+#   Scalable test functions with any number of input variables.
+#       Single objective: rastrigin, rosenbrock, ackley, schwefel.
+#       Multi objective: zdt1 (2 outputs), dtlz2 (NO_OF_OUTS outputs).
+#       Each function has a batch form, func_F_<name>_batch(X, NO_OF_OUTS),
+#       that takes an (N x IN_VARS) array, and a single point form,
+#       func_F_<name>(X, NO_OF_OUTS), with the same signature as the
+#       other problem packages.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##-------------------------------------------------------------------------------\
+
+import numpy as np
+
+
+# FUNCTION VALUES
+# each takes an (N x IN_VARS) array and returns an (N x NO_OF_OUTS) array
+
+def rastrigin(X, NO_OF_OUTS=1):
+    # global min 0 at x = [0, ..., 0]. bounds [-5.12, 5.12]
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    F[:, 0] = 10*np.shape(X)[1] + np.sum(X**2 - 10*np.cos(2*np.pi*X), axis=1)
+    return F
+
+
+def rosenbrock(X, NO_OF_OUTS=1):
+    # global min 0 at x = [1, ..., 1]. bounds [-5, 10]
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    F[:, 0] = np.sum(100*(X[:, 1:] - X[:, :-1]**2)**2 + (1 - X[:, :-1])**2, axis=1)
+    return F
+
+
+def ackley(X, NO_OF_OUTS=1):
+    # global min 0 at x = [0, ..., 0]. bounds [-32.768, 32.768]
+    n = np.shape(X)[1]
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    F[:, 0] = -20*np.exp(-0.2*np.sqrt(np.sum(X**2, axis=1)/n)) \
+              - np.exp(np.sum(np.cos(2*np.pi*X), axis=1)/n) + 20 + np.e
+    return F
+
+
+def schwefel(X, NO_OF_OUTS=1):
+    # global min ~0 at x = [420.9687, ..., 420.9687]. bounds [-500, 500]
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    F[:, 0] = 418.9828872724338*np.shape(X)[1] - np.sum(X*np.sin(np.sqrt(np.abs(X))), axis=1)
+    return F
+
+
+def zdt1(X, NO_OF_OUTS=2):
+    # 2 objectives. Pareto front f2 = 1 - sqrt(f1), f1 in [0, 1],
+    # where x[1:] = 0. bounds [0, 1]
+    F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+    n = np.shape(X)[1]
+    f1 = X[:, 0]
+    if n > 1:
+        g = 1 + 9*np.sum(X[:, 1:], axis=1)/(n - 1)
+    else:
+        g = np.ones((np.shape(X)[0]))
+    F[:, 0] = f1
+    F[:, 1] = g*(1 - np.sqrt(f1/g))
+    return F
+
+
+def dtlz2(X, NO_OF_OUTS=3):
+    # NO_OF_OUTS objectives. Pareto front is the positive part of the unit
+    # sphere (sum of f^2 = 1), where x[NO_OF_OUTS-1:] = 0.5. bounds [0, 1].
+    # IN_VARS must be at least NO_OF_OUTS
+    M = NO_OF_OUTS
+    F = np.zeros((np.shape(X)[0], M))
+    g = np.sum((X[:, M-1:] - 0.5)**2, axis=1)
+    angles = X[:, :M-1]*np.pi/2
+    for m in range(0, M):
+        f = 1 + g
+        f = f*np.prod(np.cos(angles[:, :M-1-m]), axis=1)
+        if m > 0:
+            f = f*np.sin(angles[:, M-1-m])
+        F[:, m] = f
+    return F
+
+
+FUNCTIONS = {'rastrigin': rastrigin,
+             'rosenbrock': rosenbrock,
+             'ackley': ackley,
+             'schwefel': schwefel,
+             'zdt1': zdt1,
+             'dtlz2': dtlz2}
+
+
+def evaluate_batch(func, X, NO_OF_OUTS):
+    # shared batch wrapper. returns an (N x NO_OF_OUTS) array and a length-N noErrors mask
+    X = np.atleast_2d(X)
+    try:
+        with np.errstate(all='ignore'):
+            F = func(X, NO_OF_OUTS)
+        noErrors = np.all(np.isfinite(F), axis=1)
+    except:
+        F = np.zeros((np.shape(X)[0], NO_OF_OUTS))
+        noErrors = np.zeros((np.shape(X)[0]), dtype=bool)
+    return F, noErrors
+
+
+def evaluate_point(func, X, NO_OF_OUTS):
+    # shared single point wrapper. returns a NO_OF_OUTS array and a bool
+    F, noErrors = evaluate_batch(func, np.reshape(X, (1, -1)), NO_OF_OUTS)
+    return F[0], bool(noErrors[0])
+
+
+# OBJECTIVE FUNCTIONS
+# module level so they can be sent to worker processes
+
+def func_F_rastrigin(X, NO_OF_OUTS=1):
+    return evaluate_point(rastrigin, X, NO_OF_OUTS)
+
+def func_F_rastrigin_batch(X, NO_OF_OUTS=1):
+    return evaluate_batch(rastrigin, X, NO_OF_OUTS)
+
+def func_F_rosenbrock(X, NO_OF_OUTS=1):
+    return evaluate_point(rosenbrock, X, NO_OF_OUTS)
+
+def func_F_rosenbrock_batch(X, NO_OF_OUTS=1):
+    return evaluate_batch(rosenbrock, X, NO_OF_OUTS)
+
+def func_F_ackley(X, NO_OF_OUTS=1):
+    return evaluate_point(ackley, X, NO_OF_OUTS)
+
+def func_F_ackley_batch(X, NO_OF_OUTS=1):
+    return evaluate_batch(ackley, X, NO_OF_OUTS)
+
+def func_F_schwefel(X, NO_OF_OUTS=1):
+    return evaluate_point(schwefel, X, NO_OF_OUTS)
+
+def func_F_schwefel_batch(X, NO_OF_OUTS=1):
+    return evaluate_batch(schwefel, X, NO_OF_OUTS)
+
+def func_F_zdt1(X, NO_OF_OUTS=2):
+    return evaluate_point(zdt1, X, NO_OF_OUTS)
+
+def func_F_zdt1_batch(X, NO_OF_OUTS=2):
+    return evaluate_batch(zdt1, X, NO_OF_OUTS)
+
+def func_F_dtlz2(X, NO_OF_OUTS=3):
+    return evaluate_point(dtlz2, X, NO_OF_OUTS)
+
+def func_F_dtlz2_batch(X, NO_OF_OUTS=3):
+    return evaluate_batch(dtlz2, X, NO_OF_OUTS)
+
+for func in (func_F_rastrigin_batch, func_F_rosenbrock_batch, func_F_ackley_batch,
+             func_F_schwefel_batch, func_F_zdt1_batch, func_F_dtlz2_batch):
+    func.batch_capable = True
+
+
+def pareto_front(function, num_points=100, NO_OF_OUTS=None):
+    # samples of the known Pareto front of the multi objective functions,
+    # as a (num_points x NO_OF_OUTS) array
+    if function == 'zdt1':
+        f1 = np.linspace(0, 1, num_points)
+        return np.column_stack([f1, 1 - np.sqrt(f1)])
+    if function == 'dtlz2':
+        M = 3 if NO_OF_OUTS is None else int(NO_OF_OUTS)
+        if M == 2:
+            theta = np.linspace(0, np.pi/2, num_points)
+            return np.column_stack([np.cos(theta), np.sin(theta)])
+        # points on the positive part of the unit sphere
+        rng = np.random.default_rng(0)
+        P = np.abs(rng.standard_normal((num_points, M)))
+        return P/np.linalg.norm(P, axis=1, keepdims=True)
+    raise ValueError(function + " is not a multi objective function")
@@ -0,0 +1,110 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/stopping.py'
+#   Early stopping criteria for the chicken swarm.
+#       Adds to converged() and maxed():
+#       patience:        no improvement in the best norm over W generations
+#       diversity:       the position spread collapsed below a threshold
+#       time:            wall-clock budget in seconds
+#       evaluations:     objective call budget
+#       The first criterion to fire is kept as the stop reason.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+import time
+
+
+STOP_REASONS = ('converged', 'maxit', 'patience', 'diversity', 'time', 'evaluations', 'no_active')
+
+
+class stopping_criteria:
+    # arguments should take the form:
+    # stopping_criteria(int, float, float, float, int)
+    #
+    # patience: number of generations without an improvement of more than
+    #  min_delta in the best norm before stopping. None to turn off.
+    # min_delta: smallest decrease of the best norm that counts as an improvement
+    # min_diversity: stop when the spread of the positions (norm of the
+    #  per-dimension standard deviation) falls below this. None to turn off.
+    # max_time: wall-clock budget in seconds, counted from start(). None to turn off.
+    # max_evaluations: objective call budget. None to turn off.
+    #
+    # In the scalar mode, a generation is one pass over the swarm.
+
+    def __init__(self, patience=None, min_delta=0.0, min_diversity=None,
+                 max_time=None, max_evaluations=None):
+        self.patience = None if patience is None else max(1, int(patience))
+        self.min_delta = float(min_delta)
+        self.min_diversity = None if min_diversity is None else float(min_diversity)
+        self.max_time = None if max_time is None else float(max_time)
+        self.max_evaluations = None if max_evaluations is None else int(max_evaluations)
+        self.start()
+
+
+    def start(self):
+        '''
+        self.start_time     : time.perf_counter() when the budget started
+        self.best_eval      : best norm at the last improvement
+        self.stale          : generations since the last improvement
+        self.reason         : name of the criterion that fired. None while running
+        '''
+        self.start_time = time.perf_counter()
+        self.best_eval = None
+        self.stale = 0
+        self.reason = None
+
+
+    def elapsed(self):
+        return time.perf_counter() - self.start_time
+
+
+    def end_generation(self, best_eval, spread_norm):
+        # called once per generation with the global best norm and the
+        # position spread. Returns the stop reason, or None
+        if self.reason is not None:
+            return self.reason
+        if self.patience is not None:
+            if (self.best_eval is None) or (best_eval < self.best_eval - self.min_delta):
+                self.best_eval = best_eval
+                self.stale = 0
+            else:
+                self.stale = self.stale + 1
+                if self.stale >= self.patience:
+                    self.reason = 'patience'
+        if (self.reason is None) and (self.min_diversity is not None) and \
+           (spread_norm < self.min_diversity):
+            self.reason = 'diversity'
+        return self.reason
+
+
+    def check_budget(self, evaluations):
+        # called after each evaluation with the number of objective calls so far.
+        # Returns the stop reason, or None
+        if self.reason is not None:
+            return self.reason
+        if (self.max_evaluations is not None) and (evaluations >= self.max_evaluations):
+            self.reason = 'evaluations'
+        elif (self.max_time is not None) and (self.elapsed() >= self.max_time):
+            self.reason = 'time'
+        return self.reason
+
+
+    def get_state(self):
+        # JSON-compatible state, for checkpoints
+        return {'reason': self.reason,
+                'best_eval': None if self.best_eval is None else float(self.best_eval),
+                'stale_generations': self.stale,
+                'elapsed': self.elapsed()}
+
+
+    def set_state(self, state):
+        # restores the state from get_state(). The time budget continues from the elapsed time
+        self.reason = state['reason']
+        self.best_eval = state['best_eval']
+        self.stale = int(state['stale_generations'])
+        self.start_time = time.perf_counter() - float(state['elapsed'])
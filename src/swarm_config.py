@@ -0,0 +1,73 @@
+#! /usr/bin/python3
+
+##--------------------------------------------------------------------\
+#   chicken_swarm_python
+#   './chicken_swarm_python/src/swarm_config.py'
+#   Tuning parameters for the chicken swarm.
+#       swarm_config holds the six values that used to be read from
+#       a one-row pandas DataFrame. read_options() accepts a
+#       swarm_config, a dict, or a DataFrame, so pandas is never
+#       needed to build a swarm.
+#
+#   Author(s): Lauren Linkous, Jonathan Lundquist
+#   Last update: October 18, 2026
+##--------------------------------------------------------------------\
+
+
+OPTION_NAMES = ('BOUNDARY', 'RN', 'HN', 'MN', 'CN', 'G')
+
+
+class swarm_config:
+    # arguments should take the form:
+    # swarm_config(int, int, int, int, int, int)
+    #
+    # BOUNDARY: int. 1 = random, 2 = reflecting, 3 = absorbing, 4 = invisible
+    # RN: int. Total number of roosters
+    # HN: int. Total number of hens
+    # MN: int. Number of mother hens in total hens
+    # CN: int. Total number of chicks
+    # G: int. Reorganize groups every G steps
+
+    def __init__(self, BOUNDARY=1, RN=10, HN=20, MN=15, CN=20, G=70):
+        self.BOUNDARY = int(BOUNDARY)
+        self.RN = int(RN)
+        self.HN = int(HN)
+        self.MN = int(MN)
+        self.CN = int(CN)
+        self.G = int(G)
+
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in OPTION_NAMES}
+
+
+    def __repr__(self):
+        return "swarm_config(" + ", ".join(name + "=" + str(getattr(self, name))
+                                           for name in OPTION_NAMES) + ")"
+
+
+def first_value(value):
+    # DataFrame columns and the older {'RN': [10]} dict format hold the
+    # value as the first entry. Plain dicts can hold it directly
+    if isinstance(value, (str, bytes)) or not hasattr(value, '__len__'):
+        return value
+    if hasattr(value, 'iloc'):
+        return value.iloc[0]
+    return value[0]
+
+
+def read_options(opt_df):
+    # returns a swarm_config from a swarm_config, a dict (of values or of one-entry
+    # lists), or a pandas DataFrame with one row. A dict or DataFrame must have
+    # every option and nothing else, so a misspelled name raises a KeyError
+    # instead of falling back to a default. Only swarm_config() has defaults
+    if isinstance(opt_df, swarm_config):
+        return opt_df
+    unknown = [str(name) for name in opt_df if name not in OPTION_NAMES]
+    if len(unknown) > 0:
+        raise KeyError("unknown swarm options: " + ", ".join(unknown) + \
+                       ". Options are " + ", ".join(OPTION_NAMES))
+    missing = [name for name in OPTION_NAMES if name not in opt_df]
+    if len(missing) > 0:
+        raise KeyError("missing swarm options: " + ", ".join(missing))
+    return swarm_config(**{name: first_value(opt_df[name]) for name in OPTION_NAMES})